@@ -0,0 +1,49 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Decode time per page of allocations for each available JSON decoder.
+
+Run with ``tox -e bench``.
+"""
+
+import copy
+import json
+
+import pytest
+
+from nectarallocationclient import jsonutils
+from nectarallocationclient.tests.unit.v1 import fakes
+
+
+def allocation_page(size):
+    results = []
+    for i in range(size):
+        allocation = copy.deepcopy(fakes.generic_allocation)
+        allocation['id'] = i
+        results.append(allocation)
+    page = {
+        'count': size * 10,
+        'next': 'http://nectarallocation.example.com/allocations/?page=2',
+        'previous': None,
+        'results': results,
+    }
+    return json.dumps(page).encode()
+
+
+@pytest.mark.parametrize('size', [20, 100, 1000])
+@pytest.mark.parametrize('decoder', list(jsonutils.DECODERS))
+def test_decode_allocation_page(benchmark, decoder, size):
+    content = allocation_page(size)
+    benchmark.extra_info['bytes'] = len(content)
+    body = benchmark(jsonutils.get_decoder(decoder), content)
+    assert len(body['results']) == size
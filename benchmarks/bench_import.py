@@ -0,0 +1,46 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Start up time of the OSC plugin in a fresh interpreter.
+
+Each round imports the plugin, builds a client as ``openstack`` does and
+uses a single manager, as ``openstack allocation zone list`` would.
+
+Run with ``tox -e bench``.
+"""
+
+import subprocess
+import sys
+
+STARTUP = '''
+from unittest import mock
+from nectarallocationclient.osc import plugin
+instance = mock.Mock(_api_version={'allocation': '1'})
+plugin.make_client(instance).zones
+'''
+
+
+def start():
+    subprocess.run([sys.executable, '-c', STARTUP], check=True)
+
+
+def test_baseline(benchmark):
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, '-c', 'pass'],),
+        rounds=10,
+    )
+
+
+def test_plugin_startup(benchmark):
+    benchmark.pedantic(start, rounds=10)
@@ -0,0 +1,52 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Paginated listings of allocations from the local stand-in server."""
+
+import pytest
+
+PAGE_SIZE = 20
+
+
+@pytest.mark.parametrize('pages', [1, 10, 100, 1000])
+def test_list(benchmark, serve_pages, allocation_client, pages):
+    serve_pages(pages, PAGE_SIZE)
+    result = benchmark.pedantic(
+        allocation_client.allocations.list,
+        kwargs={'pages': pages},
+        rounds=max(3, 300 // pages),
+    )
+    assert len(result) == pages * PAGE_SIZE
+
+
+@pytest.mark.parametrize('pages', [100])
+def test_list_compact(benchmark, serve_pages, allocation_client, pages):
+    serve_pages(pages, PAGE_SIZE)
+    result = benchmark.pedantic(
+        allocation_client.allocations.list,
+        kwargs={'pages': pages, 'compact': True},
+        rounds=3,
+    )
+    assert len(result) == pages * PAGE_SIZE
+
+
+@pytest.mark.parametrize('pages', [100])
+def test_list_prefetch(benchmark, serve_pages, allocation_client, pages):
+    serve_pages(pages, PAGE_SIZE)
+    allocation_client.http_client.page_prefetch = 8
+    result = benchmark.pedantic(
+        allocation_client.allocations.list,
+        kwargs={'pages': pages},
+        rounds=3,
+    )
+    assert len(result) == pages * PAGE_SIZE
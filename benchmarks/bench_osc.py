@@ -0,0 +1,48 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""``openstack allocation list`` end to end against the stand-in server.
+
+The command is run through cliff, including argument parsing and table
+formatting, with the OSC client manager replaced by a real client.
+"""
+
+import io
+from unittest import mock
+
+import pytest
+
+from nectarallocationclient.osc.v1 import allocations
+
+
+@pytest.mark.parametrize('pages', [1, 10])
+@pytest.mark.parametrize('formatter', ['table', 'value'])
+def test_allocation_list(
+    benchmark, serve_pages, allocation_client, pages, formatter
+):
+    serve_pages(pages)
+    app = mock.Mock()
+    app.client_manager.allocation = allocation_client
+
+    def run():
+        app.stdout = io.StringIO()
+        cmd = allocations.ListAllocations(app, None)
+        parser = cmd.get_parser('openstack allocation list')
+        parsed_args = parser.parse_args(
+            ['-f', formatter, '--filter', f'pages={pages}']
+        )
+        cmd.run(parsed_args)
+        return app.stdout.getvalue()
+
+    output = benchmark(run)
+    assert 'rest-test3' in output
@@ -0,0 +1,87 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Building allocations and translating their quotas, without any I/O."""
+
+from unittest import mock
+
+import pytest
+
+from nectarallocationclient.v1 import allocations
+
+from data import make_allocation
+
+SERVICES = {
+    'compute': ['cores', 'ram', 'instances'],
+    'volume': ['gigabytes'],
+    'share': ['shares', 'gigabytes', 'snapshots', 'snapshot_gigabytes'],
+    'network': ['floatingip', 'network', 'router', 'loadbalancer'],
+    'container-infra': ['clusters'],
+    'database': ['ram', 'volumes'],
+    'rating': ['budget'],
+    'nectar-reservation': ['reservation', 'days'],
+}
+
+
+def many_quotas(zones):
+    """Return the quotas of every service in ``zones`` zones."""
+    return [
+        {'zone': f'zone-{z}', 'resource': f'{st}.{name}', 'quota': 10}
+        for z in range(zones)
+        for st, names in SERVICES.items()
+        for name in names
+    ]
+
+
+@pytest.fixture
+def manager():
+    return allocations.AllocationManager(mock.Mock())
+
+
+@pytest.mark.parametrize('zones', [1, 10])
+def test_allocation_construction(benchmark, manager, zones):
+    info = make_allocation(1, many_quotas(zones))
+    allocation = benchmark(allocations.Allocation, manager, info, True)
+    assert len(allocation.quotas) == len(info['quotas'])
+
+
+@pytest.mark.parametrize('zones', [1, 10])
+@pytest.mark.parametrize('copy', ['deep', 'json', 'view'])
+def test_to_dict(benchmark, manager, zones, copy):
+    info = make_allocation(1, many_quotas(zones))
+    allocation = allocations.Allocation(manager, info, loaded=True)
+    result = benchmark(allocation.to_dict, copy=copy)
+    assert result['id'] == 1
+
+
+@pytest.mark.parametrize('service', sorted(allocations.QUOTA_HELPERS))
+def test_quota_helper(benchmark, manager, service):
+    helper = allocations.QUOTA_HELPERS[service]
+    info = make_allocation(1, many_quotas(1))
+
+    def translate():
+        # A fresh allocation each time so the parsed quotas are not reused
+        return helper(allocations.Allocation(manager, info, loaded=True))
+
+    benchmark(translate)
+
+
+def test_get_allocated_quotas(benchmark, manager):
+    infos = [make_allocation(i, many_quotas(1)) for i in range(100)]
+
+    def translate():
+        al = [allocations.Allocation(manager, i, loaded=True) for i in infos]
+        return allocations.get_allocated_quotas(al)
+
+    result = benchmark(translate)
+    assert len(result) == 100
@@ -0,0 +1,123 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""A local stand-in for the allocations API.
+
+The server runs in a thread on a loopback port and serves paginated
+``/allocations/`` listings built from the unit test fixtures, so the
+benchmarks exercise the full keystoneauth and requests stack. Page bodies
+are encoded once up front so the server adds little to the timings.
+"""
+
+from http import server
+import json
+import threading
+from urllib import parse
+
+from keystoneauth1 import session
+from keystoneauth1 import token_endpoint
+import pytest
+
+from nectarallocationclient.v1 import client
+
+from data import make_allocation
+
+
+class FakeAPI:
+    """Pre-encoded pages of allocations, ``page_size`` per page."""
+
+    def __init__(self, endpoint, pages, page_size):
+        self.pages = {}
+        count = pages * page_size
+        for page in range(1, pages + 1):
+            start = (page - 1) * page_size
+            body = {
+                'count': count,
+                'next': None,
+                'previous': None,
+                'results': [
+                    make_allocation(i) for i in range(start, start + page_size)
+                ],
+            }
+            if page < pages:
+                body['next'] = (
+                    f'{endpoint}/allocations/?pages={pages}&page={page + 1}'
+                )
+            self.pages[page] = json.dumps(body).encode()
+
+
+class Handler(server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, which Nagle would delay
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = parse.urlsplit(self.path)
+        query = dict(parse.parse_qsl(url.query))
+        api = self.server.apis.get(int(query.get('pages', 1)))
+        page = int(query.get('page', 1))
+        if url.path != '/allocations/' or api is None or page not in api.pages:
+            self.send_error(404)
+            return
+        body = api.pages[page]
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ProjectToken(token_endpoint.Token):
+    def get_project_id(self, session, **kwargs):
+        return 'bench'
+
+
+@pytest.fixture(scope='session')
+def fake_server():
+    httpd = server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.apis = {}
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(scope='session')
+def endpoint(fake_server):
+    host, port = fake_server.server_address
+    return f'http://{host}:{port}'
+
+
+@pytest.fixture(scope='session')
+def serve_pages(fake_server, endpoint):
+    """Return a function serving ``pages`` pages at ``/allocations/``.
+
+    Listings select the number of pages with the ``pages`` query parameter.
+    """
+
+    def serve(pages, page_size=20):
+        if pages not in fake_server.apis:
+            fake_server.apis[pages] = FakeAPI(endpoint, pages, page_size)
+        return fake_server.apis[pages]
+
+    return serve
+
+
+@pytest.fixture
+def allocation_client(endpoint):
+    sess = session.Session(auth=ProjectToken(endpoint, 'token'))
+    return client.Client(session=sess)
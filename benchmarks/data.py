@@ -0,0 +1,30 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Allocation data shared by the benchmarks."""
+
+import copy
+
+from nectarallocationclient.tests.unit.v1 import fakes
+
+
+def make_allocation(allocation_id, quotas=None):
+    allocation = copy.deepcopy(fakes.generic_allocation)
+    allocation['id'] = allocation_id
+    allocation['project_id'] = f'project-{allocation_id}'
+    allocation['status_display'] = 'Approved'
+    allocation['national'] = False
+    allocation['associated_site'] = 'uom'
+    if quotas is not None:
+        allocation['quotas'] = quotas
+    return allocation
@@ -12,11 +12,24 @@
 #
 
 import abc
-import copy
+import collections
+from concurrent import futures
+import contextlib
+import copy as copy_module
+import itertools
+import logging
+import math
+import time
+import types
+from urllib import parse
 
 from requests import Response
 
 from nectarallocationclient import exceptions
+from nectarallocationclient import metrics
+
+
+LOG = logging.getLogger(__name__)
 
 
 def getid(obj):
@@ -30,6 +43,66 @@ def getid(obj):
         return obj
 
 
+def _copy_json(value):
+    """Copy the dicts and lists of JSON shaped data.
+
+    Other values are immutable in decoded JSON, so they are shared.
+    """
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+def _predict_page_urls(body, next_url, limit=None):
+    """Work out the URLs of the pages following the first one.
+
+    Only DRF page number pagination (``?page=N`` with a ``count``) can be
+    predicted; for anything else ``None`` is returned. With a ``limit``
+    only the pages needed to reach it are included.
+    """
+    results = body.get('results')
+    count = body.get('count')
+    if not results or not isinstance(count, int):
+        return None
+    scheme, netloc, path, query, fragment = parse.urlsplit(next_url)
+    query = parse.parse_qsl(query, keep_blank_values=True)
+    if ('page', '2') not in query:
+        return None
+    if limit is not None:
+        count = min(count, limit)
+    pages = math.ceil(count / len(results))
+    urls = []
+    for page in range(2, pages + 1):
+        page_query = [(k, str(page) if k == 'page' else v) for (k, v) in query]
+        urls.append(
+            parse.urlunsplit(
+                (scheme, netloc, path, parse.urlencode(page_query), fragment)
+            )
+        )
+    return urls
+
+
+class BulkResult(collections.namedtuple('BulkResult', 'item result error')):
+    """The outcome of one item of a bulk operation.
+
+    ``result`` is what the call returned and ``error`` the exception it
+    raised, if any.
+    """
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+# The outcome of base.load_all(), the number of resources loaded and the
+# IDs of those not found
+LoadResult = collections.namedtuple('LoadResult', 'loaded missing')
+
+
 class Manager:
     """Interacts with type of API
     Managers interact with a particular type of API (instances, types, etc.)
@@ -41,22 +114,123 @@ class Manager:
     def __init__(self, api):
         self.api = api
 
-    def _list(
+    def _load_filters(self, resources):
+        """Return the list() filters of the queries finding ``resources``.
+
+        Managers able to narrow a listing to particular resources override
+        this, the default is a single listing of everything.
+        """
+        return [{}]
+
+    def _list_params(self, params, limit=None, page_size=None):
+        """Add the page size to the query parameters of a listing.
+
+        An explicit ``page_size`` wins, then ``limit`` so that small
+        listings need a single request, then the API client default.
+        """
+        if page_size is None:
+            page_size = limit or getattr(self.api, 'page_size', None)
+        if page_size:
+            params = dict(params or {}, page_size=page_size)
+        return params
+
+    def _iter_pages(self, url, headers=None, params=None, limit=None):
+        """Yield ``(resp, body)`` for each page of a paginated listing.
+
+        ``next`` links are followed in a loop rather than recursively so
+        the stack depth stays constant however many pages there are.
+        When the API client has ``page_prefetch`` set, the remaining
+        pages are fetched concurrently once the first one shows how
+        many there are, up to those needed for ``limit`` items.
+        Collectors on the API client are told how many pages were
+        fetched once the listing finishes.
+        """
+        if headers is None:
+            headers = {}
+        collectors = getattr(self.api, 'collectors', ())
+        if not collectors:
+            yield from self._follow_pages(url, headers, params, limit)
+            return
+
+        start = time.perf_counter()
+        pages = 0
+        follow = self._follow_pages(url, headers, params, limit)
+        try:
+            for page in follow:
+                pages += 1
+                yield page
+        finally:
+            follow.close()
+            metric = metrics.ListMetric(
+                metrics.url_template(url), pages, time.perf_counter() - start
+            )
+            metrics.emit(collectors, 'record_list', metric)
+
+    def _follow_pages(self, url, headers, params, limit):
+        prefetch = getattr(self.api, 'page_prefetch', 0)
+        while url:
+            resp, body = self.api.get(url, headers=headers, params=params)
+            yield resp, body
+            # The next link already carries the original query string
+            params = None
+            url = body.get('next') if isinstance(body, dict) else None
+            if url and prefetch:
+                page_urls = _predict_page_urls(body, url, limit)
+                if page_urls:
+                    fetched = 0
+                    for resp, body in self._prefetch_pages(
+                        page_urls, headers, prefetch
+                    ):
+                        fetched += 1
+                        yield resp, body
+                    # Keep following next links if the collection grew,
+                    # but not if it shrank and a predicted page was gone
+                    if fetched == len(page_urls):
+                        url = body.get('next')
+                    else:
+                        url = None
+                # Only the first page is used to predict the rest
+                prefetch = 0
+
+    def _prefetch_pages(self, urls, headers, workers):
+        """Fetch ``urls`` with up to ``workers`` requests in flight.
+
+        Pages are yielded in the order given. A 404 means the collection
+        shrank since the first page was fetched, so iteration stops there.
+        """
+        urls = iter(urls)
+        pending = collections.deque()
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def submit():
+                url = next(urls, None)
+                if url is not None:
+                    pending.append(
+                        executor.submit(self.api.get, url, headers=headers)
+                    )
+
+            try:
+                for _ in range(workers):
+                    submit()
+                while pending:
+                    try:
+                        resp, body = pending.popleft().result()
+                    except exceptions.NotFound:
+                        return
+                    submit()
+                    yield resp, body
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _page_items(
         self,
-        url,
+        body,
         response_key='results',
         obj_class=None,
-        items=None,
-        headers=None,
-        params=None,
-        limit=None,
+        compact=False,
+        resp=None,
     ):
-        if items is None:
-            items = []
-        if headers is None:
-            headers = {}
-        resp, body = self.api.get(url, headers=headers, params=params)
-
         if obj_class is None:
             obj_class = self.resource_class
 
@@ -66,25 +240,101 @@ class Manager:
             data = body
 
         if all([isinstance(res, str) for res in data]):
-            new_items = data
-        else:
-            new_items = [
-                obj_class(self, res, loaded=True) for res in data if res
-            ]
-
-        items = items + new_items
-        if 'next' in body and body['next']:
-            items = self._list(
-                body['next'],
-                response_key,
-                obj_class,
-                items,
-                headers,
-                None,
-                limit,
+            return data
+        if compact:
+            page = RecordPage(resp)
+            return [page.record(res) for res in data if res]
+        return [obj_class(self, res, loaded=True) for res in data if res]
+
+    def _iter(
+        self,
+        url,
+        response_key='results',
+        obj_class=None,
+        headers=None,
+        params=None,
+        limit=None,
+        page_size=None,
+        compact=False,
+    ):
+        """Lazily yield the items of a paginated listing.
+
+        Pages are only fetched as the caller consumes the items, so the
+        first page can be processed before later ones are requested.
+        No more pages are fetched once ``limit`` items have been yielded.
+        With ``compact`` the items are :py:class:`Record` objects.
+        """
+        params = self._list_params(params, limit, page_size)
+        pages = self._iter_pages(url, headers, params, limit)
+        items = itertools.chain.from_iterable(
+            self._page_items(body, response_key, obj_class, compact, resp)
+            for resp, body in pages
+        )
+        if limit is not None:
+            items = itertools.islice(items, limit)
+        yield from items
+
+    def _list(
+        self,
+        url,
+        response_key='results',
+        obj_class=None,
+        items=None,
+        headers=None,
+        params=None,
+        limit=None,
+        page_size=None,
+        compact=False,
+    ):
+        items = [] if items is None else list(items)
+        first_resp = None
+        params = self._list_params(params, limit, page_size)
+        pages = self._iter_pages(url, headers, params, limit)
+        for resp, body in pages:
+            if first_resp is None:
+                first_resp = resp
+            items.extend(
+                self._page_items(body, response_key, obj_class, compact, resp)
             )
+            if limit is not None and len(items) >= limit:
+                pages.close()
+                del items[limit:]
+                break
+
+        return ListWithMeta(items, first_resp)
 
-        return ListWithMeta(items, resp)
+    def _bulk(self, func, items, concurrency=1, progress=None):
+        """Call ``func`` for each of ``items``, ``concurrency`` at a time.
+
+        An item failing does not stop the others, its exception is
+        returned instead. ``progress`` is called with each result, the
+        number of items done and the total as the results come in.
+
+        :returns: list of :py:class:`BulkResult` in the order of ``items``
+        """
+
+        def call(item):
+            try:
+                return BulkResult(item, func(item), None)
+            except Exception as e:
+                LOG.debug("Bulk call of %s for %s failed: %s", func, item, e)
+                return BulkResult(item, None, e)
+
+        items = list(items)
+        with contextlib.ExitStack() as stack:
+            if concurrency <= 1:
+                results = map(call, items)
+            else:
+                executor = stack.enter_context(
+                    futures.ThreadPoolExecutor(max_workers=concurrency)
+                )
+                results = executor.map(call, items)
+            done = []
+            for result in results:
+                done.append(result)
+                if progress is not None:
+                    progress(result, len(done), len(items))
+        return done
 
     def _delete(self, url, headers=None):
         if headers is None:
@@ -177,17 +427,45 @@ class Manager:
             return DictWithMeta(item, resp)
 
 
+# Django style field lookups that findall() can evaluate locally
+_LOOKUPS = {
+    'exact': lambda attr, value: attr == value,
+    'iexact': lambda attr, value: str(attr).lower() == str(value).lower(),
+    'contains': lambda attr, value: value in attr,
+    'icontains': lambda attr, value: str(value).lower() in str(attr).lower(),
+    'in': lambda attr, value: attr in value,
+    'isnull': lambda attr, value: (attr is None) == bool(value),
+}
+
+
+def _matches(obj, key, value):
+    attr, _, lookup = key.partition('__')
+    if not lookup:
+        lookup = 'exact'
+    elif lookup not in _LOOKUPS:
+        attr, lookup = key, 'exact'
+    try:
+        return _LOOKUPS[lookup](getattr(obj, attr), value)
+    except (AttributeError, TypeError):
+        return False
+
+
 class ManagerWithFind(Manager, metaclass=abc.ABCMeta):
     """Manager with additional `find()`/`findall()` methods."""
 
+    # Query parameters, including any lookup suffix, that the API can
+    # filter the listing on. Other find() and findall() arguments are
+    # matched on the Python side.
+    filter_fields = ()
+
     @abc.abstractmethod
     def list(self):
         pass
 
     def find(self, **kwargs):
         """Find a single item with attributes matching ``**kwargs``.
-        This isn't very efficient: it loads the entire list then filters on
-        the Python side.
+        The match found by :py:meth:`findall` is returned as is when it
+        is already fully loaded, otherwise it is fetched again.
         """
         matches = self.findall(**kwargs)
         num = len(matches)
@@ -197,35 +475,134 @@ class ManagerWithFind(Manager, metaclass=abc.ABCMeta):
             raise exceptions.NotFound(msg)
         elif num > 1:
             raise exceptions.NoUniqueMatch
+        elif matches[0].is_loaded():
+            return matches[0]
         else:
             return self.get(matches[0].id)
 
     def findall(self, **kwargs):
         """Find all items with attributes matching ``**kwargs``.
-        This isn't very efficient: it loads the entire list then filters on
-        the Python side.
+        Arguments listed in ``filter_fields`` are sent to the API as query
+        parameters. The rest are compared on the Python side, either for
+        equality or using a Django style lookup such as ``name__icontains``.
         """
-        found = []
-        searches = kwargs.items()
-
-        for obj in self.list():
-            try:
-                if all(
-                    getattr(obj, attr) == value for (attr, value) in searches
-                ):
-                    found.append(obj)
-            except AttributeError:
-                continue
-
-        return found
+        params = {}
+        searches = []
+        for key, value in kwargs.items():
+            value = getid(value)
+            if key in self.filter_fields:
+                params[key] = value
+            else:
+                searches.append((key, value))
+
+        return [
+            obj
+            for obj in self.list(**params)
+            if all(_matches(obj, key, value) for (key, value) in searches)
+        ]
 
 
 class BasicManager(ManagerWithFind):
-    def list(self, **kwargs):
-        return self._list(f'/{self.base_url}/', params=kwargs)
+    # Managers of rarely changing reference data set this so the client
+    # can give them a cache for list() and get() results.
+    cacheable = False
+    cache = None
+
+    def _cache_key(self, *args, **kwargs):
+        try:
+            key = (args, frozenset(kwargs.items()))
+            hash(key)
+        except TypeError:
+            # Unhashable filter values, e.g. lists, bypass the cache
+            return None
+        return key
+
+    def _cached(self, key, func):
+        if self.cache is None or key is None:
+            return func()
+        result = self.cache.get(key)
+        if result is None:
+            result = func()
+            self.cache.set(key, result)
+        return self._copy_cached(result)
+
+    def _copy_cached(self, result):
+        """Return a copy of a cached result that callers are free to change.
+
+        Resources are built again from a copy of their attributes. Records
+        are read-only, so they are shared.
+        """
+        if isinstance(result, Resource):
+            return type(result)(
+                result.manager,
+                _copy_json(result._info),
+                loaded=result.is_loaded(),
+                resp=result.request_ids,
+            )
+        if isinstance(result, ListWithMeta):
+            return ListWithMeta(
+                [self._copy_cached(item) for item in result],
+                result.request_ids,
+            )
+        return result
+
+    def invalidate(self):
+        """Drop everything cached by this manager."""
+        if self.cache is not None:
+            self.cache.invalidate()
+
+    def list(self, limit=None, page_size=None, compact=False, **kwargs):
+        return self._cached(
+            self._cache_key('list', limit, page_size, compact, **kwargs),
+            lambda: self._list(
+                f'/{self.base_url}/',
+                params=kwargs,
+                limit=limit,
+                page_size=page_size,
+                compact=compact,
+            ),
+        )
+
+    def iter_list(self, limit=None, page_size=None, compact=False, **kwargs):
+        return self._iter(
+            f'/{self.base_url}/',
+            params=kwargs,
+            limit=limit,
+            page_size=page_size,
+            compact=compact,
+        )
 
     def get(self, resource_id):
-        return self._get(f'/{self.base_url}/{resource_id}/')
+        return self._cached(
+            self._cache_key('get', resource_id),
+            lambda: self._get(f'/{self.base_url}/{resource_id}/'),
+        )
+
+    @contextlib.contextmanager
+    def _invalidating(self):
+        # Invalidate after the write too, so results listed while it was
+        # in flight, e.g. by another thread, are not kept for the TTL.
+        self.invalidate()
+        try:
+            yield
+        finally:
+            self.invalidate()
+
+    def _create(self, *args, **kwargs):
+        with self._invalidating():
+            return super()._create(*args, **kwargs)
+
+    def _update(self, *args, **kwargs):
+        with self._invalidating():
+            return super()._update(*args, **kwargs)
+
+    def _update_all(self, *args, **kwargs):
+        with self._invalidating():
+            return super()._update_all(*args, **kwargs)
+
+    def _delete(self, *args, **kwargs):
+        with self._invalidating():
+            return super()._delete(*args, **kwargs)
 
 
 class RequestIdMixin:
@@ -301,6 +678,13 @@ class Resource(RequestIdMixin):
         if k not in self.__dict__:
             # NOTE(RuiChen): disallow lazy-loading if already loaded once
             if not self.is_loaded():
+                hook = getattr(
+                    getattr(self.manager, 'api', None),
+                    'record_lazy_load',
+                    None,
+                )
+                if hook is not None:
+                    hook(self, k)
                 self.get()
                 return self.__getattr__(k)
             raise AttributeError(k)
@@ -343,8 +727,166 @@ class Resource(RequestIdMixin):
     def set_loaded(self, val):
         self._loaded = val
 
-    def to_dict(self):
-        return copy.deepcopy(self._info)
+    def to_dict(self, copy='deep'):
+        """Return the resource's attributes as a dict.
+
+        :param string copy: ``deep`` for a ``copy.deepcopy``, ``json`` for
+            a much faster copy of the dicts and lists only, which is all
+            API responses contain, or ``view`` for a read-only view of the
+            attributes without copying anything
+        """
+        if copy == 'deep':
+            return copy_module.deepcopy(self._info)
+        if copy == 'json':
+            return _copy_json(self._info)
+        if copy == 'view':
+            return types.MappingProxyType(self._info)
+        raise ValueError(f"Unknown copy mode {copy}")
+
+
+def load_all(resources, **filters):
+    """Load every resource not yet loaded with a few listings per manager.
+
+    Looping over resources built from partial data and reading a missing
+    attribute fetches each of them in turn. Loading them all first takes
+    the listings of each manager narrowed to those resources, where the
+    manager supports it, instead. ``filters`` narrow them further.
+
+    :param resources: Resource objects, possibly of different managers
+    :returns: :py:data:`LoadResult` with the number of resources loaded
+              and the IDs of those not found by the listings
+    """
+    pending = collections.defaultdict(dict)
+    for resource in resources:
+        if resource.is_loaded():
+            continue
+        # Read the ID from _info so it cannot trigger a lazy load itself
+        resource_id = resource._info.get('id')
+        if resource_id is not None:
+            pending[resource.manager].setdefault(resource_id, []).append(
+                resource
+            )
+
+    count = 0
+    missing = []
+    for manager, by_id in pending.items():
+        queries = manager._load_filters(
+            [r for found in by_id.values() for r in found]
+        )
+        for query in queries:
+            if not by_id:
+                break
+            listing = manager.list(**dict(query, **filters))
+            for new in listing:
+                for resource in by_id.pop(new._info.get('id'), []):
+                    resource._add_details(new._info)
+                    resource.set_loaded(True)
+                    resource.append_request_ids(listing.request_ids)
+                    count += 1
+        if by_id:
+            LOG.warning(
+                "Could not load %s %s",
+                manager.resource_class.__name__,
+                ', '.join(str(i) for i in by_id),
+            )
+            missing.extend(by_id)
+    return LoadResult(count, missing)
+
+
+class RecordPage(RequestIdMixin):
+    """Request IDs and field layouts shared by the records of one page."""
+
+    def __init__(self, resp):
+        self._layouts = {}
+        self.request_ids_setup()
+        self.append_request_ids(resp)
+
+    def record(self, info):
+        keys = tuple(info)
+        fields = self._layouts.get(keys)
+        if fields is None:
+            fields = {k: i for i, k in enumerate(keys)}
+            self._layouts[keys] = fields
+        values = tuple(self._value(v) for v in info.values())
+        return Record(fields, values, self)
+
+    def _value(self, value):
+        if isinstance(value, dict):
+            return self.record(value)
+        if isinstance(value, list):
+            return tuple(self._value(v) for v in value)
+        return value
+
+
+class Record:
+    """A compact, read-only alternative to :py:class:`Resource`.
+
+    Records are used for ``compact`` list results. Field names are stored
+    once per page rather than once per object, and the request IDs are
+    shared with every other record from the same page. Nested objects
+    are records too and nested lists become tuples. Unlike a Resource a
+    record is never lazy-loaded and has no resource specific methods.
+    """
+
+    __slots__ = ('_fields', '_values', '_page')
+
+    def __init__(self, fields, values, page):
+        self._fields = fields
+        self._values = values
+        self._page = page
+
+    def __getattr__(self, k):
+        if k.startswith('_'):
+            raise AttributeError(k)
+        try:
+            return self._values[self._fields[k]]
+        except KeyError:
+            raise AttributeError(k)
+
+    def __repr__(self):
+        info = ", ".join(
+            f"{k}={self._values[i]}" for k, i in sorted(self._fields.items())
+        )
+        return f"<Record {info}>"
+
+    def __eq__(self, other):
+        if not isinstance(other, Record):
+            return False
+        return self.to_dict() == other.to_dict()
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    @property
+    def request_ids(self):
+        return self._page.request_ids
+
+    @property
+    def x_openstack_request_ids(self):
+        return self._page.x_openstack_request_ids
+
+    def to_dict(self, copy='deep'):
+        """Return the record's fields as a dict.
+
+        The dict is always built afresh, so ``copy`` is only accepted for
+        compatibility with :py:meth:`Resource.to_dict`, apart from
+        ``view`` returning it read-only.
+        """
+        if copy not in ('deep', 'json', 'view'):
+            raise ValueError(f"Unknown copy mode {copy}")
+        data = {k: _plain(self._values[i]) for k, i in self._fields.items()}
+        if copy == 'view':
+            return types.MappingProxyType(data)
+        return data
+
+
+def _plain(value):
+    """Turn a record value back into the JSON shaped data it came from."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_plain(v) for v in value]
+    return value
 
 
 class ListWithMeta(list, RequestIdMixin):
@@ -11,11 +11,22 @@
 #   under the License.
 #
 
+import logging
+import time
+from urllib import parse
+
 from keystoneauth1 import adapter
 from oslo_utils import importutils
+import requests
 
 import nectarallocationclient
+from nectarallocationclient import diskcache
 from nectarallocationclient import exceptions
+from nectarallocationclient import jsonutils
+from nectarallocationclient import metrics
+
+
+LOG = logging.getLogger(__name__)
 
 
 def Client(version, *args, **kwargs):
@@ -29,18 +40,200 @@ class SessionClient(adapter.Adapter):
     client_name = 'python-nectarallocationclient'
     client_version = nectarallocationclient.__version__
 
-    def request(self, url, method, **kwargs):
+    # Number of list pages to fetch concurrently, 0 fetches them serially
+    page_prefetch = 0
+    # Default number of items per list page, None uses the server default
+    page_size = None
+
+    # Callable decoding response bodies
+    json_decoder = staticmethod(jsonutils.loads)
+    # Store of GET responses and their validators used to send conditional
+    # requests, None disables them
+    response_store = None
+    # diskcache.DiskCache keeping reference data between processes, None
+    # disables it
+    disk_cache = None
+    # Number of GET requests answered from the disk cache
+    disk_cache_hits = 0
+
+    # RetryPolicy for failed requests, None never retries
+    retry_policy = None
+    # Number of requests sent again by the retry policy
+    retries = 0
+    # metrics.Collector objects told about every request
+    collectors = ()
+    # Raise instead of fetching a resource again for a missing attribute
+    strict_lazy_load = False
+    # Number of resources fetched again for a missing attribute
+    lazy_loads = 0
+    # Number of project ID lookups made and the seconds spent on them
+    project_id_lookups = 0
+    project_id_lookup_time = 0.0
+
+    _project_id = None
+    _project_id_auth_ref = None
+
+    def _get_auth_ref(self):
+        auth = getattr(self, 'auth', None) or self.session.auth
+        return getattr(auth, 'auth_ref', None)
+
+    def _get_project_id(self):
+        """Return the project ID, resolving it once per authentication.
+
+        The ID is remembered until the auth plugin invalidates or
+        re-authenticates, which replaces its ``auth_ref``. Plugins without
+        an ``auth_ref`` are asked on every request.
+        """
+        auth_ref = self._get_auth_ref()
+        if auth_ref is not None and auth_ref is self._project_id_auth_ref:
+            return self._project_id
+
+        start = time.perf_counter()
         project_id = self.get_project_id()
-        kwargs.setdefault('headers', kwargs.get('headers', {}))
-        kwargs['headers']['X-PROJECT-ID'] = project_id
+        self.project_id_lookups += 1
+        self.project_id_lookup_time += time.perf_counter() - start
+
+        self._project_id = project_id
+        self._project_id_auth_ref = self._get_auth_ref()
+        return project_id
+
+    def request(self, url, method, **kwargs):
+        project_id = self._get_project_id()
+        # NOTE: Callers such as paged listings pass the same headers for
+        # several requests, possibly from several threads, so they are
+        # copied before the per request headers are added.
+        headers = dict(kwargs.get('headers') or {})
+        headers['X-PROJECT-ID'] = project_id
+        kwargs['headers'] = headers
+
+        disk_key = None
+        if self.disk_cache is not None and method == 'GET':
+            disk_key = self.disk_cache.key(
+                self.get_endpoint(), project_id, url, kwargs.get('params')
+            )
+            content = None
+            if disk_key is not None:
+                content = self.disk_cache.get(disk_key)
+            if content is not None:
+                self.disk_cache_hits += 1
+                resp = requests.Response()
+                resp.status_code = 200
+                resp.url = url
+                resp._content = content
+                return resp, self.json_decoder(content)
+
+        store_key = stored = None
+        if method == 'GET' and self.response_store is not None:
+            store_key = self._store_key(url, project_id, kwargs.get('params'))
+            stored = self.response_store.get(store_key)
+            if stored is not None:
+                etag, last_modified, _ = stored
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+
         # NOTE(sorrison): The standard call raises errors from
         # keystoneauth, where we need to raise the nectarallocation errors.
         raise_exc = kwargs.pop('raise_exc', True)
-        resp = super().request(url, method, raise_exc=False, **kwargs)
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            resp = super().request(url, method, raise_exc=False, **kwargs)
+            policy = self.retry_policy
+            if policy is None or not policy.should_retry(
+                method, resp.status_code, attempt
+            ):
+                break
+            delay = policy.delay(attempt, resp.headers.get('Retry-After'))
+            if delay is None:
+                LOG.debug(
+                    "%s %s returned %s with a Retry-After of %s, not retrying",
+                    method,
+                    url,
+                    resp.status_code,
+                    resp.headers.get('Retry-After'),
+                )
+                break
+            LOG.debug(
+                "%s %s returned %s, retrying in %.2fs",
+                method,
+                url,
+                resp.status_code,
+                delay,
+            )
+            self.retries += 1
+            attempt += 1
+            policy.sleep(delay)
+        latency = time.perf_counter() - start
 
+        try:
+            body = self._decode(
+                resp, url, method, raise_exc, store_key, stored
+            )
+            if self.disk_cache is not None:
+                self._update_disk_cache(resp, url, method, disk_key)
+        finally:
+            if self.collectors:
+                metric = metrics.RequestMetric(
+                    method,
+                    metrics.url_template(url),
+                    resp.status_code,
+                    latency,
+                    time.perf_counter() - start - latency,
+                    len(resp.content),
+                    attempt,
+                )
+                metrics.emit(self.collectors, 'record_request', metric)
+        return resp, body
+
+    def _decode(self, resp, url, method, raise_exc, store_key, stored):
+        if resp.status_code == 304:
+            if stored is None:
+                # Nothing was sent to validate, so there is no body to use
+                raise exceptions.from_response(resp, url, method)
+            # NOTE: The stored content is decoded for every response so
+            # callers never share a mutable body.
+            return self.json_decoder(stored[2])
         if raise_exc and resp.status_code >= 400:
             raise exceptions.from_response(resp, url, method)
         # NOTE(sorrison): Deletes don't return json body
         if resp.status_code == 204:
-            return resp, '{}'
-        return resp, resp.json()
+            return '{}'
+        if store_key is not None and resp.status_code == 200:
+            etag = resp.headers.get('ETag')
+            last_modified = resp.headers.get('Last-Modified')
+            if etag or last_modified:
+                self.response_store.set(
+                    store_key, (etag, last_modified, resp.content)
+                )
+        return self.json_decoder(resp.content)
+
+    def _update_disk_cache(self, resp, url, method, disk_key):
+        if method == 'GET':
+            if disk_key is not None and resp.status_code == 200:
+                self.disk_cache.set(disk_key, resp.content)
+        elif resp.status_code < 400:
+            self.disk_cache.invalidate(diskcache.collection(url))
+
+    def record_lazy_load(self, resource, attribute):
+        """Called before ``resource`` is fetched again for ``attribute``.
+
+        :raises: LazyLoadError in strict lazy load mode
+        """
+        name = type(resource).__name__
+        if self.strict_lazy_load:
+            raise exceptions.LazyLoadError(
+                f"{name} has no attribute '{attribute}' loaded and lazy "
+                "loading is disabled"
+            )
+        LOG.debug("Lazy loading %s for attribute %s", name, attribute)
+        self.lazy_loads += 1
+        if self.collectors:
+            metric = metrics.LazyLoadMetric(name, attribute)
+            metrics.emit(self.collectors, 'record_lazy_load', metric)
+
+    @staticmethod
+    def _store_key(url, project_id, params):
+        query = parse.urlencode(sorted((params or {}).items()), doseq=True)
+        return (project_id, url, query)
@@ -0,0 +1,129 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Response cache on disk shared between processes.
+
+Each CLI command runs in a new process, so the in-memory caches start
+empty every time. This cache keeps the GET responses of the rarely
+changing reference collections in files instead::
+
+    client = Client(session=sess, disk_cache=diskcache.DiskCache())
+
+Only collections with a TTL are cached. Entries expire after their
+collection's TTL and a successful write to a collection drops all of
+its entries.
+"""
+
+import glob
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from urllib import parse
+
+from nectarallocationclient import metrics
+
+
+LOG = logging.getLogger(__name__)
+
+# Seconds the responses of each collection stay valid
+DEFAULT_TTLS = {
+    'zones': 24 * 3600,
+    'sites': 24 * 3600,
+    'resources': 3600,
+    'service-types': 3600,
+}
+
+
+def default_path():
+    """Return ``$XDG_CACHE_HOME/nectarallocationclient``."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'
+    )
+    return os.path.join(base, 'nectarallocationclient')
+
+
+def collection(url):
+    """Return the collection a request URL belongs to."""
+    named = [s for s in metrics.url_template(url).split('/') if s]
+    return named[0] if named else None
+
+
+class DiskCache:
+    """Stores response bodies in files named after a hash of their key.
+
+    Files are written to a temporary file and renamed into place so
+    concurrent processes never read a partial entry. Failing to read or
+    write the cache is logged and otherwise ignored.
+
+    :param string path: cache directory, defaults to :py:func:`default_path`
+    :param dict ttls: seconds responses of each collection stay valid,
+                      collections not included are not cached
+    :param timer: callable returning the current time in seconds
+    """
+
+    def __init__(self, path=None, ttls=None, timer=time.time):
+        self.path = path or default_path()
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.timer = timer
+
+    def key(self, endpoint, project_id, url, params=None):
+        """Return the key of a GET, or None if it is not cacheable."""
+        name = collection(url)
+        if name not in self.ttls:
+            return None
+        query = parse.urlencode(sorted((params or {}).items()), doseq=True)
+        digest = hashlib.sha256(
+            '\n'.join([endpoint or '', project_id or '', url, query]).encode()
+        ).hexdigest()
+        return name, digest
+
+    def _filename(self, key):
+        return os.path.join(self.path, '{}-{}'.format(*key))
+
+    def get(self, key, default=None):
+        filename = self._filename(key)
+        try:
+            if os.path.getmtime(filename) + self.ttls[key[0]] <= self.timer():
+                return default
+            with open(filename, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return default
+        except OSError as e:
+            LOG.debug("Failed to read cache entry %s: %s", filename, e)
+            return default
+
+    def set(self, key, content):
+        try:
+            os.makedirs(self.path, mode=0o700, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path, prefix='.tmp-')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(content)
+                os.replace(tmp, self._filename(key))
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            LOG.debug("Failed to write cache entry to %s: %s", self.path, e)
+
+    def invalidate(self, name=None):
+        """Drop the entries of collection ``name``, or every entry."""
+        pattern = f'{glob.escape(name)}-*' if name else '*'
+        for filename in glob.glob(os.path.join(self.path, pattern)):
+            try:
+                os.unlink(filename)
+            except OSError as e:
+                LOG.debug("Failed to remove cache entry %s: %s", filename, e)
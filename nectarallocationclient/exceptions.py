@@ -130,6 +130,10 @@ class NoUniqueMatch(Exception):
     pass
 
 
+class LazyLoadError(AttributeError):
+    """An attribute was missing and lazy loading is disabled."""
+
+
 class NotImplemented(ClientException):
     """HTTP 501 - Not Implemented:
     the server does not support this operation.
@@ -0,0 +1,121 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Export allocations and their quotas as NDJSON or CSV.
+
+Usage::
+
+    with gzip.open('allocations.csv.gz', 'wt', newline='') as f:
+        export.export(client.allocations, f, format='csv', status='A')
+
+Rows are written as each page of allocations arrives, so memory use does
+not grow with the number of allocations. Each quota becomes a column
+named after its resource, e.g. ``compute.cores``, holding the total of
+the quota over all zones.
+"""
+
+import csv
+import json
+import logging
+
+from nectarallocationclient.v1 import resources
+
+
+LOG = logging.getLogger(__name__)
+
+FORMATS = ('ndjson', 'csv')
+
+# Allocation fields included in every row
+FIELDS = (
+    'id',
+    'parent_request',
+    'project_id',
+    'project_name',
+    'status',
+    'submit_date',
+    'start_date',
+    'end_date',
+    'modified_time',
+    'contact_email',
+    'approver_email',
+    'allocation_home',
+    'associated_site',
+    'national',
+)
+
+
+def flatten(allocation, fields=FIELDS):
+    """Return an allocation dict as a row with a column per quota."""
+    row = {field: allocation.get(field) for field in fields}
+    for quota in allocation.get('quotas') or ():
+        name = quota['resource']
+        if name in row:
+            row[name] += quota['quota']
+        else:
+            row[name] = quota['quota']
+    return row
+
+
+def quota_columns(api):
+    """Return the quota column of every resource, in a stable order."""
+    return sorted(
+        f'{r.service_type}.{r.quota_name}'
+        for r in resources.ResourceManager(api).list()
+    )
+
+
+def export(
+    manager,
+    fp,
+    format='ndjson',
+    fields=FIELDS,
+    columns=None,
+    page_size=None,
+    **filters,
+):
+    """Write the allocations matching ``filters`` to text file ``fp``.
+
+    :param manager: the client's AllocationManager
+    :param fp: text file to write to, opened with ``newline=''`` for CSV
+    :param string format: ``ndjson`` for a JSON object per line or ``csv``
+    :param fields: allocation fields to include
+    :param columns: quota columns of a CSV export, defaults to one per
+                    resource of the allocation system. NDJSON rows include
+                    all quotas.
+    :param int page_size: allocations to fetch per request
+    :returns: the number of allocations written
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown export format {format}")
+
+    if format == 'csv':
+        if columns is None:
+            columns = quota_columns(manager.api)
+        writer = csv.DictWriter(
+            fp, fieldnames=list(fields) + list(columns), extrasaction='ignore'
+        )
+        writer.writeheader()
+        write = writer.writerow
+    else:
+
+        def write(row):
+            fp.write(json.dumps(row) + '\n')
+
+    count = 0
+    for allocation in manager.iter_list(
+        page_size=page_size, compact=True, **filters
+    ):
+        write(flatten(allocation.to_dict(), fields))
+        count += 1
+    LOG.debug("Exported %s allocations", count)
+    return count
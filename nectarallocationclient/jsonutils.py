@@ -0,0 +1,50 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""JSON decoding of API responses.
+
+orjson or ujson are used when installed as they decode large pages of
+allocations considerably faster than the standard library.
+"""
+
+import json
+
+from oslo_utils import importutils
+
+orjson = importutils.try_import('orjson')
+ujson = importutils.try_import('ujson')
+
+# Available decoders, fastest first
+DECODERS = {}
+if orjson:
+    DECODERS['orjson'] = orjson.loads
+if ujson:
+    DECODERS['ujson'] = ujson.loads
+DECODERS['json'] = json.loads
+
+
+def get_decoder(name=None):
+    """Return a callable decoding JSON from bytes or str.
+
+    :param string name: one of :py:data:`DECODERS`, defaults to the
+                        fastest one available
+    """
+    if name is None:
+        return next(iter(DECODERS.values()))
+    try:
+        return DECODERS[name]
+    except KeyError:
+        raise ValueError(f"JSON decoder {name} is not available")
+
+
+loads = get_decoder()
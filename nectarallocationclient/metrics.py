@@ -0,0 +1,172 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Request instrumentation.
+
+Collectors are registered with ``Client(collectors=[...])`` and are told
+about every HTTP request and every paginated listing::
+
+    class SlowRequests(metrics.Collector):
+        def record_request(self, metric):
+            if metric.latency > 1:
+                LOG.warning("Slow request %s", metric)
+
+Latencies are in seconds and sizes are in bytes.
+"""
+
+import collections
+import logging
+import re
+import threading
+from urllib import parse
+
+
+LOG = logging.getLogger(__name__)
+
+# An HTTP request, including any retries of it
+RequestMetric = collections.namedtuple(
+    'RequestMetric',
+    [
+        'method',
+        'url_template',
+        'status',
+        'latency',
+        'decode_time',
+        'size',
+        'retries',
+    ],
+)
+
+# A paginated listing, latency covers the time the pages were consumed over
+ListMetric = collections.namedtuple(
+    'ListMetric', ['url_template', 'pages', 'latency']
+)
+
+# An attribute access that fetched a resource again to find the attribute
+LazyLoadMetric = collections.namedtuple(
+    'LazyLoadMetric', ['resource', 'attribute']
+)
+
+_VERSION_RE = re.compile(r'^v\d+(\.\d+)?$')
+
+
+def url_template(url):
+    """Return the path of ``url`` with the resource ID replaced by ``{id}``.
+
+    API paths are ``/<collection>/<id>/<action>/``. The query string and,
+    for absolute URLs such as next links, the endpoint up to the API
+    version are dropped.
+    """
+    parts = parse.urlsplit(url)
+    segments = parts.path.split('/')
+    if parts.netloc:
+        for i, segment in enumerate(segments):
+            if _VERSION_RE.match(segment):
+                segments = [''] + segments[i + 1 :]
+                break
+    named = [s for s in segments if s]
+    if len(named) > 1:
+        segments[segments.index(named[1])] = '{id}'
+    return '/'.join(segments)
+
+
+def emit(collectors, method, metric):
+    """Pass ``metric`` to ``method`` of each collector.
+
+    A failing collector is logged rather than failing the request.
+    """
+    for collector in collectors:
+        try:
+            getattr(collector, method)(metric)
+        except Exception:
+            LOG.warning("Metrics collector %s failed", collector, exc_info=1)
+
+
+class Collector:
+    """Base class for collectors, all the methods do nothing."""
+
+    def record_request(self, metric):
+        """Called with a :py:data:`RequestMetric` after each request."""
+
+    def record_list(self, metric):
+        """Called with a :py:data:`ListMetric` when a listing finishes."""
+
+    def record_lazy_load(self, metric):
+        """Called with a :py:data:`LazyLoadMetric` before a lazy load."""
+
+
+class AggregateCollector(Collector):
+    """Keeps running totals per method and URL template.
+
+    The totals suit exporting as Prometheus counters.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = collections.defaultdict(collections.Counter)
+        self.lists = collections.defaultdict(collections.Counter)
+        self.lazy_loads = collections.Counter()
+
+    def record_request(self, metric):
+        with self._lock:
+            totals = self.requests[(metric.method, metric.url_template)]
+            totals['count'] += 1
+            totals['latency'] += metric.latency
+            totals['decode_time'] += metric.decode_time
+            totals['size'] += metric.size
+            totals['retries'] += metric.retries
+            if metric.status >= 400:
+                totals['errors'] += 1
+
+    def record_list(self, metric):
+        with self._lock:
+            totals = self.lists[metric.url_template]
+            totals['count'] += 1
+            totals['pages'] += metric.pages
+            totals['latency'] += metric.latency
+
+    def record_lazy_load(self, metric):
+        with self._lock:
+            self.lazy_loads[(metric.resource, metric.attribute)] += 1
+
+
+class StatsdCollector(Collector):
+    """Sends metrics with a statsd client.
+
+    :param statsd: object with the ``timing(name, ms)`` and
+                   ``incr(name, count)`` methods of a statsd client
+    :param string prefix: prefix of the metric names
+    """
+
+    def __init__(self, statsd, prefix='nectarallocation'):
+        self.statsd = statsd
+        self.prefix = prefix
+
+    def _name(self, *parts):
+        name = '.'.join(parts)
+        name = re.sub(r'[{}]', '', name.replace('/', '.'))
+        return re.sub(r'\.+', '.', f'{self.prefix}.{name}').strip('.')
+
+    def record_request(self, metric):
+        name = self._name(metric.method, metric.url_template)
+        self.statsd.timing(f'{name}.{metric.status}', metric.latency * 1000)
+        self.statsd.incr(f'{name}.bytes', metric.size)
+        if metric.retries:
+            self.statsd.incr(f'{name}.retries', metric.retries)
+
+    def record_list(self, metric):
+        name = self._name('list', metric.url_template)
+        self.statsd.incr(f'{name}.pages', metric.pages)
+
+    def record_lazy_load(self, metric):
+        self.statsd.incr(self._name('lazy_load', metric.resource))
@@ -0,0 +1,241 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Local SQLite mirror of allocations, their quotas and reference data.
+
+Usage::
+
+    m = mirror.Mirror(client, '/var/lib/reports/allocations.db')
+    m.sync()
+    for allocation in m.allocations(status='A', site='uom'):
+        print(allocation.project_name, allocation.get_allocated_nova_quota())
+
+Only allocations modified since the previous sync are fetched. The
+reference tables are small, so they are refreshed in full on every sync.
+"""
+
+import json
+import logging
+import sqlite3
+
+from nectarallocationclient.v1 import allocations as allocations_v1
+
+
+LOG = logging.getLogger(__name__)
+
+HIGH_WATER_MARK = 'allocations_modified_time'
+
+# Reference tables, mapping the client manager to the field identifying
+# each of its resources
+REFERENCE_MANAGERS = {
+    'zones': 'name',
+    'sites': 'name',
+    'resources': 'id',
+    'service_types': 'catalog_name',
+}
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS allocations (
+    id INTEGER PRIMARY KEY,
+    status TEXT,
+    associated_site TEXT,
+    project_id TEXT,
+    project_name TEXT,
+    parent_request INTEGER,
+    modified_time TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS allocations_status ON allocations (status);
+CREATE INDEX IF NOT EXISTS allocations_site ON allocations (associated_site);
+CREATE INDEX IF NOT EXISTS allocations_project_name
+    ON allocations (project_name);
+CREATE INDEX IF NOT EXISTS allocations_parent_request
+    ON allocations (parent_request);
+CREATE TABLE IF NOT EXISTS quotas (
+    allocation INTEGER NOT NULL,
+    resource TEXT,
+    zone TEXT,
+    quota,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS quotas_allocation ON quotas (allocation);
+CREATE INDEX IF NOT EXISTS quotas_resource ON quotas (resource);
+CREATE TABLE IF NOT EXISTS reference (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+'''
+
+
+class Mirror:
+    """Keeps a local SQLite copy of the allocation system.
+
+    :param client: a :py:class:`nectarallocationclient.v1.client.Client`
+    :param string path: database file, defaults to an in-memory database
+    """
+
+    def __init__(self, client, path=':memory:'):
+        self.client = client
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    @property
+    def high_water_mark(self):
+        """The newest ``modified_time`` of any mirrored allocation."""
+        row = self.db.execute(
+            'SELECT value FROM sync_state WHERE name = ?', (HIGH_WATER_MARK,)
+        ).fetchone()
+        return row['value'] if row else None
+
+    def sync(self, reference=True):
+        """Pull allocations modified since the last sync.
+
+        Pages are written as they arrive so memory use does not grow
+        with the number of allocations. Allocations modified at exactly
+        the high-water mark are fetched again, as others may share it.
+
+        :param bool reference: also refresh the reference tables
+        :returns: the number of allocations written
+        """
+        high_water_mark = self.high_water_mark
+        filters = {}
+        if high_water_mark:
+            filters['modified_time__gte'] = high_water_mark
+
+        count = 0
+        with self.db:
+            for allocation in self.client.allocations.iter_list(**filters):
+                info = allocation._info
+                self._store_allocation(info)
+                modified_time = info.get('modified_time')
+                if modified_time and (
+                    high_water_mark is None or modified_time > high_water_mark
+                ):
+                    high_water_mark = modified_time
+                count += 1
+            if high_water_mark:
+                self.db.execute(
+                    'INSERT OR REPLACE INTO sync_state VALUES (?, ?)',
+                    (HIGH_WATER_MARK, high_water_mark),
+                )
+            if reference:
+                self._sync_reference()
+        LOG.debug("Mirrored %s allocations up to %s", count, high_water_mark)
+        return count
+
+    def _store_allocation(self, info):
+        self.db.execute(
+            'INSERT OR REPLACE INTO allocations VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                info['id'],
+                info.get('status'),
+                info.get('associated_site'),
+                info.get('project_id'),
+                info.get('project_name'),
+                info.get('parent_request'),
+                info.get('modified_time'),
+                json.dumps(info),
+            ),
+        )
+        self.db.execute(
+            'DELETE FROM quotas WHERE allocation = ?', (info['id'],)
+        )
+        self.db.executemany(
+            'INSERT INTO quotas VALUES (?, ?, ?, ?, ?)',
+            (
+                (
+                    info['id'],
+                    quota.get('resource'),
+                    quota.get('zone'),
+                    quota.get('quota'),
+                    json.dumps(quota),
+                )
+                for quota in info.get('quotas') or []
+            ),
+        )
+
+    def _sync_reference(self):
+        for kind, key in REFERENCE_MANAGERS.items():
+            manager = getattr(self.client, kind)
+            self.db.execute('DELETE FROM reference WHERE kind = ?', (kind,))
+            self.db.executemany(
+                'INSERT INTO reference VALUES (?, ?, ?)',
+                (
+                    (kind, str(r._info[key]), json.dumps(r._info))
+                    for r in manager.iter_list()
+                ),
+            )
+
+    def allocations(
+        self, status=None, site=None, project_name=None, parent_request=None
+    ):
+        """Return mirrored allocations matching all of the given filters.
+
+        The results are full Allocation objects so the quota helpers work
+        on them as they do on allocations fetched from the API.
+        """
+        filters = {
+            'status': status,
+            'associated_site': site,
+            'project_name': project_name,
+            'parent_request': parent_request,
+        }
+        clauses = [f'{k} = ?' for k, v in filters.items() if v is not None]
+        values = [v for v in filters.values() if v is not None]
+        query = 'SELECT data FROM allocations'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        query += ' ORDER BY id'
+        return [
+            allocations_v1.Allocation(
+                self.client.allocations, json.loads(row['data']), loaded=True
+            )
+            for row in self.db.execute(query, values)
+        ]
+
+    def quotas(self, resource=None, allocation=None):
+        """Return the mirrored quotas as dicts including their allocation."""
+        filters = {'resource': resource, 'allocation': allocation}
+        clauses = [f'{k} = ?' for k, v in filters.items() if v is not None]
+        values = [v for v in filters.values() if v is not None]
+        query = 'SELECT allocation, data FROM quotas'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        return [
+            dict(json.loads(row['data']), allocation=row['allocation'])
+            for row in self.db.execute(query, values)
+        ]
+
+    def reference(self, kind):
+        """Return the mirrored ``zones``, ``sites``, ``resources`` or
+        ``service_types`` as dicts.
+        """
+        if kind not in REFERENCE_MANAGERS:
+            raise ValueError(f"Unknown reference table {kind}")
+        return [
+            json.loads(row['data'])
+            for row in self.db.execute(
+                'SELECT data FROM reference WHERE kind = ? ORDER BY key',
+                (kind,),
+            )
+        ]
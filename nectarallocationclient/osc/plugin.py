@@ -12,6 +12,9 @@
 #
 
 from osc_lib import utils
+from oslo_utils import strutils
+
+from nectarallocationclient import diskcache
 
 
 DEFAULT_API_VERSION = '1'
@@ -37,9 +40,17 @@ def make_client(instance):
         API_NAME, instance._api_version[API_NAME], API_VERSIONS
     )
 
-    endpoint = instance._cli_options.allocation_endpoint
+    options = instance._cli_options
+    endpoint = options.allocation_endpoint
+    disk_cache = None
+    if strutils.bool_from_string(
+        getattr(options, 'allocation_cache', False)
+    ) and not getattr(options, 'allocation_no_cache', False):
+        disk_cache = diskcache.DiskCache()
     client = plugin_client(
-        session=instance.session, endpoint_override=endpoint
+        session=instance.session,
+        endpoint_override=endpoint,
+        disk_cache=disk_cache,
     )
     return client
 
@@ -67,4 +78,16 @@ def build_option_parser(parser):
         metavar='<allocation-endpoint>',
         help='Nectar Allocation API endpoint',
     )
+    parser.add_argument(
+        '--os-allocation-cache',
+        action='store_true',
+        default=utils.env('OS_ALLOCATION_CACHE'),
+        help='Cache zones, sites, resources and service types on disk '
+        'between commands (Env: OS_ALLOCATION_CACHE)',
+    )
+    parser.add_argument(
+        '--os-allocation-no-cache',
+        action='store_true',
+        help='Do not use the disk cache, even if it is enabled',
+    )
     return parser
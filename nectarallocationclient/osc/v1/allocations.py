@@ -11,12 +11,16 @@
 #   under the License.
 #
 
+import contextlib
+import gzip
 import logging
+import sys
 
 from osc_lib.command import command
 from osc_lib import utils as osc_utils
 
 from nectarallocationclient import exceptions
+from nectarallocationclient import export
 from nectarallocationclient.osc import utils
 from nectarallocationclient.osc.v1 import organisations
 
@@ -50,18 +54,38 @@ def get_allocation(client, id_or_name):
         raise exceptions.CommandError(str(ex))
 
 
+def read_ids(path):
+    """Read allocation IDs, one per line, from a file or ``-`` for stdin.
+
+    Blank lines and lines starting with ``#`` are skipped.
+    """
+    if path == '-':
+        lines = sys.stdin.readlines()
+    else:
+        with open(path) as f:
+            lines = f.readlines()
+    return [
+        line.strip()
+        for line in lines
+        if line.strip() and not line.lstrip().startswith('#')
+    ]
+
+
 class AllocationShowOne(command.ShowOne):
+    allocation_nargs = None
+
     def get_parser(self, prog_name):
         parser = super().get_parser(prog_name)
         parser.add_argument(
             'allocation',
             metavar='<allocation>',
+            nargs=self.allocation_nargs,
             help=('ID or Name of allocation'),
         )
         return parser
 
     def _show_allocation(self, allocation):
-        allocation_dict = allocation.to_dict()
+        allocation_dict = allocation.to_dict(copy='json')
         # Don't display quotas in allocation show
         allocation_dict.pop('quotas')
         return self.dict2columns(allocation_dict)
@@ -79,12 +103,78 @@ class ShowAllocation(AllocationShowOne):
         return self._show_allocation(allocation)
 
 
-class ApproveAllocation(AllocationShowOne):
+class AllocationBulkAction(AllocationShowOne):
+    """An allocation action that can also be applied to many allocations.
+
+    With ``--bulk`` the result of each allocation ID is shown instead of
+    the allocation.
+    """
+
+    allocation_nargs = '?'
+    # Name of the AllocationManager bulk method
+    bulk_method = None
+    # Error to exit with once the outcome of each allocation is shown
+    failure = None
+
+    def get_parser(self, prog_name):
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            '--bulk',
+            metavar='<file>',
+            help=(
+                'File of allocation IDs, one per line, to act on instead '
+                'of <allocation>. Use - to read from stdin'
+            ),
+        )
+        parser.add_argument(
+            '--concurrency',
+            metavar='<concurrency>',
+            type=int,
+            default=8,
+            help='Number of requests to send at once with --bulk (Default: 8)',
+        )
+        return parser
+
+    def take_action(self, parsed_args):
+        if (parsed_args.allocation is None) == (parsed_args.bulk is None):
+            raise exceptions.CommandError(
+                "Specify either <allocation> or --bulk"
+            )
+        if parsed_args.bulk is None:
+            return self.take_single_action(parsed_args)
+
+        self.log.debug('take_action(%s)', parsed_args)
+        client = self.app.client_manager.allocation
+        ids = read_ids(parsed_args.bulk)
+        results = getattr(client.allocations, self.bulk_method)(
+            ids, concurrency=parsed_args.concurrency
+        )
+        failed = 0
+        outcome = {}
+        for result in results:
+            if result.ok:
+                outcome[result.item] = 'OK'
+            else:
+                failed += 1
+                outcome[result.item] = f"Error: {result.error}"
+        if failed:
+            self.failure = f"{failed} of {len(ids)} allocations failed"
+        return self.dict2columns(outcome)
+
+    def run(self, parsed_args):
+        result = super().run(parsed_args)
+        if self.failure:
+            raise exceptions.CommandError(self.failure)
+        return result
+
+
+class ApproveAllocation(AllocationBulkAction):
     """Approve allocation"""
 
     log = logging.getLogger(__name__ + '.ApproveAllocation')
+    bulk_method = 'bulk_approve'
 
-    def take_action(self, parsed_args):
+    def take_single_action(self, parsed_args):
         self.log.debug('take_action(%s)', parsed_args)
         client = self.app.client_manager.allocation
         allocation = get_allocation(client, parsed_args.allocation)
@@ -92,12 +182,13 @@ class ApproveAllocation(AllocationShowOne):
         return self._show_allocation(allocation)
 
 
-class AmendAllocation(AllocationShowOne):
+class AmendAllocation(AllocationBulkAction):
     """Amend allocation"""
 
     log = logging.getLogger(__name__ + '.AmendAllocation')
+    bulk_method = 'bulk_amend'
 
-    def take_action(self, parsed_args):
+    def take_single_action(self, parsed_args):
         self.log.debug('take_action(%s)', parsed_args)
         client = self.app.client_manager.allocation
         allocation = get_allocation(client, parsed_args.allocation)
@@ -105,12 +196,13 @@ class AmendAllocation(AllocationShowOne):
         return self._show_allocation(allocation)
 
 
-class DeleteAllocation(AllocationShowOne):
+class DeleteAllocation(AllocationBulkAction):
     """Delete allocation"""
 
     log = logging.getLogger(__name__ + '.DeleteAllocation')
+    bulk_method = 'bulk_delete'
 
-    def take_action(self, parsed_args):
+    def take_single_action(self, parsed_args):
         self.log.debug('take_action(%s)', parsed_args)
         client = self.app.client_manager.allocation
         allocation = get_allocation(client, parsed_args.allocation)
@@ -134,6 +226,12 @@ class ListAllocations(command.Lister):
                 "multiple times"
             ),
         )
+        parser.add_argument(
+            '--limit',
+            metavar='<limit>',
+            type=int,
+            help='Maximum number of allocations to list',
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -143,7 +241,9 @@ class ListAllocations(command.Lister):
         filters = {'parent_request__isnull': True}
         filters.update(utils.format_parameters(parsed_args.filter))
 
-        allocations = client.allocations.list(**filters)
+        allocations = client.allocations.list(
+            limit=parsed_args.limit, **filters
+        )
         columns = [
             'id',
             'project_name',
@@ -198,6 +298,67 @@ class AllocationHistory(command.Lister):
         )
 
 
+class ExportAllocations(command.Command):
+    """Export allocations and their quotas as NDJSON or CSV."""
+
+    log = logging.getLogger(__name__ + '.ExportAllocations')
+
+    def get_parser(self, prog_name):
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            '--format',
+            metavar='<format>',
+            choices=export.FORMATS,
+            default='ndjson',
+            help='Output format, ndjson or csv (Default: ndjson)',
+        )
+        parser.add_argument(
+            '--output',
+            metavar='<file>',
+            help='File to write to (Default: stdout)',
+        )
+        parser.add_argument(
+            '--gzip',
+            action='store_true',
+            help='Compress the output with gzip',
+        )
+        parser.add_argument(
+            '--filter',
+            metavar='<filter>',
+            action='append',
+            help=(
+                "Filter allocation, use key=value, can be specified "
+                "multiple times"
+            ),
+        )
+        return parser
+
+    def _open(self, parsed_args):
+        if parsed_args.gzip:
+            return gzip.open(
+                parsed_args.output or sys.stdout.buffer,
+                'wt',
+                encoding='utf-8',
+                newline='',
+            )
+        if parsed_args.output:
+            return open(parsed_args.output, 'w', encoding='utf-8', newline='')
+        return contextlib.nullcontext(sys.stdout)
+
+    def take_action(self, parsed_args):
+        self.log.debug('take_action(%s)', parsed_args)
+
+        client = self.app.client_manager.allocation
+        filters = {'parent_request__isnull': True}
+        filters.update(utils.format_parameters(parsed_args.filter))
+
+        with self._open(parsed_args) as fp:
+            count = export.export(
+                client.allocations, fp, format=parsed_args.format, **filters
+            )
+        self.log.info("Exported %s allocations", count)
+
+
 class CreateAllocation(AllocationShowOne):
     """Create an allocation."""
 
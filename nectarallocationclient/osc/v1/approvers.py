@@ -54,7 +54,7 @@ class ShowApprover(command.ShowOne):
         except exceptions.NotFound as ex:
             raise exceptions.CommandError(str(ex))
 
-        return self.dict2columns(approver.to_dict())
+        return self.dict2columns(approver.to_dict(copy='json'))
 
 
 class CreateApprover(command.ShowOne):
@@ -91,7 +91,7 @@ class CreateApprover(command.ShowOne):
             display_name=parsed_args.display_name,
             sites=parsed_args.site,
         )
-        return self.dict2columns(approver.to_dict())
+        return self.dict2columns(approver.to_dict(copy='json'))
 
 
 class SetApprover(command.ShowOne):
@@ -118,4 +118,4 @@ class SetApprover(command.ShowOne):
         client = self.app.client_manager.allocation
         fields = utils.format_parameters(parsed_args.property)
         approver = client.approvers.update(parsed_args.id, **fields)
-        return self.dict2columns(approver.to_dict())
+        return self.dict2columns(approver.to_dict(copy='json'))
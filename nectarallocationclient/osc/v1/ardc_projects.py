@@ -78,7 +78,7 @@ class ShowARDCProject(command.ShowOne):
         except exceptions.NotFound as ex:
             raise exceptions.CommandError(str(ex))
 
-        return self.dict2columns(project.to_dict())
+        return self.dict2columns(project.to_dict(copy='json'))
 
 
 class CreateARDCProject(command.ShowOne):
@@ -134,7 +134,7 @@ class CreateARDCProject(command.ShowOne):
             rank=parsed_args.rank,
             explain=parsed_args.explain,
         )
-        return self.dict2columns(project.to_dict())
+        return self.dict2columns(project.to_dict(copy='json'))
 
 
 class SetARDCProject(command.ShowOne):
@@ -161,4 +161,4 @@ class SetARDCProject(command.ShowOne):
         client = self.app.client_manager.allocation
         fields = utils.format_parameters(parsed_args.property)
         project = client.ardc_projects.update(parsed_args.id, **fields)
-        return self.dict2columns(project.to_dict())
+        return self.dict2columns(project.to_dict(copy='json'))
@@ -79,7 +79,7 @@ class ShowBundle(command.ShowOne):
         except exceptions.NotFound as ex:
             raise exceptions.CommandError(str(ex))
 
-        bundle_dict = bundle.to_dict()
+        bundle_dict = bundle.to_dict(copy='json')
         # Don't display quotas in bundle show
         bundle_dict.pop('quotas')
         return self.dict2columns(bundle_dict)
@@ -120,7 +120,7 @@ class CreateBundle(command.ShowOne):
             order=parsed_args.order,
             su_per_year=parsed_args.su_per_year,
         )
-        bundle_dict = bundle.to_dict()
+        bundle_dict = bundle.to_dict(copy='json')
         bundle_dict.pop('quotas', None)
         return self.dict2columns(bundle_dict)
 
@@ -149,6 +149,6 @@ class SetBundle(command.ShowOne):
         client = self.app.client_manager.allocation
         fields = utils.format_parameters(parsed_args.property)
         bundle = client.bundles.update(parsed_args.id, **fields)
-        bundle_dict = bundle.to_dict()
+        bundle_dict = bundle.to_dict(copy='json')
         bundle_dict.pop('quotas', None)
         return self.dict2columns(bundle_dict)
@@ -79,7 +79,7 @@ class ShowChiefInvestigator(command.ShowOne):
         except exceptions.NotFound as ex:
             raise exceptions.CommandError(str(ex))
 
-        return self.dict2columns(ci.to_dict())
+        return self.dict2columns(ci.to_dict(copy='json'))
 
 
 class CreateChiefInvestigator(command.ShowOne):
@@ -136,7 +136,7 @@ class CreateChiefInvestigator(command.ShowOne):
             primary_organisation=parsed_args.primary_organisation,
             additional_researchers=parsed_args.additional_researchers,
         )
-        return self.dict2columns(ci.to_dict())
+        return self.dict2columns(ci.to_dict(copy='json'))
 
 
 class DeleteChiefInvestigator(command.Command):
@@ -183,4 +183,4 @@ class SetChiefInvestigator(command.ShowOne):
         client = self.app.client_manager.allocation
         fields = utils.format_parameters(parsed_args.property)
         ci = client.chiefinvestigators.update(parsed_args.id, **fields)
-        return self.dict2columns(ci.to_dict())
+        return self.dict2columns(ci.to_dict(copy='json'))
@@ -60,7 +60,7 @@ class ShowFacility(command.ShowOne):
         except exceptions.NotFound as ex:
             raise exceptions.CommandError(str(ex))
 
-        return self.dict2columns(site.to_dict())
+        return self.dict2columns(site.to_dict(copy='json'))
 
 
 class CreateFacility(command.ShowOne):
@@ -89,7 +89,7 @@ class CreateFacility(command.ShowOne):
             name=parsed_args.name,
             short_name=parsed_args.short_name,
         )
-        return self.dict2columns(facility.to_dict())
+        return self.dict2columns(facility.to_dict(copy='json'))
 
 
 class SetFacility(command.ShowOne):
@@ -118,4 +118,4 @@ class SetFacility(command.ShowOne):
         client = self.app.client_manager.allocation
         fields = utils.format_parameters(parsed_args.property)
         facility = client.facilities.update(parsed_args.id, **fields)
-        return self.dict2columns(facility.to_dict())
+        return self.dict2columns(facility.to_dict(copy='json'))
@@ -72,7 +72,7 @@ class ShowGrant(command.ShowOne):
         except exceptions.NotFound as ex:
             raise exceptions.CommandError(str(ex))
 
-        return self.dict2columns(grant.to_dict())
+        return self.dict2columns(grant.to_dict(copy='json'))
 
 
 class CreateGrant(command.ShowOne):
@@ -147,7 +147,7 @@ class CreateGrant(command.ShowOne):
             last_year_funded=parsed_args.last_year_funded,
             total_funding=parsed_args.total_funding,
         )
-        return self.dict2columns(grant.to_dict())
+        return self.dict2columns(grant.to_dict(copy='json'))
 
 
 class DeleteGrant(command.Command):
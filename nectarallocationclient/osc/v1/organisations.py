@@ -45,7 +45,7 @@ def get_organisation(client, arg):
 
 
 def show_organisation(cmd, organisation):
-    organisation_dict = organisation.to_dict()
+    organisation_dict = organisation.to_dict(copy='json')
     return cmd.dict2columns(organisation_dict)
 
 
@@ -64,7 +64,7 @@ class ShowPublication(command.ShowOne):
         except exceptions.NotFound as ex:
             raise exceptions.CommandError(str(ex))
 
-        return self.dict2columns(publication.to_dict())
+        return self.dict2columns(publication.to_dict(copy='json'))
 
 
 class CreatePublication(command.ShowOne):
@@ -125,7 +125,7 @@ class CreatePublication(command.ShowOne):
             publication=parsed_args.publication,
             doi=parsed_args.doi,
         )
-        return self.dict2columns(publication.to_dict())
+        return self.dict2columns(publication.to_dict(copy='json'))
 
 
 class DeletePublication(command.Command):
@@ -11,7 +11,9 @@
 #   under the License.
 #
 
+import json
 import logging
+import sys
 
 from osc_lib.command import command
 from osc_lib import utils as osc_utils
@@ -37,8 +39,11 @@ class ListQuotas(command.Lister):
         client = self.app.client_manager.allocation
         allocation = get_allocation(client, parsed_args.allocation)
         quotas = client.quotas.list(allocation=allocation.id)
+        resources = client.resources.index()
         for q in quotas:
-            resource = client.resources.get(q.resource)
+            resource = resources.get(q.resource)
+            if resource is None:
+                resource = client.resources.get(q.resource)
             q.resource = resource.name
             q.service = resource.service_type
             q.unit = resource.unit
@@ -85,18 +90,7 @@ class QuotaHistory(command.Lister):
         client = self.app.client_manager.allocation
         allocation = get_allocation(client, parsed_args.allocation)
         resource = client.resources.get(parsed_args.resource_id)
-        allocations = client.allocations.list(parent_request=allocation.id)
-        allocations.insert(0, allocation)
-
-        quota_history = []
-        for allocation in allocations:
-            quotas = client.quotas.list(
-                allocation=allocation.id, resource=resource.id
-            )
-            if quotas:
-                quotas[0].allocation_id = allocation.id
-                quotas[0].modified_time = allocation.modified_time
-                quota_history.append(quotas[0])
+        quota_history = client.quotas.history(allocation, resource)
         columns = [
             'allocation_id',
             'modified_time',
@@ -150,7 +144,71 @@ class CreateQuota(command.ShowOne):
             quota=parsed_args.quota,
             requested_quota=parsed_args.requested_quota,
         )
-        return self.dict2columns(quota.to_dict())
+        return self.dict2columns(quota.to_dict(copy='json'))
+
+
+class BulkCreateQuotas(command.Lister):
+    """Create quotas from a JSON manifest.
+
+    The manifest is a list of quotas, each with the allocation, resource,
+    zone, quota and optional requested_quota arguments of quota create.
+    It can also be an object with a default "allocation" and a list of
+    "quotas". Resources are given by ID or as <service_type>.<quota_name>.
+    """
+
+    log = logging.getLogger(__name__ + '.BulkCreateQuotas')
+    # Error to exit with once the outcome of each quota is shown
+    failure = None
+
+    def get_parser(self, prog_name):
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            'manifest',
+            metavar='<manifest>',
+            help='JSON manifest file, use - to read from stdin',
+        )
+        parser.add_argument(
+            '--concurrency',
+            metavar='<concurrency>',
+            type=int,
+            default=8,
+            help='Number of quotas to create at once (Default: 8)',
+        )
+        return parser
+
+    def take_action(self, parsed_args):
+        self.log.debug('take_action(%s)', parsed_args)
+        client = self.app.client_manager.allocation
+        if parsed_args.manifest == '-':
+            manifest = json.load(sys.stdin)
+        else:
+            with open(parsed_args.manifest) as f:
+                manifest = json.load(f)
+
+        def progress(result, done, total):
+            self.log.info("Created %s of %s quotas", done, total)
+
+        results = client.quotas.bulk_create(
+            manifest, concurrency=parsed_args.concurrency, progress=progress
+        )
+        failed = [r for r in results if not r.ok]
+        if failed:
+            self.failure = f"{len(failed)} of {len(results)} quotas failed"
+        columns = ['allocation', 'resource', 'zone', 'quota', 'status']
+        return (
+            columns,
+            (
+                [r.item.get(c) for c in columns[:-1]]
+                + ['Created' if r.ok else f"Error: {r.error}"]
+                for r in results
+            ),
+        )
+
+    def run(self, parsed_args):
+        result = super().run(parsed_args)
+        if self.failure:
+            raise exceptions.CommandError(self.failure)
+        return result
 
 
 class DeleteQuota(command.Command):
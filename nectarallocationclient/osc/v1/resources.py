@@ -45,7 +45,7 @@ class ShowResource(command.ShowOne):
         except exceptions.NotFound as ex:
             raise exceptions.CommandError(str(ex))
 
-        return self.dict2columns(resource.to_dict())
+        return self.dict2columns(resource.to_dict(copy='json'))
 
 
 class ListResources(command.Lister):
@@ -123,7 +123,7 @@ class CreateResource(command.ShowOne):
             resource_type=parsed_args.resource_type,
             help_text=parsed_args.help_text,
         )
-        return self.dict2columns(resource.to_dict())
+        return self.dict2columns(resource.to_dict(copy='json'))
 
 
 class SetResource(command.ShowOne):
@@ -152,4 +152,4 @@ class SetResource(command.ShowOne):
         client = self.app.client_manager.allocation
         fields = osc_utils.format_parameters(parsed_args.property)
         resource = client.resources.update(parsed_args.resource_id, **fields)
-        return self.dict2columns(resource.to_dict())
+        return self.dict2columns(resource.to_dict(copy='json'))
@@ -45,7 +45,7 @@ class ShowServiceType(command.ShowOne):
         except exceptions.NotFound as ex:
             raise exceptions.CommandError(str(ex))
 
-        return self.dict2columns(service_type.to_dict())
+        return self.dict2columns(service_type.to_dict(copy='json'))
 
 
 class ListServiceTypes(command.Lister):
@@ -121,7 +121,7 @@ class CreateServiceType(command.ShowOne):
             experimental=parsed_args.experimental,
             location_specific=parsed_args.location_specific,
         )
-        return self.dict2columns(service_type.to_dict())
+        return self.dict2columns(service_type.to_dict(copy='json'))
 
 
 class SetServiceType(command.ShowOne):
@@ -154,4 +154,4 @@ class SetServiceType(command.ShowOne):
         service_type = client.service_types.update(
             parsed_args.service_type, **fields
         )
-        return self.dict2columns(service_type.to_dict())
+        return self.dict2columns(service_type.to_dict(copy='json'))
@@ -58,7 +58,7 @@ class ShowSite(command.ShowOne):
         except exceptions.NotFound as ex:
             raise exceptions.CommandError(str(ex))
 
-        return self.dict2columns(site.to_dict())
+        return self.dict2columns(site.to_dict(copy='json'))
 
 
 class CreateSite(command.ShowOne):
@@ -89,7 +89,7 @@ class CreateSite(command.ShowOne):
             display_name=parsed_args.display_name,
             enabled=not parsed_args.disabled,
         )
-        return self.dict2columns(site.to_dict())
+        return self.dict2columns(site.to_dict(copy='json'))
 
 
 class SetSite(command.ShowOne):
@@ -116,4 +116,4 @@ class SetSite(command.ShowOne):
         client = self.app.client_manager.allocation
         fields = utils.format_parameters(parsed_args.property)
         site = client.sites.update(parsed_args.id, **fields)
-        return self.dict2columns(site.to_dict())
+        return self.dict2columns(site.to_dict(copy='json'))
@@ -45,7 +45,7 @@ class ShowZone(command.ShowOne):
         except exceptions.NotFound as ex:
             raise exceptions.CommandError(str(ex))
 
-        return self.dict2columns(zone.to_dict())
+        return self.dict2columns(zone.to_dict(copy='json'))
 
 
 class ListZones(command.Lister):
@@ -110,7 +110,7 @@ class CreateZone(command.ShowOne):
             display_name=parsed_args.display_name,
             enabled=not parsed_args.disabled,
         )
-        return self.dict2columns(zone.to_dict())
+        return self.dict2columns(zone.to_dict(copy='json'))
 
 
 class SetZone(command.ShowOne):
@@ -137,4 +137,4 @@ class SetZone(command.ShowOne):
         client = self.app.client_manager.allocation
         fields = osc_utils.format_parameters(parsed_args.property)
         zone = client.zones.update(parsed_args.zone, **fields)
-        return self.dict2columns(zone.to_dict())
+        return self.dict2columns(zone.to_dict(copy='json'))
@@ -0,0 +1,152 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Work out the quota changes needed to match allocations.
+
+Usage::
+
+    applied = {
+        'f3a6...': {'nova': {'cores': 2, 'instances': 2, 'ram': 8}},
+    }
+    plan = reconcile.plan(client.allocations.list(status='A'), applied)
+    print(json.dumps(plan.to_dict(), indent=2))
+    for change in plan:
+        apply_quota(
+            change.project_id, change.service, change.resource, change.desired
+        )
+
+The desired quotas come from the ``Allocation.get_allocated_*_quota``
+helpers, keyed by the service names of
+:py:data:`nectarallocationclient.v1.allocations.QUOTA_HELPERS`.
+"""
+
+import collections
+import logging
+
+from nectarallocationclient.v1 import allocations as allocations_v1
+
+
+LOG = logging.getLogger(__name__)
+
+Change = collections.namedtuple(
+    'Change',
+    [
+        'project_id',
+        'allocation_id',
+        'service',
+        'resource',
+        'current',
+        'desired',
+    ],
+)
+
+
+class Plan:
+    """The changes needed to bring applied quotas in line with allocations.
+
+    Only resources whose applied value differs from the allocated one are
+    included. Resources that are applied but not allocated are left alone.
+    """
+
+    def __init__(self, changes=None):
+        self.changes = list(changes or [])
+
+    def __iter__(self):
+        return iter(self.changes)
+
+    def __len__(self):
+        return len(self.changes)
+
+    def __repr__(self):
+        return f"<Plan {len(self.changes)} changes>"
+
+    def by_project(self):
+        """Return the changes as ``{project_id: {service: {resource:
+        desired}}}``, ready to apply one call per project and service.
+        """
+        projects = {}
+        for change in self.changes:
+            services = projects.setdefault(change.project_id, {})
+            resources = services.setdefault(change.service, {})
+            resources[change.resource] = change.desired
+        return projects
+
+    def to_dict(self):
+        return {'changes': [c._asdict() for c in self.changes]}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(Change(**c) for c in data.get('changes', []))
+
+
+def plan(allocations, applied, services=None, errors=None):
+    """Compare the quotas of allocations with those currently applied.
+
+    Allocations without a project are skipped. The work is linear in the
+    number of allocations and allocated resources.
+
+    :param allocations: iterable of Allocation objects, one per project
+    :param applied: ``{project_id: {service: {resource: value}}}`` of the
+                    quotas currently applied, missing entries are treated
+                    as unset
+    :param services: service names to reconcile, defaults to all
+    :param dict errors: if given, an allocation whose quotas fail to
+                        translate is left out of the plan and its exception
+                        is added to ``errors`` under its ID, instead of the
+                        exception being raised
+    :returns: :py:class:`Plan`
+    """
+    if services is None:
+        services = list(allocations_v1.QUOTA_HELPERS)
+    helpers = [
+        (service, allocations_v1.QUOTA_HELPERS[service])
+        for service in services
+    ]
+
+    changes = []
+    for allocation in allocations:
+        project_id = allocation.project_id
+        if not project_id:
+            LOG.debug("Skipping allocation %s without project", allocation.id)
+            continue
+        current_services = applied.get(project_id) or {}
+        try:
+            desired_services = [
+                (service, helper(allocation)) for service, helper in helpers
+            ]
+        except Exception as e:
+            if errors is None:
+                raise
+            LOG.warning(
+                "Failed to translate quotas of allocation %s: %s",
+                allocation.id,
+                e,
+            )
+            errors[allocation.id] = e
+            continue
+        for service, desired_resources in desired_services:
+            current = current_services.get(service) or {}
+            for resource, desired in desired_resources.items():
+                value = current.get(resource)
+                if value != desired:
+                    changes.append(
+                        Change(
+                            project_id,
+                            allocation.id,
+                            service,
+                            resource,
+                            value,
+                            desired,
+                        )
+                    )
+    return Plan(changes)
@@ -0,0 +1,99 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+from email import utils as email_utils
+import random
+import time
+
+
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+# Over limit, rate limit and transient server errors
+RETRY_STATUSES = frozenset([413, 429, 500, 502, 503, 504])
+
+
+def parse_retry_after(value):
+    """Return the seconds to wait from a Retry-After header value.
+
+    Both delay-seconds and HTTP-date forms are accepted, None is returned
+    for a missing or unparseable value.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email_utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is sent again.
+
+    Delays grow exponentially from ``backoff`` with full jitter, up to
+    ``max_backoff``. A delay the server asks for with Retry-After is
+    waited in full, unless it is longer than ``max_retry_after`` in which
+    case the request is not retried and its error is raised.
+
+    :param int max_retries: maximum number of retries of one request
+    :param float backoff: base delay in seconds
+    :param float max_backoff: maximum backoff delay in seconds
+    :param float max_retry_after: longest Retry-After delay in seconds to
+                                  wait for
+    :param statuses: HTTP status codes to retry
+    :param methods: HTTP methods that are safe to retry
+    :param sleep: callable used to wait, for use in tests
+    """
+
+    def __init__(
+        self,
+        max_retries=3,
+        backoff=0.5,
+        max_backoff=30.0,
+        max_retry_after=300.0,
+        statuses=RETRY_STATUSES,
+        methods=IDEMPOTENT_METHODS,
+        sleep=time.sleep,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.sleep = sleep
+
+    def should_retry(self, method, status_code, attempt):
+        return (
+            attempt < self.max_retries
+            and status_code in self.statuses
+            and method.upper() in self.methods
+        )
+
+    def delay(self, attempt, retry_after=None):
+        """Return the seconds to wait before retry number ``attempt + 1``.
+
+        None is returned if the server asks for a longer delay than
+        ``max_retry_after``, meaning the request should not be retried.
+        """
+        retry_after = parse_retry_after(retry_after)
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            return retry_after
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff * 2**attempt)
+        )
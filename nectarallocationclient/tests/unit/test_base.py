@@ -0,0 +1,303 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import operator
+import threading
+import types
+from unittest import mock
+from urllib import parse
+
+from nectarallocationclient import base
+from nectarallocationclient import exceptions
+from nectarallocationclient import metrics
+
+from nectarallocationclient.tests.unit import utils
+
+
+class Thing(base.Resource):
+    pass
+
+
+class ThingManager(base.BasicManager):
+    base_url = 'things'
+    resource_class = Thing
+
+
+class FakePagedAPI:
+    """Serves ``/things/`` as DRF style pages of ``page_size`` items."""
+
+    page_size = None
+
+    def __init__(self, total, page_size=2, page_prefetch=0, count=None):
+        self.total = total
+        self.server_page_size = page_size
+        self.page_prefetch = page_prefetch
+        self.count = total if count is None else count
+        self.calls = []
+        self.threads = set()
+
+    def get(self, url, headers=None, params=None):
+        self.calls.append((url, params))
+        self.threads.add(threading.current_thread().name)
+        query = dict(parse.parse_qsl(parse.urlsplit(url).query))
+        query.update(params or {})
+        page = int(query.get('page', 1))
+        page_size = int(query.get('page_size', self.server_page_size))
+        start = (page - 1) * page_size
+        if start >= self.total:
+            raise exceptions.NotFound()
+        end = min(start + page_size, self.total)
+        body = {
+            'count': self.count,
+            'next': None,
+            'previous': None,
+            'results': [{'id': i} for i in range(start, end)],
+        }
+        if end < self.total:
+            query['page'] = page + 1
+            body['next'] = f'/things/?{parse.urlencode(query)}'
+        resp = types.SimpleNamespace(headers={})
+        return resp, body
+
+
+class ManagerPaginationTest(utils.TestCase):
+    def test_list_follows_next(self):
+        api = FakePagedAPI(total=5)
+        things = ThingManager(api).list(name='foo')
+        self.assertEqual(list(range(5)), [t.id for t in things])
+        self.assertIsInstance(things, base.ListWithMeta)
+        self.assertEqual(
+            [
+                ('/things/', {'name': 'foo'}),
+                ('/things/?name=foo&page=2', None),
+                ('/things/?name=foo&page=3', None),
+            ],
+            api.calls,
+        )
+
+    def test_list_many_pages_constant_stack(self):
+        # Deeper than the default recursion limit
+        api = FakePagedAPI(total=3000, page_size=1)
+        things = ThingManager(api).list()
+        self.assertEqual(3000, len(things))
+
+    def test_iter_list_is_lazy(self):
+        api = FakePagedAPI(total=5)
+        things = ThingManager(api).iter_list()
+        self.assertEqual([], api.calls)
+
+        first = next(things)
+        self.assertIsInstance(first, Thing)
+        self.assertEqual(0, first.id)
+        self.assertEqual(1, len(api.calls))
+
+        self.assertEqual([1, 2, 3, 4], [t.id for t in things])
+        self.assertEqual(3, len(api.calls))
+
+    def test_list_prefetch_keeps_order(self):
+        api = FakePagedAPI(total=25, page_prefetch=4)
+        things = ThingManager(api).list()
+        self.assertEqual(list(range(25)), [t.id for t in things])
+        self.assertEqual(13, len(api.calls))
+        self.assertEqual(
+            {f'/things/?page={n}' for n in range(2, 14)},
+            {url for (url, params) in api.calls[1:]},
+        )
+        self.assertGreater(len(api.threads), 1)
+
+    def test_list_prefetch_collection_shrank(self):
+        api = FakePagedAPI(total=5, page_prefetch=2, count=9)
+        things = ThingManager(api).list()
+        self.assertEqual(list(range(5)), [t.id for t in things])
+
+    def test_list_prefetch_collection_grew(self):
+        api = FakePagedAPI(total=7, page_prefetch=2, count=5)
+        things = ThingManager(api).list()
+        self.assertEqual(list(range(7)), [t.id for t in things])
+
+    def test_list_limit_stops_paging(self):
+        api = FakePagedAPI(total=10)
+        things = ThingManager(api).list(limit=3, page_size=2)
+        self.assertEqual([0, 1, 2], [t.id for t in things])
+        self.assertEqual(
+            [
+                ('/things/', {'page_size': 2}),
+                ('/things/?page_size=2&page=2', None),
+            ],
+            api.calls,
+        )
+
+    def test_list_limit_sets_page_size(self):
+        api = FakePagedAPI(total=10)
+        things = ThingManager(api).list(limit=4, name='foo')
+        self.assertEqual([0, 1, 2, 3], [t.id for t in things])
+        self.assertEqual(
+            [('/things/', {'name': 'foo', 'page_size': 4})], api.calls
+        )
+
+    def test_list_default_page_size(self):
+        api = FakePagedAPI(total=10)
+        api.page_size = 5
+        things = ThingManager(api).list()
+        self.assertEqual(10, len(things))
+        self.assertEqual(('/things/', {'page_size': 5}), api.calls[0])
+        self.assertEqual(2, len(api.calls))
+
+    def test_iter_list_limit(self):
+        api = FakePagedAPI(total=10, page_prefetch=4)
+        things = ThingManager(api).iter_list(limit=5, page_size=2)
+        self.assertEqual([0, 1, 2, 3, 4], [t.id for t in things])
+        self.assertEqual(3, len(api.calls))
+
+    def test_list_metrics(self):
+        api = FakePagedAPI(total=5)
+        api.collectors = [mock.Mock()]
+        ThingManager(api).list()
+        metric = api.collectors[0].record_list.call_args[0][0]
+        self.assertIsInstance(metric, metrics.ListMetric)
+        self.assertEqual('/things/', metric.url_template)
+        self.assertEqual(3, metric.pages)
+
+    def test_iter_list_limit_metrics(self):
+        api = FakePagedAPI(total=10)
+        api.collectors = [mock.Mock()]
+        things = ThingManager(api).iter_list(limit=3, page_size=2)
+        self.assertEqual(3, len(list(things)))
+        metric = api.collectors[0].record_list.call_args[0][0]
+        self.assertEqual(2, metric.pages)
+
+
+class ResourceTest(utils.TestCase):
+    def thing(self):
+        info = {'id': 1, 'tags': ['a'], 'nested': {'quotas': [{'q': 1}]}}
+        return Thing(None, info, loaded=True)
+
+    def test_to_dict_copies(self):
+        for mode in ('deep', 'json'):
+            thing = self.thing()
+            d = thing.to_dict(copy=mode)
+            self.assertEqual(thing._info, d)
+            d['tags'].append('b')
+            d['nested']['quotas'][0]['q'] = 2
+            self.assertEqual(['a'], thing.tags)
+            self.assertEqual(1, thing._info['nested']['quotas'][0]['q'])
+
+    def test_to_dict_default_deep(self):
+        thing = self.thing()
+        thing._info['obj'] = [object()]
+        self.assertIsNot(thing._info['obj'][0], thing.to_dict()['obj'][0])
+
+    def test_to_dict_view(self):
+        thing = self.thing()
+        view = thing.to_dict(copy='view')
+        self.assertEqual(thing._info, dict(view))
+        self.assertRaises(TypeError, operator.setitem, view, 'id', 2)
+        thing._info['id'] = 3
+        self.assertEqual(3, view['id'])
+
+    def test_to_dict_unknown(self):
+        self.assertRaises(ValueError, self.thing().to_dict, copy='shallow')
+
+
+class LoadAllTest(utils.TestCase):
+    def test_load_all_one_listing(self):
+        api = FakePagedAPI(total=5, page_size=10)
+        manager = ThingManager(api)
+        things = [Thing(manager, {'id': i}) for i in (1, 3, 9)]
+        loaded = Thing(manager, {'id': 2}, loaded=True)
+        self.assertEqual((2, [9]), base.load_all(things + [loaded], name='x'))
+        self.assertEqual([('/things/', {'name': 'x'})], api.calls)
+        self.assertEqual([True, True, False], [t.is_loaded() for t in things])
+
+    def test_load_all_nothing_pending(self):
+        api = FakePagedAPI(total=5)
+        things = [Thing(ThingManager(api), {'id': 1}, loaded=True)]
+        self.assertEqual((0, []), base.load_all(things))
+        self.assertEqual([], api.calls)
+
+
+class BulkTest(utils.TestCase):
+    def test_bulk_keeps_order_and_errors(self):
+        def func(item):
+            if item % 3 == 0:
+                raise exceptions.Conflict()
+            return item * 2
+
+        manager = ThingManager(FakePagedAPI(total=0))
+        results = manager._bulk(func, range(10), concurrency=4)
+        self.assertEqual(list(range(10)), [r.item for r in results])
+        for r in results:
+            if r.item % 3 == 0:
+                self.assertFalse(r.ok)
+                self.assertIsInstance(r.error, exceptions.Conflict)
+            else:
+                self.assertTrue(r.ok)
+                self.assertEqual(r.item * 2, r.result)
+
+
+class RecordTest(utils.TestCase):
+    def test_compact_list(self):
+        api = FakePagedAPI(total=5)
+        things = ThingManager(api).list(compact=True)
+        self.assertEqual(list(range(5)), [t.id for t in things])
+        for t in things:
+            self.assertIsInstance(t, base.Record)
+        # Records from the same page share their layout and request IDs
+        self.assertIs(things[0]._fields, things[1]._fields)
+        self.assertIs(things[0].request_ids, things[1].request_ids)
+        self.assertIsNot(things[0]._page, things[2]._page)
+
+    def test_compact_iter_list(self):
+        api = FakePagedAPI(total=3)
+        things = list(ThingManager(api).iter_list(compact=True))
+        self.assertEqual(
+            [{'id': 0}, {'id': 1}, {'id': 2}], [t.to_dict() for t in things]
+        )
+
+    def test_record(self):
+        info = {
+            'id': 1,
+            'name': 'foo',
+            'quotas': [
+                {'resource': 'compute.cores', 'quota': 4},
+                {'resource': 'compute.ram', 'quota': 16},
+            ],
+            'site': {'name': 'bar'},
+        }
+        page = base.RecordPage(None)
+        record = page.record(info)
+        self.assertEqual(1, record.id)
+        self.assertEqual('bar', record.site.name)
+        self.assertEqual(
+            ['compute.cores', 'compute.ram'],
+            [q.resource for q in record.quotas],
+        )
+        self.assertIs(record.quotas[0]._fields, record.quotas[1]._fields)
+        self.assertEqual(info, record.to_dict())
+        self.assertEqual(record, page.record(info))
+        self.assertRaises(AttributeError, getattr, record, 'missing')
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertRaises(AttributeError, setattr, record, 'name', 'baz')
+
+    def test_record_to_dict_copy(self):
+        info = {'id': 1, 'tags': ['a']}
+        record = base.RecordPage(None).record(info)
+        for mode in ('deep', 'json'):
+            d = record.to_dict(copy=mode)
+            self.assertEqual(info, d)
+            d['tags'].append('b')
+            self.assertEqual(('a',), record.tags)
+        view = record.to_dict(copy='view')
+        self.assertEqual(info, dict(view))
+        self.assertRaises(TypeError, operator.setitem, view, 'id', 2)
+        self.assertRaises(ValueError, record.to_dict, copy='shallow')
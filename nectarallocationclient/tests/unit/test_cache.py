@@ -0,0 +1,69 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+from nectarallocationclient import cache
+
+from nectarallocationclient.tests.unit import utils
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TTLCacheTest(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.timer = FakeTimer()
+        self.cache = cache.TTLCache(maxsize=2, ttl=10, timer=self.timer)
+
+    def test_get_set(self):
+        self.assertIsNone(self.cache.get('a'))
+        self.cache.set('a', 1)
+        self.assertEqual(1, self.cache.get('a'))
+
+    def test_expiry(self):
+        self.cache.set('a', 1)
+        self.timer.now = 9
+        self.assertEqual(1, self.cache.get('a'))
+        self.timer.now = 10
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(0, len(self.cache))
+
+    def test_no_expiry(self):
+        c = cache.TTLCache(ttl=None, timer=self.timer)
+        c.set('a', 1)
+        self.timer.now = 10**9
+        self.assertEqual(1, c.get('a'))
+
+    def test_lru_eviction(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        # Touch 'a' so 'b' is the least recently used
+        self.cache.get('a')
+        self.cache.set('c', 3)
+        self.assertEqual(1, self.cache.get('a'))
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(3, self.cache.get('c'))
+
+    def test_invalidate(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.invalidate('a')
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(2, self.cache.get('b'))
+        self.cache.invalidate()
+        self.assertEqual(0, len(self.cache))
@@ -0,0 +1,359 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import os
+from unittest import mock
+
+import fixtures
+
+from keystoneauth1 import session
+from keystoneauth1 import token_endpoint
+
+from nectarallocationclient import cache
+from nectarallocationclient import client
+from nectarallocationclient import diskcache
+from nectarallocationclient import exceptions
+from nectarallocationclient import jsonutils
+from nectarallocationclient import metrics
+from nectarallocationclient import retry
+from nectarallocationclient.v1 import client as v1_client
+from nectarallocationclient.v1 import zones
+
+from nectarallocationclient.tests.unit import utils
+
+
+ENDPOINT = 'http://allocations.example.com/v1'
+
+
+class SessionClientTest(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        auth = token_endpoint.Token(ENDPOINT, 'tok')
+        self.useFixture(
+            fixtures.MonkeyPatch(
+                'keystoneauth1.session.Session.get_project_id',
+                mock.Mock(return_value='tenant_id'),
+            )
+        )
+        self.http_client = client.SessionClient(
+            session.Session(auth=auth), service_type='allocations'
+        )
+
+    def test_request(self):
+        self.requests_mock.get(f'{ENDPOINT}/zones/', json={'name': 'a'})
+        resp, body = self.http_client.get('/zones/')
+        self.assertEqual({'name': 'a'}, body)
+        request = self.requests_mock.last_request
+        self.assertEqual('tenant_id', request.headers['X-PROJECT-ID'])
+        self.assertNotIn('If-None-Match', request.headers)
+
+    def test_request_error(self):
+        self.requests_mock.get(
+            f'{ENDPOINT}/zones/', status_code=404, json={'detail': 'nope'}
+        )
+        self.assertRaises(exceptions.NotFound, self.http_client.get, '/zones/')
+
+    def test_project_id_lookup(self):
+        self.requests_mock.get(f'{ENDPOINT}/zones/', json=[])
+        self.http_client.get('/zones/')
+        self.http_client.get('/zones/')
+        # The token plugin has no auth_ref to key a cached ID on
+        self.assertEqual(2, self.http_client.project_id_lookups)
+        self.assertGreater(self.http_client.project_id_lookup_time, 0)
+
+    def test_project_id_cached_per_auth_ref(self):
+        self.requests_mock.get(f'{ENDPOINT}/zones/', json=[])
+        auth = self.http_client.session.auth
+        auth.auth_ref = object()
+        self.http_client.get('/zones/')
+        self.http_client.get('/zones/')
+        self.assertEqual(1, self.http_client.project_id_lookups)
+        self.assertEqual(
+            'tenant_id',
+            self.requests_mock.last_request.headers['X-PROJECT-ID'],
+        )
+
+        # Re-authenticating replaces the auth_ref
+        auth.auth_ref = object()
+        self.http_client.get('/zones/')
+        self.assertEqual(2, self.http_client.project_id_lookups)
+
+    def test_retry(self):
+        sleep = mock.Mock()
+        self.http_client.retry_policy = retry.RetryPolicy(sleep=sleep)
+        self.requests_mock.get(
+            f'{ENDPOINT}/zones/',
+            [
+                {'status_code': 429, 'headers': {'Retry-After': '2'}},
+                {'status_code': 503},
+                {'json': []},
+            ],
+        )
+        resp, body = self.http_client.get('/zones/')
+        self.assertEqual([], body)
+        self.assertEqual(2, self.http_client.retries)
+        self.assertEqual(3, self.requests_mock.call_count)
+        self.assertEqual(2, sleep.call_count)
+        self.assertEqual(mock.call(2.0), sleep.call_args_list[0])
+
+    def test_retry_exhausted(self):
+        self.http_client.retry_policy = retry.RetryPolicy(
+            max_retries=2, sleep=mock.Mock()
+        )
+        self.requests_mock.get(
+            f'{ENDPOINT}/zones/',
+            status_code=429,
+            headers={'Retry-After': '1'},
+        )
+        exc = self.assertRaises(
+            exceptions.RateLimit, self.http_client.get, '/zones/'
+        )
+        self.assertEqual(1, exc.retry_after)
+        self.assertEqual(3, self.requests_mock.call_count)
+        self.assertEqual(2, self.http_client.retries)
+
+    def test_retry_after_too_long(self):
+        sleep = mock.Mock()
+        self.http_client.retry_policy = retry.RetryPolicy(sleep=sleep)
+        self.requests_mock.get(
+            f'{ENDPOINT}/zones/',
+            status_code=429,
+            headers={'Retry-After': '86400'},
+        )
+        exc = self.assertRaises(
+            exceptions.RateLimit, self.http_client.get, '/zones/'
+        )
+        self.assertEqual(86400, exc.retry_after)
+        self.assertEqual(1, self.requests_mock.call_count)
+        sleep.assert_not_called()
+
+    def test_retry_not_idempotent(self):
+        self.http_client.retry_policy = retry.RetryPolicy(sleep=mock.Mock())
+        self.requests_mock.post(f'{ENDPOINT}/zones/', status_code=503)
+        self.assertRaises(
+            exceptions.ClientException, self.http_client.post, '/zones/'
+        )
+        self.assertEqual(1, self.requests_mock.call_count)
+        self.assertEqual(0, self.http_client.retries)
+
+    def test_no_retry_policy(self):
+        self.requests_mock.get(f'{ENDPOINT}/zones/', status_code=503)
+        self.assertRaises(
+            exceptions.ClientException, self.http_client.get, '/zones/'
+        )
+        self.assertEqual(1, self.requests_mock.call_count)
+
+    def test_collectors(self):
+        collector = metrics.AggregateCollector()
+        self.http_client.collectors = [collector]
+        self.http_client.retry_policy = retry.RetryPolicy(sleep=mock.Mock())
+        self.requests_mock.get(
+            f'{ENDPOINT}/allocations/123/',
+            [{'status_code': 503}, {'text': '{"id": 123}'}],
+        )
+        self.requests_mock.get(f'{ENDPOINT}/allocations/7/', status_code=404)
+        self.http_client.get('/allocations/123/')
+        self.assertRaises(
+            exceptions.NotFound, self.http_client.get, '/allocations/7/'
+        )
+        self.assertEqual(
+            {
+                'count': 2,
+                'size': 11,
+                'retries': 1,
+                'errors': 1,
+            },
+            {
+                k: v
+                for k, v in collector.requests[
+                    ('GET', '/allocations/{id}/')
+                ].items()
+                if k not in ('latency', 'decode_time')
+            },
+        )
+
+    def test_collector_failure(self):
+        collector = mock.Mock()
+        collector.record_request.side_effect = ValueError
+        self.http_client.collectors = [collector]
+        self.requests_mock.get(f'{ENDPOINT}/zones/', json=[])
+        resp, body = self.http_client.get('/zones/')
+        self.assertEqual([], body)
+        metric = collector.record_request.call_args[0][0]
+        self.assertEqual(('GET', '/zones/', 200), metric[:3])
+
+    def test_conditional_get(self):
+        self.http_client.response_store = cache.TTLCache()
+        self.requests_mock.get(
+            f'{ENDPOINT}/zones/',
+            [
+                {'json': {'name': 'a'}, 'headers': {'ETag': '"v1"'}},
+                {'status_code': 304, 'headers': {'ETag': '"v1"'}},
+                {'json': {'name': 'b'}, 'headers': {'ETag': '"v2"'}},
+            ],
+        )
+        resp, body = self.http_client.get('/zones/')
+        self.assertEqual({'name': 'a'}, body)
+
+        resp, body = self.http_client.get('/zones/')
+        self.assertEqual(304, resp.status_code)
+        self.assertEqual({'name': 'a'}, body)
+        request = self.requests_mock.last_request
+        self.assertEqual('"v1"', request.headers['If-None-Match'])
+
+        body['name'] = 'changed'
+        resp, body = self.http_client.get('/zones/')
+        self.assertEqual({'name': 'b'}, body)
+        request = self.requests_mock.last_request
+        self.assertEqual('"v1"', request.headers['If-None-Match'])
+
+    def test_conditional_get_last_modified(self):
+        self.http_client.response_store = cache.TTLCache()
+        modified = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        self.requests_mock.get(
+            f'{ENDPOINT}/zones/',
+            [
+                {'json': [1], 'headers': {'Last-Modified': modified}},
+                {'status_code': 304},
+            ],
+        )
+        self.http_client.get('/zones/')
+        resp, body = self.http_client.get('/zones/')
+        self.assertEqual([1], body)
+        request = self.requests_mock.last_request
+        self.assertEqual(modified, request.headers['If-Modified-Since'])
+        self.assertNotIn('If-None-Match', request.headers)
+
+    def test_conditional_get_pages(self):
+        self.http_client.response_store = cache.TTLCache()
+        modified = 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+        def page(request, context):
+            if request.qs.get('page') == ['2']:
+                return {'count': 2, 'next': None, 'results': [{'name': 'b'}]}
+            context.headers['Last-Modified'] = modified
+            if 'If-Modified-Since' in request.headers:
+                context.status_code = 304
+                return None
+            return {
+                'count': 2,
+                'next': f'{ENDPOINT}/zones/?page=2',
+                'results': [{'name': 'a'}],
+            }
+
+        self.requests_mock.get(f'{ENDPOINT}/zones/', json=page)
+        manager = zones.ZoneManager(self.http_client)
+        for _ in range(2):
+            self.assertEqual(['a', 'b'], [z.name for z in manager.list()])
+        requests = self.requests_mock.request_history
+        self.assertEqual(4, len(requests))
+        self.assertEqual(modified, requests[2].headers['If-Modified-Since'])
+        self.assertNotIn('If-Modified-Since', requests[3].headers)
+
+    def test_not_modified_without_stored_response(self):
+        self.http_client.response_store = cache.TTLCache()
+        self.requests_mock.get(f'{ENDPOINT}/zones/', status_code=304)
+        self.assertRaises(
+            exceptions.ClientException, self.http_client.get, '/zones/'
+        )
+
+    def test_conditional_get_params(self):
+        self.http_client.response_store = cache.TTLCache()
+        self.requests_mock.get(
+            f'{ENDPOINT}/zones/', json=[], headers={'ETag': '"v1"'}
+        )
+        self.http_client.get('/zones/', params={'name': 'a'})
+        self.http_client.get('/zones/', params={'name': 'b'})
+        request = self.requests_mock.last_request
+        self.assertNotIn('If-None-Match', request.headers)
+        self.http_client.get('/zones/', params={'name': 'a'})
+        request = self.requests_mock.last_request
+        self.assertEqual('"v1"', request.headers['If-None-Match'])
+
+    def test_conditional_get_disabled(self):
+        self.requests_mock.get(
+            f'{ENDPOINT}/zones/', json=[], headers={'ETag': '"v1"'}
+        )
+        self.http_client.get('/zones/')
+        self.http_client.get('/zones/')
+        request = self.requests_mock.last_request
+        self.assertNotIn('If-None-Match', request.headers)
+
+    def test_client_conditional_get(self):
+        sess = session.Session(auth=token_endpoint.Token(ENDPOINT, 'tok'))
+        cs = v1_client.Client(session=sess)
+        self.assertIsNone(cs.http_client.response_store)
+        cs = v1_client.Client(session=sess, conditional_get=True)
+        self.assertIsInstance(cs.http_client.response_store, cache.TTLCache)
+
+    def test_disk_cache(self):
+        path = self.useFixture(fixtures.TempDir()).path
+        self.http_client.disk_cache = diskcache.DiskCache(path)
+        self.requests_mock.get(f'{ENDPOINT}/zones/', json=[{'name': 'a'}])
+        self.requests_mock.post(f'{ENDPOINT}/zones/', json={'name': 'b'})
+        self.http_client.get('/zones/')
+        resp, body = self.http_client.get('/zones/')
+        self.assertEqual([{'name': 'a'}], body)
+        self.assertEqual(1, self.requests_mock.call_count)
+        self.assertEqual(1, self.http_client.disk_cache_hits)
+
+        # Another process with the same cache directory
+        other = client.SessionClient(
+            self.http_client.session, service_type='allocations'
+        )
+        other.disk_cache = diskcache.DiskCache(path)
+        other.get('/zones/')
+        self.assertEqual(1, self.requests_mock.call_count)
+
+        self.http_client.post('/zones/', json={'name': 'b'})
+        self.http_client.get('/zones/')
+        self.assertEqual(3, self.requests_mock.call_count)
+
+    def test_disk_cache_uncached_collection(self):
+        path = self.useFixture(fixtures.TempDir()).path
+        self.http_client.disk_cache = diskcache.DiskCache(path)
+        self.requests_mock.get(f'{ENDPOINT}/allocations/', json=[])
+        self.http_client.get('/allocations/')
+        self.http_client.get('/allocations/')
+        self.assertEqual(2, self.requests_mock.call_count)
+        self.assertEqual([], os.listdir(path))
+
+    def test_json_decoder(self):
+        self.requests_mock.get(f'{ENDPOINT}/zones/', text='[1, 2]')
+        decoder = mock.Mock(return_value=['decoded'])
+        self.http_client.json_decoder = decoder
+        resp, body = self.http_client.get('/zones/')
+        self.assertEqual(['decoded'], body)
+        decoder.assert_called_once_with(b'[1, 2]')
+
+    def test_client_json_decoder(self):
+        sess = session.Session(auth=token_endpoint.Token(ENDPOINT, 'tok'))
+        cs = v1_client.Client(session=sess)
+        self.assertIs(jsonutils.loads, cs.http_client.json_decoder)
+        cs = v1_client.Client(session=sess, json_decoder='json')
+        self.assertIs(jsonutils.json.loads, cs.http_client.json_decoder)
+        self.assertRaises(
+            ValueError, v1_client.Client, session=sess, json_decoder='yaml'
+        )
+
+
+class JSONUtilsTest(utils.TestCase):
+    def test_decoders(self):
+        for name in jsonutils.DECODERS:
+            decoder = jsonutils.get_decoder(name)
+            self.assertEqual({'a': [1, None]}, decoder(b'{"a": [1, null]}'))
+
+    def test_default_decoder(self):
+        self.assertIs(
+            list(jsonutils.DECODERS.values())[0], jsonutils.get_decoder()
+        )
@@ -0,0 +1,90 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import os
+import time
+
+import fixtures
+
+from nectarallocationclient import diskcache
+
+from nectarallocationclient.tests.unit import utils
+
+
+class DiskCacheTest(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = self.useFixture(fixtures.TempDir()).path
+        self.offset = 0
+        self.cache = diskcache.DiskCache(
+            os.path.join(self.path, 'cache'),
+            ttls={'zones': 10, 'service-types': 10},
+            timer=lambda: time.time() + self.offset,
+        )
+
+    def test_default_path(self):
+        self.useFixture(fixtures.EnvironmentVariable('XDG_CACHE_HOME', '/c'))
+        self.assertEqual('/c/nectarallocationclient', diskcache.default_path())
+
+    def test_collection(self):
+        for url, name in [
+            ('/zones/', 'zones'),
+            ('/zones/melbourne/', 'zones'),
+            ('http://host/v1/service-types/?page=2', 'service-types'),
+            ('/', None),
+        ]:
+            self.assertEqual(name, diskcache.collection(url))
+
+    def test_key(self):
+        key = self.cache.key('http://a', 'p1', '/zones/', {'name': 'x'})
+        self.assertEqual('zones', key[0])
+        self.assertEqual(
+            key, self.cache.key('http://a', 'p1', '/zones/', {'name': 'x'})
+        )
+        self.assertNotEqual(key, self.cache.key('http://a', 'p2', '/zones/'))
+        self.assertNotEqual(key, self.cache.key('http://b', 'p1', '/zones/'))
+        self.assertIsNone(self.cache.key('http://a', 'p1', '/allocations/'))
+
+    def test_get_set(self):
+        key = self.cache.key('http://a', 'p1', '/zones/')
+        self.assertIsNone(self.cache.get(key))
+        self.cache.set(key, b'[1]')
+        self.assertEqual(b'[1]', self.cache.get(key))
+        self.assertEqual(1, len(os.listdir(self.cache.path)))
+
+    def test_expiry(self):
+        key = self.cache.key('http://a', 'p1', '/zones/')
+        self.cache.set(key, b'[1]')
+        self.offset = 9
+        self.assertEqual(b'[1]', self.cache.get(key))
+        self.offset = 11
+        self.assertIsNone(self.cache.get(key))
+
+    def test_invalidate(self):
+        zones = self.cache.key('http://a', 'p1', '/zones/')
+        service_types = self.cache.key('http://a', 'p1', '/service-types/')
+        self.cache.set(zones, b'[1]')
+        self.cache.set(service_types, b'[2]')
+        self.cache.invalidate('zones')
+        self.assertIsNone(self.cache.get(zones))
+        self.assertEqual(b'[2]', self.cache.get(service_types))
+        self.cache.invalidate()
+        self.assertIsNone(self.cache.get(service_types))
+
+    def test_write_failure_ignored(self):
+        filename = os.path.join(self.path, 'file')
+        open(filename, 'w').close()
+        cache = diskcache.DiskCache(filename)
+        key = cache.key('http://a', 'p1', '/zones/')
+        cache.set(key, b'[1]')
+        self.assertIsNone(cache.get(key))
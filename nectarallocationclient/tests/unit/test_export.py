@@ -0,0 +1,85 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import csv
+import io
+import json
+
+from nectarallocationclient import export
+
+from nectarallocationclient.tests.unit import utils
+from nectarallocationclient.tests.unit.v1 import fakes
+
+
+class ExportTest(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cs = fakes.FakeClient()
+
+    def test_flatten(self):
+        allocation = {
+            'id': 1,
+            'quotas': [
+                {'resource': 'volume.gigabytes', 'zone': 'a', 'quota': 10},
+                {'resource': 'volume.gigabytes', 'zone': 'b', 'quota': 5},
+                {'resource': 'compute.cores', 'zone': 'nectar', 'quota': 4},
+            ],
+        }
+        self.assertEqual(
+            {'id': 1, 'volume.gigabytes': 15, 'compute.cores': 4},
+            export.flatten(allocation, fields=['id']),
+        )
+
+    def test_export_ndjson(self):
+        fp = io.StringIO()
+        count = export.export(self.cs.allocations, fp, project_id='123')
+        self.assertEqual(2, count)
+        rows = [json.loads(line) for line in fp.getvalue().splitlines()]
+        self.assertEqual([587, 596], [r['id'] for r in rows])
+        self.assertEqual(set(export.FIELDS), set(rows[0]))
+        self.cs.assert_called(
+            'GET', '/allocations/', params={'project_id': '123'}
+        )
+
+    def test_export_csv(self):
+        fp = io.StringIO(newline='')
+        count = export.export(self.cs.allocations, fp, format='csv')
+        self.assertEqual(3, count)
+        self.cs.assert_called('GET', '/allocations/')
+        rows = list(csv.DictReader(io.StringIO(fp.getvalue())))
+        self.assertEqual(
+            list(export.FIELDS)
+            + ['database.instances', 'object.object', 'volume.gigabytes'],
+            list(rows[0]),
+        )
+        self.assertEqual(['587', '596', '581'], [r['id'] for r in rows])
+
+    def test_export_csv_columns(self):
+        fp = io.StringIO(newline='')
+        export.export(
+            self.cs.allocations,
+            fp,
+            format='csv',
+            fields=['id'],
+            columns=['compute.cores'],
+        )
+        self.assertEqual('id,compute.cores', fp.getvalue().splitlines()[0])
+
+    def test_export_unknown_format(self):
+        self.assertRaises(
+            ValueError,
+            export.export,
+            self.cs.allocations,
+            io.StringIO(),
+            format='xml',
+        )
@@ -0,0 +1,88 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+from unittest import mock
+
+from nectarallocationclient import metrics
+
+from nectarallocationclient.tests.unit import utils
+
+
+class MetricsTest(utils.TestCase):
+    def test_url_template(self):
+        for url, template in [
+            ('/allocations/', '/allocations/'),
+            ('/allocations/123/', '/allocations/{id}/'),
+            ('/allocations/123/approve/', '/allocations/{id}/approve/'),
+            ('/zones/melbourne/', '/zones/{id}/'),
+            ('/quotas/?allocation=1', '/quotas/'),
+            ('http://host:8774/v1/allocations/?page=2', '/allocations/'),
+            ('http://host/allocations/12/?page=2', '/allocations/{id}/'),
+        ]:
+            self.assertEqual(template, metrics.url_template(url))
+
+    def test_aggregate_collector(self):
+        collector = metrics.AggregateCollector()
+        collector.record_request(
+            metrics.RequestMetric('GET', '/zones/', 200, 0.5, 0.1, 100, 0)
+        )
+        collector.record_request(
+            metrics.RequestMetric('GET', '/zones/', 429, 1.5, 0.0, 10, 2)
+        )
+        collector.record_list(metrics.ListMetric('/zones/', 3, 1.0))
+        collector.record_lazy_load(metrics.LazyLoadMetric('Quota', 'zone'))
+        self.assertEqual(
+            {
+                'count': 2,
+                'latency': 2.0,
+                'decode_time': 0.1,
+                'size': 110,
+                'retries': 2,
+                'errors': 1,
+            },
+            dict(collector.requests[('GET', '/zones/')]),
+        )
+        self.assertEqual(
+            {'count': 1, 'pages': 3, 'latency': 1.0},
+            dict(collector.lists['/zones/']),
+        )
+        self.assertEqual({('Quota', 'zone'): 1}, collector.lazy_loads)
+
+    def test_statsd_collector(self):
+        statsd = mock.Mock()
+        collector = metrics.StatsdCollector(statsd)
+        collector.record_request(
+            metrics.RequestMetric(
+                'POST', '/allocations/{id}/approve/', 200, 0.25, 0, 50, 1
+            )
+        )
+        collector.record_list(metrics.ListMetric('/allocations/', 4, 2.0))
+        collector.record_lazy_load(metrics.LazyLoadMetric('Quota', 'zone'))
+        name = 'nectarallocation.POST.allocations.id.approve'
+        statsd.timing.assert_called_once_with(f'{name}.200', 250.0)
+        statsd.incr.assert_has_calls(
+            [
+                mock.call(f'{name}.bytes', 50),
+                mock.call(f'{name}.retries', 1),
+                mock.call('nectarallocation.list.allocations.pages', 4),
+                mock.call('nectarallocation.lazy_load.Quota'),
+            ]
+        )
+
+    def test_emit_ignores_failures(self):
+        good = mock.Mock()
+        bad = mock.Mock()
+        bad.record_list.side_effect = RuntimeError
+        metric = metrics.ListMetric('/zones/', 1, 0.1)
+        metrics.emit([bad, good], 'record_list', metric)
+        good.record_list.assert_called_once_with(metric)
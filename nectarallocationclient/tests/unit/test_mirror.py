@@ -0,0 +1,108 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import os
+
+import fixtures
+
+from nectarallocationclient import mirror
+from nectarallocationclient.v1 import allocations
+
+from nectarallocationclient.tests.unit import utils
+from nectarallocationclient.tests.unit.v1 import fakes
+
+
+class MirrorTest(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cs = fakes.FakeClient()
+        self.mirror = mirror.Mirror(self.cs)
+        self.addCleanup(self.mirror.close)
+
+    def test_sync(self):
+        self.assertIsNone(self.mirror.high_water_mark)
+        self.assertEqual(3, self.mirror.sync())
+        self.cs.assert_called_anytime('GET', '/allocations/')
+        self.assertEqual('2018-07-03T07:36:48Z', self.mirror.high_water_mark)
+
+        self.mirror.sync()
+        self.cs.assert_called(
+            'GET',
+            '/allocations/',
+            pos=0,
+            params={'modified_time__gte': '2018-07-03T07:36:48Z'},
+        )
+        self.assertEqual(3, len(self.mirror.allocations()))
+
+    def test_allocations_query(self):
+        self.mirror.sync(reference=False)
+        al = self.mirror.allocations(status='A')
+        self.assertEqual([581, 587], [a.id for a in al])
+        for a in al:
+            self.assertIsInstance(a, allocations.Allocation)
+        self.assertEqual(
+            [596], [a.id for a in self.mirror.allocations(parent_request=587)]
+        )
+        al = self.mirror.allocations(status='X', project_name='rest-test3')
+        self.assertEqual([596], [a.id for a in al])
+        self.assertEqual([], self.mirror.allocations(site='nowhere'))
+
+    def test_quotas(self):
+        self.mirror._store_allocation(fakes.generic_allocation)
+        quotas = self.mirror.quotas(resource='compute.cores')
+        self.assertEqual(
+            [
+                {
+                    'allocation': 123,
+                    'zone': 'nectar',
+                    'resource': 'compute.cores',
+                    'quota': 4,
+                }
+            ],
+            quotas,
+        )
+        self.assertEqual(13, len(self.mirror.quotas(allocation=123)))
+        a = self.mirror.allocations()[0]
+        self.assertEqual(
+            {'cores': 4, 'instances': 2, 'ram': 50},
+            a.get_allocated_nova_quota(),
+        )
+
+    def test_reference(self):
+        self.mirror.sync()
+        zones = self.mirror.reference('zones')
+        self.assertEqual(
+            ['australia', 'new-zealand'], [z['name'] for z in zones]
+        )
+        self.assertEqual(
+            ['compute', 'volume'],
+            [
+                s['catalog_name']
+                for s in self.mirror.reference('service_types')
+            ],
+        )
+        self.assertEqual(3, len(self.mirror.reference('resources')))
+        self.assertRaises(ValueError, self.mirror.reference, 'grants')
+
+    def test_persistent(self):
+        path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'mirror.db'
+        )
+        m = mirror.Mirror(self.cs, path)
+        m.sync()
+        m.close()
+
+        m = mirror.Mirror(self.cs, path)
+        self.addCleanup(m.close)
+        self.assertEqual('2018-07-03T07:36:48Z', m.high_water_mark)
+        self.assertEqual(3, len(m.allocations()))
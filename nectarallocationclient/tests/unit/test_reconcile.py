@@ -0,0 +1,124 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import copy
+import json
+
+from nectarallocationclient import reconcile
+from nectarallocationclient.v1 import allocations
+from nectarallocationclient.v1 import quotas
+
+from nectarallocationclient.tests.unit import utils
+from nectarallocationclient.tests.unit.v1 import fakes
+
+
+class ReconcileTest(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cs = fakes.FakeClient()
+
+    def allocation(self, id, project_id):
+        info = copy.deepcopy(fakes.generic_allocation)
+        info.update(id=id, project_id=project_id)
+        return allocations.Allocation(self.cs.allocations, info, loaded=True)
+
+    def test_plan(self):
+        al = [
+            self.allocation(1, 'p1'),
+            self.allocation(2, 'p2'),
+            self.allocation(3, None),
+        ]
+        applied = {
+            'p1': {
+                'nova': {'cores': 4, 'instances': 1, 'ram': 50, 'foo': 1},
+                'magnum': {'clusters': 1},
+            },
+        }
+        plan = reconcile.plan(al, applied, services=['nova', 'magnum'])
+        self.assertEqual(
+            [
+                ('p1', 1, 'nova', 'instances', 1, 2),
+                ('p2', 2, 'nova', 'cores', None, 4),
+                ('p2', 2, 'nova', 'ram', None, 50),
+                ('p2', 2, 'nova', 'instances', None, 2),
+                ('p2', 2, 'magnum', 'clusters', None, 1),
+            ],
+            list(plan),
+        )
+        self.assertEqual(
+            {
+                'p1': {'nova': {'instances': 2}},
+                'p2': {
+                    'nova': {'cores': 4, 'ram': 50, 'instances': 2},
+                    'magnum': {'clusters': 1},
+                },
+            },
+            plan.by_project(),
+        )
+
+    def test_plan_errors(self):
+        bad = self.allocation(2, 'p2')
+        bad.quotas = [
+            quotas.Quota(
+                None, {'resource': 'object.object', 'quota': q}, loaded=True
+            )
+            for q in (1, 2)
+        ]
+        al = [self.allocation(1, 'p1'), bad]
+        self.assertRaises(
+            RuntimeError, reconcile.plan, al, {}, services=['swift']
+        )
+        errors = {}
+        plan = reconcile.plan(al, {}, services=['swift'], errors=errors)
+        self.assertEqual([2], list(errors))
+        self.assertEqual({'p1'}, set(plan.by_project()))
+
+    def test_plan_in_sync(self):
+        a = self.allocation(1, 'p1')
+        applied = {'p1': {'octavia': a.get_allocated_octavia_quota()}}
+        plan = reconcile.plan([a], applied, services=['octavia'])
+        self.assertEqual(0, len(plan))
+
+    def test_plan_all_services(self):
+        a = self.allocation(1, 'p1')
+        plan = reconcile.plan([a], {})
+        self.assertEqual(
+            {
+                'nova',
+                'swift',
+                'trove',
+                'manila',
+                'neutron',
+                'octavia',
+                'magnum',
+                'warre',
+                'cloudkitty',
+            },
+            {c.service for c in plan},
+        )
+
+    def test_serialize(self):
+        plan = reconcile.plan([self.allocation(1, 'p1')], {})
+        data = json.loads(json.dumps(plan.to_dict()))
+        self.assertEqual(
+            {
+                'project_id': 'p1',
+                'allocation_id': 1,
+                'service': 'nova',
+                'resource': 'cores',
+                'current': None,
+                'desired': 4,
+            },
+            data['changes'][0],
+        )
+        self.assertEqual(plan.changes, reconcile.Plan.from_dict(data).changes)
@@ -0,0 +1,63 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+from email import utils as email_utils
+import time
+from unittest import mock
+
+from nectarallocationclient import retry
+
+from nectarallocationclient.tests.unit import utils
+
+
+class RetryPolicyTest(utils.TestCase):
+    def test_should_retry(self):
+        policy = retry.RetryPolicy(max_retries=2)
+        self.assertTrue(policy.should_retry('GET', 429, 0))
+        self.assertTrue(policy.should_retry('PUT', 413, 1))
+        self.assertTrue(policy.should_retry('DELETE', 503, 1))
+        self.assertFalse(policy.should_retry('GET', 429, 2))
+        self.assertFalse(policy.should_retry('GET', 404, 0))
+        self.assertFalse(policy.should_retry('GET', 501, 0))
+        self.assertFalse(policy.should_retry('POST', 429, 0))
+        self.assertFalse(policy.should_retry('PATCH', 503, 0))
+
+    @mock.patch('random.uniform', side_effect=lambda a, b: b)
+    def test_delay_backoff(self, uniform):
+        policy = retry.RetryPolicy(backoff=0.5, max_backoff=3)
+        self.assertEqual(
+            [0.5, 1.0, 2.0, 3, 3], [policy.delay(i) for i in range(5)]
+        )
+        uniform.assert_called_with(0, 3)
+
+    def test_delay_jitter(self):
+        policy = retry.RetryPolicy(backoff=1, max_backoff=10)
+        for _ in range(20):
+            self.assertTrue(0 <= policy.delay(2) <= 4)
+
+    def test_delay_retry_after(self):
+        policy = retry.RetryPolicy(max_backoff=10)
+        self.assertEqual(7, policy.delay(0, '7'))
+        self.assertEqual(120, policy.delay(0, '120'))
+        self.assertEqual(300, policy.delay(0, '300'))
+        self.assertIsNone(policy.delay(0, '86400'))
+
+    def test_parse_retry_after(self):
+        self.assertIsNone(retry.parse_retry_after(None))
+        self.assertIsNone(retry.parse_retry_after('soon'))
+        self.assertEqual(0, retry.parse_retry_after('-3'))
+        self.assertEqual(1.5, retry.parse_retry_after('1.5'))
+        seconds = retry.parse_retry_after(
+            email_utils.formatdate(time.time() + 60, usegmt=True)
+        )
+        self.assertTrue(50 < seconds <= 60)
@@ -354,7 +354,14 @@ class FakeSessionClient(base_client.SessionClient):
             },
         ]
         no_parent = params.get('parent_request__isnull')
+        parent_request = params.get('parent_request')
         project_id = params.get('project_id')
+        if parent_request:
+            allocations = [
+                a
+                for a in allocations
+                if str(a['parent_request']) == str(parent_request)
+            ]
         if project_id:
             allocations = [
                 a for a in allocations if a['project_id'] == project_id
@@ -667,6 +674,9 @@ class FakeSessionClient(base_client.SessionClient):
         return (200, {}, {"name": "australia", "display_name": "Australia"})
 
     def get_quotas(self, **kw):
+        params = kw.get('params') or {}
+        if 'group__allocation__in' in params:
+            return self._get_quota_history(params)
         quotas = [
             {
                 "id": 1,
@@ -687,6 +697,42 @@ class FakeSessionClient(base_client.SessionClient):
         ]
         return (200, {}, quotas)
 
+    def _get_quota_history(self, params):
+        quotas = [
+            {
+                "id": 11,
+                "zone": "nectar",
+                "allocation": 587,
+                "requested_quota": 20,
+                "quota": 15,
+                "resource": 4,
+            },
+            {
+                "id": 12,
+                "zone": "nectar",
+                "allocation": 596,
+                "requested_quota": 10,
+                "quota": 10,
+                "resource": 4,
+            },
+            {
+                "id": 13,
+                "zone": "nectar",
+                "allocation": 596,
+                "requested_quota": 5,
+                "quota": 5,
+                "resource": 7,
+            },
+        ]
+        ids = [int(x) for x in params['group__allocation__in'].split(',')]
+        quotas = [
+            q
+            for q in quotas
+            if q['allocation'] in ids
+            and str(q['resource']) == str(params['resource'])
+        ]
+        return (200, {}, quotas)
+
     def get_quotas_1(self, **kw):
         return (
             200,
@@ -800,6 +846,37 @@ class FakeSessionClient(base_client.SessionClient):
             },
         )
 
+    def get_service_types(self, **kw):
+        service_types = [
+            {
+                "catalog_name": "compute",
+                "name": "Compute",
+                "zones": [],
+                "experimental": False,
+                "location_specific": False,
+                "resource_set": [
+                    {
+                        "id": 1,
+                        "name": "Instances",
+                        "quota_name": "instances",
+                        "unit": "servers",
+                        "requestable": True,
+                        "help_text": "The maximum number of instances",
+                        "service_type": "compute",
+                    },
+                ],
+            },
+            {
+                "catalog_name": "volume",
+                "name": "Volume",
+                "zones": ["nectar"],
+                "experimental": False,
+                "location_specific": True,
+                "resource_set": [],
+            },
+        ]
+        return (200, {}, service_types)
+
     def get_service_types_compute(self, **kw):
         return (
             200,
@@ -0,0 +1,258 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import asyncio
+import unittest
+from unittest import mock
+
+from oslo_utils import importutils
+
+from nectarallocationclient import exceptions
+from nectarallocationclient.v1 import aio
+from nectarallocationclient.v1 import allocations
+from nectarallocationclient.v1 import quotas
+from nectarallocationclient.v1 import zones
+
+from nectarallocationclient.tests.unit import test_base
+from nectarallocationclient.tests.unit import utils
+from nectarallocationclient.tests.unit.v1 import fakes
+
+aiohttp = importutils.try_import('aiohttp')
+if aiohttp:
+    from aiohttp import test_utils
+    from aiohttp import web
+
+
+class FakeServer:
+    """Serves the canned responses of FakeSessionClient over HTTP."""
+
+    def __init__(self):
+        self.fake = fakes.FakeSessionClient()
+        self.headers = []
+
+    @property
+    def callstack(self):
+        return self.fake.callstack
+
+    async def handle(self, request):
+        self.headers.append(request.headers)
+        kwargs = {'params': dict(request.query)}
+        if request.can_read_body:
+            kwargs['data'] = await request.json()
+        try:
+            resp, body = self.fake.request(
+                request.path, request.method, **kwargs
+            )
+        except AssertionError:
+            return web.json_response(
+                {'error_message': 'Not found'}, status=404
+            )
+        if resp.status_code == 204:
+            return web.Response(status=204)
+        return web.json_response(body, status=resp.status_code)
+
+    def app(self):
+        app = web.Application()
+        app.router.add_route('*', '/{path:.*}', self.handle)
+        return app
+
+
+@unittest.skipIf(aiohttp is None, 'aiohttp is not installed')
+class AsyncClientTest(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.server = FakeServer()
+        self.session = mock.Mock()
+        self.session.get_auth_headers.return_value = {'X-Auth-Token': 'tok'}
+        self.session.get_project_id.return_value = 'tenant_id'
+
+    def run_client(self, func):
+        async def runner():
+            async with test_utils.TestServer(self.server.app()) as server:
+                endpoint = str(server.make_url(''))
+                async with aio.Client(
+                    session=self.session, endpoint_override=endpoint
+                ) as client:
+                    return await func(client)
+
+        return asyncio.run(runner())
+
+    def test_allocation_list(self):
+        async def func(client):
+            return await client.allocations.list(project_id='123')
+
+        al = self.run_client(func)
+        self.assertEqual([587, 596], [a.id for a in al])
+        for a in al:
+            self.assertIsInstance(a, allocations.Allocation)
+        self.assertEqual(
+            ('GET', '/allocations/', None, {'project_id': '123'}),
+            self.server.callstack[-1],
+        )
+        headers = self.server.headers[-1]
+        self.assertEqual('tok', headers['X-Auth-Token'])
+        self.assertEqual('tenant_id', headers['X-PROJECT-ID'])
+
+    def test_allocation_iter_list(self):
+        async def func(client):
+            return [a.id async for a in client.allocations.iter_list()]
+
+        self.assertEqual([587, 596, 581], self.run_client(func))
+
+    def test_allocation_get_current(self):
+        async def func(client):
+            return await client.allocations.get_current(project_id='123')
+
+        self.assertEqual(587, self.run_client(func).id)
+
+    def test_allocation_get_and_quota(self):
+        async def func(client):
+            return await client.allocations.get(123)
+
+        a = self.run_client(func)
+        self.assertIsInstance(a, allocations.Allocation)
+        self.assertEqual(
+            {'cores': 4, 'instances': 2, 'ram': 50},
+            a.get_allocated_nova_quota(),
+        )
+
+    def test_allocation_no_lazy_load(self):
+        async def func(client):
+            return await client.allocations.get(123)
+
+        a = self.run_client(func)
+        quota = a.quotas[0]
+        self.assertIsInstance(quota.manager, aio.QuotaManager)
+        self.assertRaises(exceptions.LazyLoadError, getattr, quota, 'id')
+        self.assertFalse(hasattr(a, 'missing'))
+
+    def test_allocation_update(self):
+        async def func(client):
+            return await client.allocations.update(123, notes='test')
+
+        a = self.run_client(func)
+        self.assertEqual('test', a.notes)
+        self.assertEqual(
+            ('PATCH', '/allocations/123/', {'notes': 'test'}, {}),
+            self.server.callstack[-1],
+        )
+
+    def test_allocation_approve(self):
+        async def func(client):
+            return await client.allocations.approve(123)
+
+        self.assertIsInstance(self.run_client(func), allocations.Allocation)
+
+    def test_concurrent_requests(self):
+        async def func(client):
+            return await asyncio.gather(
+                client.zones.list(),
+                client.resources.index(),
+                client.quotas.get(1),
+            )
+
+        zl, resources, quota = self.run_client(func)
+        for z in zl:
+            self.assertIsInstance(z, zones.Zone)
+        self.assertEqual([4, 7, 10], sorted(resources))
+        self.assertIsInstance(quota, quotas.Quota)
+
+    def test_quota_history(self):
+        async def func(client):
+            allocation = await client.allocations.get_current(project_id='123')
+            return await client.quotas.history(allocation, 4)
+
+        history = self.run_client(func)
+        self.assertEqual([596, 587], [q.allocation_id for q in history])
+
+    def test_quota_delete(self):
+        async def func(client):
+            return await client.quotas.delete(1)
+
+        self.run_client(func)
+        self.assertEqual(
+            ('DELETE', '/quotas/1/', None, {}), self.server.callstack[-1]
+        )
+
+    def test_auth_headers_once_per_token(self):
+        auth_ref = self.session.auth.auth_ref
+        auth_ref.will_expire_soon.return_value = False
+
+        async def func(client):
+            return await asyncio.gather(
+                *(client.zones.list() for _ in range(5))
+            )
+
+        self.run_client(func)
+        self.assertEqual(1, self.session.get_auth_headers.call_count)
+        self.assertEqual(1, self.session.get_project_id.call_count)
+
+        # An expiring token is fetched again
+        auth_ref.will_expire_soon.return_value = True
+        self.run_client(func)
+        self.assertEqual(6, self.session.get_auth_headers.call_count)
+
+    def test_endpoint_discovered_once(self):
+        async def runner():
+            async with test_utils.TestServer(self.server.app()) as server:
+                self.session.get_endpoint.return_value = str(
+                    server.make_url('')
+                )
+                async with aio.Client(session=self.session) as client:
+                    await client.zones.list()
+                    await client.sites.list()
+
+        asyncio.run(runner())
+        self.session.get_endpoint.assert_called_once_with(
+            service_type='allocations', interface=None, region_name=None
+        )
+
+    def test_not_found(self):
+        async def func(client):
+            return await client.zones.get('atlantis')
+
+        self.assertRaises(exceptions.NotFound, self.run_client, func)
+
+
+class FakePagedAPI(test_base.FakePagedAPI):
+    async def get(self, url, headers=None, params=None):
+        await asyncio.sleep(0)
+        return super().get(url, headers=headers, params=params)
+
+
+class ThingManager(aio.BasicManager):
+    base_url = 'things'
+    resource_class = test_base.Thing
+
+
+class AsyncPaginationTest(utils.TestCase):
+    def list_things(self, api, **kwargs):
+        return asyncio.run(ThingManager(api).list(**kwargs))
+
+    def test_list_follows_next(self):
+        api = FakePagedAPI(total=5)
+        things = self.list_things(api)
+        self.assertEqual(list(range(5)), [t.id for t in things])
+        self.assertEqual(3, len(api.calls))
+
+    def test_list_prefetch(self):
+        api = FakePagedAPI(total=25, page_prefetch=4)
+        things = self.list_things(api)
+        self.assertEqual(list(range(25)), [t.id for t in things])
+        self.assertEqual(13, len(api.calls))
+
+    def test_list_limit(self):
+        api = FakePagedAPI(total=10, page_prefetch=4)
+        things = self.list_things(api, limit=3, page_size=2)
+        self.assertEqual([0, 1, 2], [t.id for t in things])
+        self.assertEqual(2, len(api.calls))
@@ -11,9 +11,12 @@
 #   under the License.
 #
 
+from nectarallocationclient import base
 from nectarallocationclient import exceptions
+from nectarallocationclient import metrics
 from nectarallocationclient.v1 import allocations
 from nectarallocationclient.v1 import organisations
+from nectarallocationclient.v1 import quotas
 
 from nectarallocationclient.tests.unit import utils
 from nectarallocationclient.tests.unit.v1 import fakes
@@ -41,6 +44,23 @@ class AllocationsTest(utils.TestCase):
             self.assertEqual('123', a.project_id)
         self.assertEqual(2, len(al))
 
+    def test_allocation_iter_list(self):
+        al = self.cs.allocations.iter_list(project_id='123')
+        self.assertEqual([], self.cs.http_client.callstack)
+        self.assertEqual([587, 596], [a.id for a in al])
+        self.cs.assert_called(
+            'GET', '/allocations/', params={'project_id': '123'}
+        )
+
+    def test_allocation_list_compact(self):
+        al = self.cs.allocations.list(compact=True)
+        full = self.cs.allocations.list()
+        self.assertEqual(
+            [a.to_dict() for a in full], [a.to_dict() for a in al]
+        )
+        self.assertEqual(587, al[0].id)
+        self.assertEqual((), al[0].quotas)
+
     def test_allocation_get(self):
         a = self.cs.allocations.get(123)
         self.cs.assert_called('GET', '/allocations/123/')
@@ -191,6 +211,33 @@ class AllocationsTest(utils.TestCase):
         self.cs.assert_called('POST', '/allocations/123/amend/')
         self.assertIsInstance(a, allocations.Allocation)
 
+    def test_bulk_approve(self):
+        a = self.cs.allocations.get(123)
+        results = self.cs.allocations.bulk_approve(
+            [123, 999, a], concurrency=2
+        )
+        self.assertEqual([123, 999, a], [r.item for r in results])
+        self.assertEqual([True, False, True], [r.ok for r in results])
+        self.assertIsInstance(results[0].result, allocations.Allocation)
+        self.assertIsNone(results[1].result)
+        self.assertIsNotNone(results[1].error)
+        self.assertEqual(
+            2,
+            self.cs.http_client.callstack.count(
+                ('POST', '/allocations/123/approve/', None, None)
+            ),
+        )
+
+    def test_bulk_delete(self):
+        results = self.cs.allocations.bulk_delete([123])
+        self.assertTrue(results[0].ok)
+        self.cs.assert_called('POST', '/allocations/123/delete/')
+
+    def test_bulk_amend(self):
+        results = self.cs.allocations.bulk_amend([123])
+        self.assertTrue(results[0].ok)
+        self.cs.assert_called('POST', '/allocations/123/amend/')
+
     def test_approver_info(self):
         res = self.cs.allocations.get_approver_info(123)
         self.cs.assert_called('GET', '/allocations/123/approver_info/')
@@ -252,3 +299,103 @@ class AllocationsTest(utils.TestCase):
             {'days': 2, 'flavor:gpu-v1': True, 'hours': 48, 'reservation': 10},
             quota,
         )
+
+    def test_get_allocated_quotas(self):
+        al = [self.cs.allocations.get(123), self.cs.allocations.get(124)]
+        quotas = allocations.get_allocated_quotas(al)
+        self.assertEqual([123, 124], list(quotas))
+        self.assertEqual(set(allocations.QUOTA_HELPERS), set(quotas[123]))
+        for a in al:
+            for service, helper in allocations.QUOTA_HELPERS.items():
+                self.assertEqual(helper(a), quotas[a.id][service])
+
+    def test_get_allocated_quotas_errors(self):
+        al = [self.cs.allocations.get(123), self.cs.allocations.get(124)]
+        al[0].quotas.append(
+            quotas.Quota(
+                None, {'resource': 'object.object', 'quota': 2}, loaded=True
+            )
+        )
+        al[0].quotas.append(
+            quotas.Quota(
+                None, {'resource': 'object.object', 'quota': 3}, loaded=True
+            )
+        )
+        self.assertRaises(
+            RuntimeError, allocations.get_allocated_quotas, al, ['swift']
+        )
+        errors = {}
+        result = allocations.get_allocated_quotas(
+            al, services=['swift'], errors=errors
+        )
+        self.assertEqual({124: {'swift': {'object': 0}}}, result)
+        self.assertEqual([123], list(errors))
+        columns = allocations.get_allocated_quotas(
+            al, services=['swift'], columnar=True, errors={}
+        )
+        self.assertEqual({'id': [124], 'swift': [{'object': 0}]}, columns)
+
+    def test_get_allocated_quotas_columnar(self):
+        al = [self.cs.allocations.get(123), self.cs.allocations.get(124)]
+        quotas = allocations.get_allocated_quotas(
+            al, services=['nova', 'octavia'], columnar=True
+        )
+        self.assertEqual(
+            {
+                'id': [123, 124],
+                'nova': [
+                    {'cores': 4, 'instances': 2, 'ram': 50},
+                    {'cores': 4, 'instances': 2, 'ram': 16},
+                ],
+                'octavia': [
+                    {'load_balancers': 7},
+                    al[1].get_allocated_octavia_quota(),
+                ],
+            },
+            quotas,
+        )
+
+
+class LazyLoadTest(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cs = fakes.FakeClient()
+
+    def test_nested_quota_loads_from_quotas(self):
+        collector = metrics.AggregateCollector()
+        self.cs.http_client.collectors = [collector]
+        allocation = allocations.Allocation(
+            self.cs.allocations, {'id': 5, 'quotas': [{'id': 1}]}
+        )
+        self.assertEqual('foo', allocation.quotas[0].zone)
+        self.cs.assert_called('GET', '/quotas/1/')
+        self.assertEqual(1, self.cs.http_client.lazy_loads)
+        self.assertEqual({('Quota', 'zone'): 1}, collector.lazy_loads)
+
+    def test_strict_lazy_load(self):
+        self.cs.http_client.strict_lazy_load = True
+        allocation = allocations.Allocation(
+            self.cs.allocations, {'id': 123, 'quotas': []}
+        )
+        self.assertRaises(
+            exceptions.LazyLoadError, getattr, allocation, 'notes'
+        )
+        self.assertFalse(hasattr(allocation, 'notes'))
+        self.assertEqual([], self.cs.http_client.callstack)
+        self.assertEqual(0, self.cs.http_client.lazy_loads)
+
+    def test_load_all_nested_quotas(self):
+        allocation = allocations.Allocation(
+            self.cs.allocations,
+            {'id': 596, 'quotas': [{'id': 12}, {'id': 13}, {'id': 99}]},
+        )
+        result = base.load_all(allocation.quotas, resource=4)
+        self.assertEqual((1, [13, 99]), result)
+        self.cs.assert_called(
+            'GET',
+            '/quotas/',
+            params={'group__allocation__in': '596', 'resource': 4},
+        )
+        self.assertEqual(10, allocation.quotas[0].quota)
+        self.assertFalse(allocation.quotas[1].is_loaded())
+        self.assertEqual(0, self.cs.http_client.lazy_loads)
@@ -0,0 +1,64 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import subprocess
+import sys
+import textwrap
+from unittest import mock
+
+from nectarallocationclient import cache
+from nectarallocationclient.v1 import client
+from nectarallocationclient.v1 import zones
+
+from nectarallocationclient.tests.unit import utils
+
+
+class ClientTest(utils.TestCase):
+    def test_managers_created_on_access(self):
+        cs = client.Client(session=mock.Mock())
+        self.assertNotIn('zones', vars(cs))
+        self.assertIsInstance(cs.zones, zones.ZoneManager)
+        self.assertIs(cs.zones, cs.zones)
+        self.assertIs(cs.http_client, cs.zones.api)
+        self.assertIsNone(cs.zones.cache)
+
+    def test_all_managers(self):
+        cs = client.Client(session=mock.Mock())
+        for name in client.MANAGERS:
+            self.assertIs(cs.http_client, getattr(cs, name).api)
+        self.assertTrue(set(client.MANAGERS) <= set(dir(cs)))
+
+    def test_unknown_attribute(self):
+        cs = client.Client(session=mock.Mock())
+        self.assertRaises(AttributeError, getattr, cs, 'nothing')
+
+    def test_cache_applied_on_creation(self):
+        cs = client.Client(session=mock.Mock(), cache_ttl=30, cache_size=5)
+        self.assertIsInstance(cs.zones.cache, cache.TTLCache)
+        self.assertEqual(30, cs.zones.cache.ttl)
+        self.assertEqual(5, cs.zones.cache.maxsize)
+        self.assertFalse(hasattr(cs.allocations, 'cache'))
+
+    def test_import_does_not_load_managers(self):
+        code = textwrap.dedent(
+            """
+            import sys
+            import nectarallocationclient.v1.client
+            print(sorted(m for m in sys.modules
+                         if m.startswith('nectarallocationclient.v1.')))
+            """
+        )
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(
+            "['nectarallocationclient.v1.client']", output.decode().strip()
+        )
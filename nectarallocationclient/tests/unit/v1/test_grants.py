@@ -51,3 +51,8 @@ class GrantsTest(utils.TestCase):
     def test_grant_delete(self):
         self.cs.grants.delete('1')
         self.cs.assert_called('DELETE', '/grants/1/')
+
+    def test_grant_findall(self):
+        grants_list = self.cs.grants.findall(allocation=123, grant_type='arc')
+        self.cs.assert_called('GET', '/grants/', params={'allocation': 123})
+        self.assertEqual([1], [g.id for g in grants_list])
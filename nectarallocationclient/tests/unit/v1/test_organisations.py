@@ -11,6 +11,7 @@
 #   under the License.
 #
 
+from nectarallocationclient import exceptions
 from nectarallocationclient.v1 import organisations
 
 from nectarallocationclient.tests.unit import utils
@@ -50,3 +51,33 @@ class OrganisationsTest(utils.TestCase):
         org = self.cs.organisations.update('1', enabled=False)
         self.cs.assert_called('PATCH', '/organisations/1/')
         self.assertFalse(org.enabled)
+
+    def test_organisation_findall_server_filter(self):
+        self.cs.organisations.findall(short_name__iexact='ku')
+        self.cs.assert_called(
+            'GET', '/organisations/', params={'short_name__iexact': 'ku'}
+        )
+
+    def test_organisation_findall_client_filter(self):
+        orgs = self.cs.organisations.findall(full_name__icontains='gundawindi')
+        self.cs.assert_called('GET', '/organisations/', params={})
+        self.assertEqual(['GU'], [o.short_name for o in orgs])
+
+        orgs = self.cs.organisations.findall(id__in=[1, 2], enabled=True)
+        self.assertEqual(['KU', 'GU'], [o.short_name for o in orgs])
+
+        self.assertEqual([], self.cs.organisations.findall(missing=True))
+
+    def test_organisation_find(self):
+        org = self.cs.organisations.find(short_name='GU')
+        self.assertEqual(2, org.id)
+        # The listed organisation is already loaded, so no second GET
+        self.assertEqual(1, len(self.cs.http_client.callstack))
+
+    def test_organisation_find_no_match(self):
+        self.assertRaises(
+            exceptions.NotFound, self.cs.organisations.find, short_name='XX'
+        )
+        self.assertRaises(
+            exceptions.NoUniqueMatch, self.cs.organisations.find, enabled=True
+        )
@@ -76,3 +76,89 @@ class QuotasTest(utils.TestCase):
             },
         )
         self.assertIsInstance(q, quotas.Quota)
+
+    def test_quota_iter_list(self):
+        ql = list(self.cs.quotas.iter_list(allocation=22))
+        self.cs.assert_called(
+            'GET', '/quotas/', params={'group__allocation': 22}
+        )
+        for q in ql:
+            self.assertIsInstance(q, quotas.Quota)
+        self.assertEqual(2, len(ql))
+
+    def test_quota_history(self):
+        allocation = self.cs.allocations.list(parent_request__isnull=True)[0]
+        self.cs.clear_callstack()
+        history = self.cs.quotas.history(allocation, 4)
+        self.cs.assert_called(
+            'GET',
+            '/quotas/',
+            params={'group__allocation__in': '587,596', 'resource': 4},
+        )
+        self.assertEqual(2, len(self.cs.http_client.callstack))
+        self.assertEqual([596, 587], [q.allocation_id for q in history])
+        self.assertEqual(
+            ['2018-07-03T07:35:58Z', '2018-07-03T07:36:48Z'],
+            [q.modified_time for q in history],
+        )
+        self.assertEqual([10, 15], [q.quota for q in history])
+
+    def test_quota_bulk_create(self):
+        progress = []
+        results = self.cs.quotas.bulk_create(
+            {
+                'allocation': 2,
+                'quotas': [
+                    {
+                        'resource': 'volume.gigabytes',
+                        'zone': 'australia',
+                        'quota': 3,
+                    },
+                    {
+                        'resource': 'compute.cores',
+                        'zone': 'australia',
+                        'quota': 1,
+                    },
+                    {'resource': 10, 'zone': 'atlantis', 'quota': 1},
+                ],
+            },
+            concurrency=2,
+            progress=lambda r, done, total: progress.append((done, total)),
+        )
+        self.assertEqual([(1, 3), (2, 3), (3, 3)], progress)
+        self.assertEqual([True, False, False], [r.ok for r in results])
+        self.assertIsInstance(results[0].result, quotas.Quota)
+        self.assertIn('compute.cores', str(results[1].error))
+        self.assertIn('atlantis', str(results[2].error))
+        self.cs.assert_called(
+            'POST',
+            '/quotas/',
+            data={
+                'allocation': 2,
+                'resource': 4,
+                'zone': 'australia',
+                'quota': 3,
+                'requested_quota': 3,
+            },
+        )
+        methods = [call[:2] for call in self.cs.http_client.callstack]
+        self.assertEqual(1, methods.count(('GET', '/resources/')))
+        self.assertEqual(1, methods.count(('GET', '/zones/')))
+        self.assertEqual(1, methods.count(('POST', '/quotas/')))
+
+    def test_quota_bulk_create_tuples(self):
+        results = self.cs.quotas.bulk_create([(2, 4, 'australia', 3, 5)])
+        self.assertTrue(results[0].ok)
+        self.cs.assert_called(
+            'POST',
+            '/quotas/',
+            data={
+                'allocation': 2,
+                'resource': 4,
+                'zone': 'australia',
+                'quota': 3,
+                'requested_quota': 5,
+            },
+        )
+        methods = [call[:2] for call in self.cs.http_client.callstack]
+        self.assertNotIn(('GET', '/resources/'), methods)
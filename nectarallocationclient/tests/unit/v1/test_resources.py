@@ -29,6 +29,13 @@ class ResourcesTest(utils.TestCase):
             self.assertIsInstance(a, resources.Resource)
         self.assertEqual(3, len(al))
 
+    def test_resource_index(self):
+        index = self.cs.resources.index()
+        self.cs.assert_called('GET', '/resources/')
+        self.assertEqual(1, len(self.cs.http_client.callstack))
+        self.assertEqual([4, 7, 10], sorted(index))
+        self.assertEqual('gigabytes', index[4].quota_name)
+
     def test_resource_get(self):
         a = self.cs.resources.get(1)
         self.cs.assert_called('GET', '/resources/1/')
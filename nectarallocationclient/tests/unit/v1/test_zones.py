@@ -11,6 +11,7 @@
 #   under the License.
 #
 
+from nectarallocationclient import cache
 from nectarallocationclient.v1 import zones
 
 from nectarallocationclient.tests.unit import utils
@@ -45,3 +46,51 @@ class ZonesTest(utils.TestCase):
         a = self.cs.zones.update('australia', display_name='Oz')
         self.cs.assert_called('PATCH', '/zones/australia/')
         self.assertEqual('Oz', a.display_name)
+
+    def test_zone_cache(self):
+        self.cs.zones.cache = cache.TTLCache(ttl=60)
+        zl = self.cs.zones.list()
+        self.assertEqual(zl, self.cs.zones.list())
+        z = self.cs.zones.get('australia')
+        self.assertEqual(z, self.cs.zones.get('australia'))
+        self.assertEqual(2, len(self.cs.http_client.callstack))
+
+        # Changing a result does not change what later callers get
+        zl.pop()
+        z.display_name = 'Changed'
+        z._info['display_name'] = 'Changed'
+        self.assertEqual(len(zl) + 1, len(self.cs.zones.list()))
+        self.assertNotEqual(
+            'Changed', self.cs.zones.get('australia').display_name
+        )
+        self.assertEqual(2, len(self.cs.http_client.callstack))
+
+        # Changing a zone drops the cached results
+        self.cs.zones.update('australia', display_name='Oz')
+        self.cs.zones.list()
+        self.cs.assert_called('GET', '/zones/')
+        self.assertEqual(4, len(self.cs.http_client.callstack))
+
+    def test_zone_cache_list_during_update(self):
+        self.cs.zones.cache = cache.TTLCache(ttl=60)
+        patch = self.cs.http_client.patch_zones_australia
+
+        def list_then_patch(**kw):
+            # Another thread listing while the update is in flight
+            self.cs.zones.list()
+            return patch(**kw)
+
+        self.cs.http_client.patch_zones_australia = list_then_patch
+        self.cs.zones.update('australia', display_name='Oz')
+        self.cs.zones.list()
+        self.assertEqual(
+            ['PATCH', 'GET', 'GET'],
+            [call[0] for call in self.cs.http_client.callstack],
+        )
+
+    def test_zone_cache_invalidate(self):
+        self.cs.zones.cache = cache.TTLCache(ttl=60)
+        self.cs.zones.list()
+        self.cs.zones.invalidate()
+        self.cs.zones.list()
+        self.assertEqual(2, len(self.cs.http_client.callstack))
@@ -0,0 +1,695 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Asyncio client for the Nectar Allocations v1 API.
+
+Authentication and endpoint discovery still go through a keystoneauth
+session, but requests are sent with a shared aiohttp session so that
+connections are reused and many calls can be in flight on one event loop.
+aiohttp is an optional dependency, install the ``aio`` extra to use it.
+
+Request bodies are sent as JSON, where the synchronous client form
+encodes them. The API accepts both.
+"""
+
+import asyncio
+import collections
+import contextlib
+
+from oslo_utils import importutils
+import requests
+from requests import structures
+
+import nectarallocationclient
+from nectarallocationclient import base
+from nectarallocationclient import client
+from nectarallocationclient import exceptions
+from nectarallocationclient import jsonutils
+from nectarallocationclient import states
+from nectarallocationclient.v1 import allocations
+from nectarallocationclient.v1 import approvers
+from nectarallocationclient.v1 import ardc_projects
+from nectarallocationclient.v1 import bundles
+from nectarallocationclient.v1 import chiefinvestigators
+from nectarallocationclient.v1 import facilities
+from nectarallocationclient.v1 import grants
+from nectarallocationclient.v1 import organisations
+from nectarallocationclient.v1 import publications
+from nectarallocationclient.v1 import quotas
+from nectarallocationclient.v1 import resources
+from nectarallocationclient.v1 import service_types
+from nectarallocationclient.v1 import sites
+from nectarallocationclient.v1 import zones
+
+aiohttp = importutils.try_import('aiohttp')
+
+# Seconds before a token expires that its auth headers are fetched again
+AUTH_REFRESH_MARGIN = 120
+
+
+def _encode_params(params):
+    """Encode query parameters the same way requests does."""
+    encoded = []
+    for key, value in (params or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            encoded.extend((key, str(v)) for v in value)
+        else:
+            encoded.append((key, str(value)))
+    return encoded
+
+
+class SessionClient:
+    client_name = 'python-nectarallocationclient'
+    client_version = nectarallocationclient.__version__
+
+    # Number of list pages to fetch concurrently, 0 fetches them serially
+    page_prefetch = 0
+    # Default number of items per list page, None uses the server default
+    page_size = None
+    # Callable decoding response bodies
+    json_decoder = staticmethod(jsonutils.loads)
+    # Number of project ID lookups made and the seconds spent on them
+    project_id_lookups = 0
+    project_id_lookup_time = 0.0
+
+    _project_id = None
+    _project_id_auth_ref = None
+    _get_auth_ref = client.SessionClient._get_auth_ref
+    _get_project_id = client.SessionClient._get_project_id
+
+    def __init__(
+        self,
+        session,
+        service_type='allocations',
+        interface=None,
+        region_name=None,
+        endpoint_override=None,
+        connection_limit=100,
+    ):
+        if aiohttp is None:
+            raise exceptions.ClientException(
+                message='aiohttp is required for the asyncio client'
+            )
+        self.session = session
+        self.service_type = service_type
+        self.interface = interface
+        self.region_name = region_name
+        self.endpoint_override = endpoint_override
+        self.connection_limit = connection_limit
+        self._http = None
+        self._endpoint = None
+        self._auth_headers = None
+        self._auth_headers_ref = None
+        self._auth_lock = asyncio.Lock()
+
+    def get_endpoint(self):
+        if self.endpoint_override:
+            return self.endpoint_override
+        return self.session.get_endpoint(
+            service_type=self.service_type,
+            interface=self.interface,
+            region_name=self.region_name,
+        )
+
+    def get_project_id(self):
+        return self.session.get_project_id()
+
+    async def _get_endpoint(self):
+        # Endpoint discovery parses the service catalog, so it is done
+        # once and off the event loop
+        if self._endpoint is None:
+            loop = asyncio.get_running_loop()
+            self._endpoint = await loop.run_in_executor(
+                None, self.get_endpoint
+            )
+        return self._endpoint
+
+    def _auth_headers_valid(self):
+        auth_ref = self._get_auth_ref()
+        return (
+            self._auth_headers is not None
+            and auth_ref is not None
+            and auth_ref is self._auth_headers_ref
+            and not auth_ref.will_expire_soon(AUTH_REFRESH_MARGIN)
+        )
+
+    def _fetch_auth_headers(self):
+        headers = dict(self.session.get_auth_headers() or {})
+        project_id = self._get_project_id()
+        if project_id:
+            headers['X-PROJECT-ID'] = project_id
+        return headers, self._get_auth_ref()
+
+    async def _get_auth_headers(self):
+        """Return the auth and project headers, fetched once per token.
+
+        keystoneauth authenticates synchronously, so the headers are
+        fetched in an executor to keep the event loop running, and only
+        one request fetches them when the token changes.
+        """
+        if not self._auth_headers_valid():
+            async with self._auth_lock:
+                if not self._auth_headers_valid():
+                    loop = asyncio.get_running_loop()
+                    (
+                        self._auth_headers,
+                        self._auth_headers_ref,
+                    ) = await loop.run_in_executor(
+                        None, self._fetch_auth_headers
+                    )
+        return self._auth_headers
+
+    def record_lazy_load(self, resource, attribute):
+        """Refuse to lazy load, which would need the request awaited.
+
+        :raises: LazyLoadError always
+        """
+        raise exceptions.LazyLoadError(
+            f"{type(resource).__name__} has no attribute '{attribute}' "
+            "loaded and the asyncio client cannot lazy load it"
+        )
+
+    def _get_http(self):
+        if self._http is None or self._http.closed:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit)
+            self._http = aiohttp.ClientSession(connector=connector)
+        return self._http
+
+    async def _get_headers(self, extra=None):
+        headers = {
+            'Accept': 'application/json',
+            'User-Agent': f'{self.client_name}/{self.client_version}',
+        }
+        headers.update(await self._get_auth_headers())
+        headers.update(extra or {})
+        return headers
+
+    async def request(self, url, method, **kwargs):
+        raise_exc = kwargs.pop('raise_exc', True)
+        if not url.startswith(('http://', 'https://')):
+            url = (await self._get_endpoint()).rstrip('/') + url
+
+        async with self._get_http().request(
+            method,
+            url,
+            headers=await self._get_headers(kwargs.get('headers')),
+            params=_encode_params(kwargs.get('params')),
+            json=kwargs.get('data'),
+        ) as http_resp:
+            content = await http_resp.read()
+
+        # Hand back a requests Response so request IDs and errors are
+        # handled exactly as they are for the synchronous client
+        resp = requests.Response()
+        resp.status_code = http_resp.status
+        resp.headers = structures.CaseInsensitiveDict(http_resp.headers)
+        resp.url = str(http_resp.url)
+        resp._content = content
+
+        if raise_exc and resp.status_code >= 400:
+            raise exceptions.from_response(resp, url, method)
+        # Deletes don't return a JSON body
+        if resp.status_code == 204:
+            return resp, '{}'
+        return resp, self.json_decoder(resp.content)
+
+    async def get(self, url, **kwargs):
+        return await self.request(url, 'GET', **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request(url, 'POST', **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await self.request(url, 'PUT', **kwargs)
+
+    async def patch(self, url, **kwargs):
+        return await self.request(url, 'PATCH', **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.request(url, 'DELETE', **kwargs)
+
+    async def close(self):
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+
+class Manager(base.Manager):
+    """Asyncio counterpart of :py:class:`base.Manager`.
+
+    Building resources from responses is shared with the synchronous
+    managers, only the methods that make requests are coroutines.
+    """
+
+    async def _iter_pages(self, url, headers=None, params=None, limit=None):
+        if headers is None:
+            headers = {}
+        prefetch = self.api.page_prefetch
+        while url:
+            resp, body = await self.api.get(
+                url, headers=headers, params=params
+            )
+            yield resp, body
+            # The next link already carries the original query string
+            params = None
+            url = body.get('next') if isinstance(body, dict) else None
+            if url and prefetch:
+                page_urls = base._predict_page_urls(body, url, limit)
+                if page_urls:
+                    fetched = 0
+                    async with contextlib.aclosing(
+                        self._prefetch_pages(page_urls, headers, prefetch)
+                    ) as pages:
+                        async for resp, body in pages:
+                            fetched += 1
+                            yield resp, body
+                    if fetched == len(page_urls):
+                        url = body.get('next')
+                    else:
+                        url = None
+                # Only the first page is used to predict the rest
+                prefetch = 0
+
+    async def _prefetch_pages(self, urls, headers, workers):
+        urls = iter(urls)
+        pending = collections.deque()
+
+        def submit():
+            url = next(urls, None)
+            if url is not None:
+                pending.append(
+                    asyncio.ensure_future(self.api.get(url, headers=headers))
+                )
+
+        try:
+            for _ in range(workers):
+                submit()
+            while pending:
+                try:
+                    resp, body = await pending.popleft()
+                except exceptions.NotFound:
+                    return
+                submit()
+                yield resp, body
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _iter(
+        self,
+        url,
+        response_key='results',
+        obj_class=None,
+        headers=None,
+        params=None,
+        limit=None,
+        page_size=None,
+    ):
+        if limit is not None and limit <= 0:
+            return
+        params = self._list_params(params, limit, page_size)
+        count = 0
+        async with contextlib.aclosing(
+            self._iter_pages(url, headers, params, limit)
+        ) as pages:
+            async for resp, body in pages:
+                for item in self._page_items(body, response_key, obj_class):
+                    yield item
+                    count += 1
+                    if count == limit:
+                        return
+
+    async def _list(
+        self,
+        url,
+        response_key='results',
+        obj_class=None,
+        headers=None,
+        params=None,
+        limit=None,
+        page_size=None,
+    ):
+        items = []
+        first_resp = None
+        params = self._list_params(params, limit, page_size)
+        async with contextlib.aclosing(
+            self._iter_pages(url, headers, params, limit)
+        ) as pages:
+            async for resp, body in pages:
+                if first_resp is None:
+                    first_resp = resp
+                items.extend(self._page_items(body, response_key, obj_class))
+                if limit is not None and len(items) >= limit:
+                    del items[limit:]
+                    break
+
+        return base.ListWithMeta(items, first_resp)
+
+    async def _delete(self, url, headers=None):
+        resp, body = await self.api.delete(url, headers=headers or {})
+        return self.convert_into_with_meta(body, resp)
+
+    async def _update(self, url, data, response_key=None, headers=None):
+        resp, body = await self.api.patch(
+            url, data=data, headers=headers or {}
+        )
+        # PATCH requests may not return a body
+        if body:
+            if response_key:
+                body = body[response_key]
+            return self.resource_class(self, body, resp=resp)
+        return base.StrWithMeta(body, resp)
+
+    async def _create(
+        self, url, data=None, response_key=None, return_raw=False, headers=None
+    ):
+        if data:
+            resp, body = await self.api.post(
+                url, data=data, headers=headers or {}
+            )
+        else:
+            resp, body = await self.api.post(url, headers=headers or {})
+        if response_key:
+            body = body[response_key]
+        if return_raw:
+            return self.convert_into_with_meta(body, resp)
+        return self.resource_class(self, body, resp=resp)
+
+    async def _get(
+        self, url, response_key=None, return_raw=False, headers=None
+    ):
+        resp, body = await self.api.get(url, headers=headers or {})
+        if response_key:
+            body = body[response_key]
+        if return_raw:
+            return self.convert_into_with_meta(body, resp)
+        return self.resource_class(self, body, loaded=True, resp=resp)
+
+
+class BasicManager(Manager):
+    async def list(self, limit=None, page_size=None, **kwargs):
+        return await self._list(
+            f'/{self.base_url}/',
+            params=kwargs,
+            limit=limit,
+            page_size=page_size,
+        )
+
+    def iter_list(self, limit=None, page_size=None, **kwargs):
+        return self._iter(
+            f'/{self.base_url}/',
+            params=kwargs,
+            limit=limit,
+            page_size=page_size,
+        )
+
+    async def get(self, resource_id):
+        return await self._get(f'/{self.base_url}/{resource_id}/')
+
+
+class UpdateMixin:
+    async def update(self, resource_id, **kwargs):
+        return await self._update(
+            f'/{self.base_url}/{resource_id}/', data=kwargs
+        )
+
+
+class DeleteMixin:
+    async def delete(self, resource_id):
+        await self._delete(f'/{self.base_url}/{resource_id}/')
+
+
+class AllocationManager(Manager):
+    resource_class = allocations.Allocation
+
+    def __init__(self, api):
+        super().__init__(api)
+        self.quota_manager = QuotaManager(api)
+
+    async def list(self, limit=None, page_size=None, **kwargs):
+        return await self._list(
+            '/allocations/', params=kwargs, limit=limit, page_size=page_size
+        )
+
+    def iter_list(self, limit=None, page_size=None, **kwargs):
+        return self._iter(
+            '/allocations/', params=kwargs, limit=limit, page_size=page_size
+        )
+
+    async def get(self, allocation_id):
+        return await self._get(f'/allocations/{allocation_id}/')
+
+    async def get_current(self, **kwargs):
+        kwargs['parent_request__isnull'] = True
+        allocations = await self.list(**kwargs)
+
+        if len(allocations) == 1:
+            return allocations[0]
+        elif len(allocations) == 0:
+            raise exceptions.AllocationDoesNotExist()
+        else:
+            ids = [x.id for x in allocations]
+            raise ValueError(f"More than one allocation returned: {ids}")
+
+    async def get_last_approved(self, **kwargs):
+        allocations = await self.list(status=states.APPROVED, **kwargs)
+        if allocations:
+            return allocations[0]
+        raise exceptions.AllocationDoesNotExist()
+
+    async def update(self, allocation_id, **kwargs):
+        return await self._update(
+            f'/allocations/{allocation_id}/', data=kwargs
+        )
+
+    async def approve(self, allocation_id):
+        return await self._create(f'/allocations/{allocation_id}/approve/')
+
+    async def delete(self, allocation_id):
+        return await self._create(f'/allocations/{allocation_id}/delete/')
+
+    async def amend(self, allocation_id):
+        return await self._create(f'/allocations/{allocation_id}/amend/')
+
+    async def get_approver_info(self, allocation_id):
+        return await self._get(
+            f'/allocations/{allocation_id}/approver_info/', return_raw=True
+        )
+
+
+class QuotaManager(DeleteMixin, Manager):
+    base_url = quotas.QuotaManager.base_url
+    resource_class = quotas.Quota
+    history_chunk_size = quotas.QuotaManager.history_chunk_size
+
+    _filter_params = quotas.QuotaManager._filter_params
+
+    async def list(self, limit=None, page_size=None, **kwargs):
+        return await self._list(
+            f'/{self.base_url}/',
+            params=self._filter_params(kwargs),
+            limit=limit,
+            page_size=page_size,
+        )
+
+    def iter_list(self, limit=None, page_size=None, **kwargs):
+        return self._iter(
+            f'/{self.base_url}/',
+            params=self._filter_params(kwargs),
+            limit=limit,
+            page_size=page_size,
+        )
+
+    async def get(self, quota_id):
+        return await self._get(f'/{self.base_url}/{quota_id}/')
+
+    async def history(self, allocation, resource):
+        """See :py:meth:`quotas.QuotaManager.history`.
+
+        The ``group__allocation__in`` queries are sent concurrently.
+        """
+        allocations = {allocation.id: allocation}
+        children = await allocation.manager.list(parent_request=allocation.id)
+        for child in children:
+            allocations.setdefault(child.id, child)
+
+        ids = list(allocations)
+        chunks = [
+            ids[i : i + self.history_chunk_size]
+            for i in range(0, len(ids), self.history_chunk_size)
+        ]
+        results = await asyncio.gather(
+            *(
+                self.list(
+                    group__allocation__in=','.join(str(x) for x in chunk),
+                    resource=base.getid(resource),
+                )
+                for chunk in chunks
+            )
+        )
+        history = {}
+        for quota in (q for result in results for q in result):
+            parent = allocations.get(quota.allocation)
+            if parent is None or parent.id in history:
+                continue
+            quota.allocation_id = parent.id
+            quota.modified_time = parent.modified_time
+            history[parent.id] = quota
+        return sorted(history.values(), key=lambda q: q.modified_time)
+
+    async def create(
+        self, allocation, resource, zone, quota, requested_quota=None
+    ):
+        if isinstance(zone, zones.Zone):
+            zone = zone.name
+        data = {
+            'allocation': base.getid(allocation),
+            'resource': base.getid(resource),
+            'zone': zone,
+            'quota': quota,
+            'requested_quota': (
+                quota if requested_quota is None else requested_quota
+            ),
+        }
+        return await self._create(f'/{self.base_url}/', data=data)
+
+
+class ApproverManager(UpdateMixin, BasicManager):
+    base_url = approvers.ApproverManager.base_url
+    resource_class = approvers.Approver
+
+
+class ARDCProjectManager(UpdateMixin, BasicManager):
+    base_url = ardc_projects.ARDCProjectManager.base_url
+    resource_class = ardc_projects.ARDCProject
+
+
+class BundleManager(UpdateMixin, BasicManager):
+    base_url = bundles.BundleManager.base_url
+    resource_class = bundles.Bundle
+
+
+class ChiefInvestigatorManager(UpdateMixin, DeleteMixin, BasicManager):
+    base_url = chiefinvestigators.ChiefInvestigatorManager.base_url
+    resource_class = chiefinvestigators.ChiefInvestigator
+
+
+class FacilityManager(UpdateMixin, BasicManager):
+    base_url = facilities.FacilityManager.base_url
+    resource_class = facilities.Facility
+
+
+class GrantManager(DeleteMixin, BasicManager):
+    base_url = grants.GrantManager.base_url
+    resource_class = grants.Grant
+
+
+class OrganisationManager(UpdateMixin, BasicManager):
+    base_url = organisations.OrganisationManager.base_url
+    resource_class = organisations.Organisation
+
+
+class PublicationManager(DeleteMixin, BasicManager):
+    base_url = publications.PublicationManager.base_url
+    resource_class = publications.Publication
+
+
+class ResourceManager(UpdateMixin, BasicManager):
+    base_url = resources.ResourceManager.base_url
+    resource_class = resources.Resource
+
+    async def index(self, **kwargs):
+        """Return a dict of resources keyed by ID from a single listing."""
+        return {r.id: r for r in await self.list(**kwargs)}
+
+
+class ServiceTypeManager(UpdateMixin, BasicManager):
+    base_url = service_types.ServiceTypeManager.base_url
+    resource_class = service_types.ServiceType
+
+    def __init__(self, api):
+        super().__init__(api)
+        self.resource_manager = ResourceManager(api)
+
+
+class SiteManager(UpdateMixin, BasicManager):
+    base_url = sites.SiteManager.base_url
+    resource_class = sites.Site
+
+
+class ZoneManager(UpdateMixin, BasicManager):
+    base_url = zones.ZoneManager.base_url
+    resource_class = zones.Zone
+
+    async def compute_homes(self):
+        return await self._get(
+            f'/{self.base_url}/compute_homes/', return_raw=True
+        )
+
+
+class Client:
+    """Asyncio client for the Nectar Allocations v1 API
+
+    Use it as an async context manager, or call :py:meth:`close`, so the
+    underlying connections are released.
+
+    :param session: keystoneauth session used for authentication
+    :type session: :py:class:`keystoneauth1.session.Session`
+    :param int page_prefetch: number of list pages to fetch concurrently
+    :param int page_size: number of items to request per list page
+    :param int connection_limit: maximum number of open connections
+    """
+
+    def __init__(
+        self,
+        session=None,
+        service_type='allocations',
+        page_prefetch=0,
+        page_size=None,
+        **kwargs,
+    ):
+        """Initialize a new asyncio client for the Allocations v1 API."""
+        if session is None:
+            raise exceptions.ClientException(
+                message='Session is required argument'
+            )
+        self.http_client = SessionClient(
+            session, service_type=service_type, **kwargs
+        )
+        self.http_client.page_prefetch = page_prefetch
+        self.http_client.page_size = page_size
+        self.allocations = AllocationManager(self.http_client)
+        self.approvers = ApproverManager(self.http_client)
+        self.ardc_projects = ARDCProjectManager(self.http_client)
+        self.bundles = BundleManager(self.http_client)
+        self.chiefinvestigators = ChiefInvestigatorManager(self.http_client)
+        self.facilities = FacilityManager(self.http_client)
+        self.grants = GrantManager(self.http_client)
+        self.organisations = OrganisationManager(self.http_client)
+        self.publications = PublicationManager(self.http_client)
+        self.quotas = QuotaManager(self.http_client)
+        self.resources = ResourceManager(self.http_client)
+        self.service_types = ServiceTypeManager(self.http_client)
+        self.sites = SiteManager(self.http_client)
+        self.zones = ZoneManager(self.http_client)
+
+    async def close(self):
+        await self.http_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
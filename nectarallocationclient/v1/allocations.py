@@ -28,8 +28,12 @@ class Allocation(base.Resource):
         raw_quotas = self.quotas
         self.quotas = []
         self._quota_cache = None
+        # Quotas lazy load from their own endpoint, not the allocation's
+        quota_manager = getattr(manager, 'quota_manager', manager)
         for quota in raw_quotas:
-            self.quotas.append(quotas.Quota(manager, quota))
+            quota = quotas.Quota(quota_manager, quota)
+            quota.allocation_id = info.get('id')
+            self.quotas.append(quota)
 
     def __repr__(self):
         return f"<Allocation {self.id} ({self.project_name})>"
@@ -51,40 +55,38 @@ class Allocation(base.Resource):
     def get_approver_info(self):
         return self.manager.get_approver_info(self.id)
 
-    def get_quota(self, service_type):
+    def _get_quota_items(self, service_type):
+        """Return (resource name, quota) pairs for a service type.
+
+        Each resource string is only split once per allocation.
+        """
         if self._quota_cache is None:
             service_types = {}
             for quota in self.quotas:
-                st, resource = quota.resource.split('.')
-                if st in service_types:
-                    service_types[st].append(quota)
-                else:
-                    service_types[st] = [quota]
+                st, _, resource = quota.resource.partition('.')
+                service_types.setdefault(st, []).append((resource, quota))
             self._quota_cache = service_types
+        return self._quota_cache.get(service_type, [])
 
-        try:
-            return self._quota_cache[service_type]
-        except KeyError:
-            return []
+    def get_quota(self, service_type):
+        return [quota for _, quota in self._get_quota_items(service_type)]
 
     def get_allocated_cloudkitty_quota(self):
-        quotas = self.get_quota('rating')
+        quotas = self._get_quota_items('rating')
         if not quotas:
             return {}
         kwargs = {}
-        for quota in quotas:
-            quota_resource = quota.resource.split('.')[1]
+        for quota_resource, quota in quotas:
             kwargs[quota_resource] = quota.quota
 
         return kwargs
 
     def get_allocated_nova_quota(self):
-        quotas = self.get_quota('compute')
+        quotas = self._get_quota_items('compute')
         if not quotas:
             return {}
         kwargs = {}
-        for quota in quotas:
-            quota_resource = quota.resource.split('.')[1]
+        for quota_resource, quota in quotas:
             kwargs[quota_resource] = quota.quota
         if not kwargs.get('cores') or not kwargs.get('instances'):
             return {}
@@ -123,12 +125,11 @@ class Allocation(base.Resource):
         return {'object': gigabytes}
 
     def get_allocated_trove_quota(self):
-        quotas = self.get_quota('database')
+        quotas = self._get_quota_items('database')
         if not quotas:
             return {}
         kwargs = {}
-        for quota in quotas:
-            quota_resource = quota.resource.split('.')[1]
+        for quota_resource, quota in quotas:
             kwargs[quota_resource] = quota.quota
 
         if 'ram' not in kwargs or int(kwargs['ram']) == 0:
@@ -146,20 +147,18 @@ class Allocation(base.Resource):
             'snapshot_gigabytes': 0,
         }
 
-        quotas = self.get_quota('share')
-        for quota in quotas:
-            quota_resource = quota.resource.split('.')[1]
+        quotas = self._get_quota_items('share')
+        for quota_resource, quota in quotas:
             kwargs[f"{quota_resource}_{quota.zone}"] = quota.quota
             kwargs[quota_resource] += quota.quota
         return kwargs
 
     def get_allocated_neutron_quota(self):
-        quotas = self.get_quota('network')
+        quotas = self._get_quota_items('network')
         if not quotas:
             return {}
         kwargs = {}
-        for quota in quotas:
-            quota_resource = quota.resource.split('.')[1]
+        for quota_resource, quota in quotas:
             kwargs[quota_resource] = quota.quota
         if 'network' in kwargs:
             kwargs['subnet'] = kwargs['network']
@@ -168,44 +167,130 @@ class Allocation(base.Resource):
 
     def get_allocated_octavia_quota(self):
         # Get LB quota from network group for now
-        quotas = self.get_quota('network')
+        quotas = self._get_quota_items('network')
         if not quotas:
             return {}
         kwargs = {}
-        for quota in quotas:
-            quota_resource = quota.resource.split('.')[1]
+        for quota_resource, quota in quotas:
             if quota_resource == 'loadbalancer':
                 kwargs['load_balancers'] = quota.quota
         return kwargs
 
     def get_allocated_magnum_quota(self):
-        quotas = self.get_quota('container-infra')
+        quotas = self._get_quota_items('container-infra')
         if not quotas:
             return {}
         kwargs = {}
-        for quota in quotas:
-            quota_resource = quota.resource.split('.')[1]
+        for quota_resource, quota in quotas:
             kwargs[quota_resource] = quota.quota
         return kwargs
 
     def get_allocated_warre_quota(self):
-        quotas = self.get_quota('nectar-reservation')
+        quotas = self._get_quota_items('nectar-reservation')
         if not quotas:
             return {}
         kwargs = {}
-        for quota in quotas:
-            quota_resource = quota.resource.split('.')[1]
+        for quota_resource, quota in quotas:
             if quota_resource == 'days':
                 kwargs['hours'] = quota.quota * 24
             kwargs[quota_resource] = quota.quota
         return kwargs
 
 
+# Quota translation for each service, keyed by the service name
+QUOTA_HELPERS = {
+    'nova': Allocation.get_allocated_nova_quota,
+    'cinder': Allocation.get_allocated_cinder_quota,
+    'swift': Allocation.get_allocated_swift_quota,
+    'trove': Allocation.get_allocated_trove_quota,
+    'manila': Allocation.get_allocated_manila_quota,
+    'neutron': Allocation.get_allocated_neutron_quota,
+    'octavia': Allocation.get_allocated_octavia_quota,
+    'magnum': Allocation.get_allocated_magnum_quota,
+    'warre': Allocation.get_allocated_warre_quota,
+    'cloudkitty': Allocation.get_allocated_cloudkitty_quota,
+}
+
+
+def get_allocated_quotas(
+    allocations, services=None, columnar=False, errors=None
+):
+    """Translate the quotas of many allocations in one pass.
+
+    :param allocations: iterable of Allocation objects
+    :param services: service names to translate, defaults to all of
+        :py:data:`QUOTA_HELPERS`
+    :param bool columnar: return one list per service instead of one
+        dict per allocation
+    :param dict errors: if given, an allocation whose quotas fail to
+        translate is left out and its exception is added to ``errors``
+        under its ID, instead of the exception being raised
+    :returns: ``{allocation_id: {service: quota}}``, or when columnar
+        ``{'id': [allocation_id, ...], service: [quota, ...]}`` with the
+        lists in the order of ``allocations``
+    """
+    if services is None:
+        services = list(QUOTA_HELPERS)
+    helpers = [(service, QUOTA_HELPERS[service]) for service in services]
+
+    def translate(allocation):
+        try:
+            return {service: helper(allocation) for service, helper in helpers}
+        except Exception as e:
+            if errors is None:
+                raise
+            LOG.warning(
+                "Failed to translate quotas of allocation %s: %s",
+                allocation.id,
+                e,
+            )
+            errors[allocation.id] = e
+            return None
+
+    if columnar:
+        columns = {'id': []}
+        columns.update((service, []) for service in services)
+        for allocation in allocations:
+            translated = translate(allocation)
+            if translated is None:
+                continue
+            columns['id'].append(allocation.id)
+            for service in services:
+                columns[service].append(translated[service])
+        return columns
+
+    result = {}
+    for allocation in allocations:
+        translated = translate(allocation)
+        if translated is not None:
+            result[allocation.id] = translated
+    return result
+
+
 class AllocationManager(base.Manager):
     resource_class = Allocation
 
-    def list(self, **kwargs):
-        return self._list('/allocations/', params=kwargs)
+    def __init__(self, api):
+        super().__init__(api)
+        self.quota_manager = quotas.QuotaManager(api)
+
+    def list(self, limit=None, page_size=None, compact=False, **kwargs):
+        return self._list(
+            '/allocations/',
+            params=kwargs,
+            limit=limit,
+            page_size=page_size,
+            compact=compact,
+        )
+
+    def iter_list(self, limit=None, page_size=None, compact=False, **kwargs):
+        return self._iter(
+            '/allocations/',
+            params=kwargs,
+            limit=limit,
+            page_size=page_size,
+            compact=compact,
+        )
 
     def get(self, allocation_id):
         return self._get(f'/allocations/{allocation_id}/')
@@ -302,6 +387,33 @@ class AllocationManager(base.Manager):
     def amend(self, allocation_id):
         return self._create(f'/allocations/{allocation_id}/amend/')
 
+    def bulk_approve(self, allocations, concurrency=1):
+        """Approve many allocations, ``concurrency`` requests at a time.
+
+        :returns: list of :py:class:`nectarallocationclient.base.BulkResult`
+        """
+        return self._bulk(
+            lambda a: self.approve(base.getid(a)), allocations, concurrency
+        )
+
+    def bulk_delete(self, allocations, concurrency=1):
+        """Delete many allocations, ``concurrency`` requests at a time.
+
+        :returns: list of :py:class:`nectarallocationclient.base.BulkResult`
+        """
+        return self._bulk(
+            lambda a: self.delete(base.getid(a)), allocations, concurrency
+        )
+
+    def bulk_amend(self, allocations, concurrency=1):
+        """Amend many allocations, ``concurrency`` requests at a time.
+
+        :returns: list of :py:class:`nectarallocationclient.base.BulkResult`
+        """
+        return self._bulk(
+            lambda a: self.amend(base.getid(a)), allocations, concurrency
+        )
+
     def get_approver_info(self, allocation_id):
         return self._get(
             f'/allocations/{allocation_id}/approver_info/', return_raw=True
@@ -21,6 +21,7 @@ class ARDCProject(base.Resource):
 class ARDCProjectManager(base.BasicManager):
     base_url = 'ardc-projects'
     resource_class = ARDCProject
+    filter_fields = ('enabled',)
 
     def create(
         self,
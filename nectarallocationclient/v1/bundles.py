@@ -24,12 +24,14 @@ class Bundle(base.Resource):
         raw_quotas = self.quotas
         self.quotas = []
         for quota in raw_quotas:
-            self.quotas.append(BundleQuota(manager, quota))
+            # Bundle quotas have no endpoint of their own to load from
+            self.quotas.append(BundleQuota(manager, quota, loaded=True))
 
 
 class BundleManager(base.BasicManager):
     base_url = 'bundles'
     resource_class = Bundle
+    cacheable = True
 
     def create(self, name, description, zone, order, su_per_year):
         data = {
@@ -21,6 +21,7 @@ class ChiefInvestigator(base.Resource):
 class ChiefInvestigatorManager(base.BasicManager):
     base_url = 'chiefinvestigators'
     resource_class = ChiefInvestigator
+    filter_fields = ('allocation',)
 
     def delete(self, resource_id):
         self._delete(f'/{self.base_url}/{resource_id}/')
@@ -11,31 +11,80 @@
 #   under the License.
 #
 
+import importlib
+
+from nectarallocationclient import cache
 from nectarallocationclient import client
 from nectarallocationclient import exceptions
-from nectarallocationclient.v1 import allocations
-from nectarallocationclient.v1 import approvers
-from nectarallocationclient.v1 import ardc_projects
-from nectarallocationclient.v1 import bundles
-from nectarallocationclient.v1 import chiefinvestigators
-from nectarallocationclient.v1 import facilities
-from nectarallocationclient.v1 import grants
-from nectarallocationclient.v1 import organisations
-from nectarallocationclient.v1 import publications
-from nectarallocationclient.v1 import quotas
-from nectarallocationclient.v1 import resources
-from nectarallocationclient.v1 import service_types
-from nectarallocationclient.v1 import sites
-from nectarallocationclient.v1 import zones
+from nectarallocationclient import jsonutils
+
+
+# Managers of the client, created and their modules imported on first use
+MANAGERS = {
+    'allocations': ('allocations', 'AllocationManager'),
+    'approvers': ('approvers', 'ApproverManager'),
+    'ardc_projects': ('ardc_projects', 'ARDCProjectManager'),
+    'bundles': ('bundles', 'BundleManager'),
+    'chiefinvestigators': ('chiefinvestigators', 'ChiefInvestigatorManager'),
+    'facilities': ('facilities', 'FacilityManager'),
+    'grants': ('grants', 'GrantManager'),
+    'organisations': ('organisations', 'OrganisationManager'),
+    'publications': ('publications', 'PublicationManager'),
+    'quotas': ('quotas', 'QuotaManager'),
+    'resources': ('resources', 'ResourceManager'),
+    'service_types': ('service_types', 'ServiceTypeManager'),
+    'sites': ('sites', 'SiteManager'),
+    'zones': ('zones', 'ZoneManager'),
+}
 
 
 class Client:
     """Client for the Nectar Allocations v1 API
+
+    The managers listed in :py:data:`MANAGERS` are created on first use.
+
     :param string session: session
     :type session: :py:class:`keystoneauth.adapter.Adapter`
+    :param int page_prefetch: number of list pages to fetch concurrently
+    :param int page_size: number of items to request per list page
+    :param float cache_ttl: seconds to cache reference data such as zones
+                            and resources for, None disables caching.
+                            Every caller gets its own copy of a cached
+                            result.
+    :param int cache_size: maximum number of cached results per manager
+    :param bool conditional_get: revalidate repeated GETs with ETag and
+                                 Last-Modified, serving 304 responses from
+                                 a local store of cache_size responses
+    :param json_decoder: name of the JSON decoder to use for responses, or
+                         a callable decoding bytes, defaults to the
+                         fastest one installed
+    :param retry_policy: RetryPolicy for rate limited and failed requests,
+                         None does not retry
+    :param collectors: list of metrics.Collector objects told about every
+                       request and listing
+    :param disk_cache: diskcache.DiskCache keeping reference data between
+                       processes, None does not cache on disk
+    :param strict_lazy_load: raise LazyLoadError when reading an attribute
+                             would fetch a resource again, to find N+1
+                             request patterns
     """
 
-    def __init__(self, session=None, service_type='allocations', **kwargs):
+    def __init__(
+        self,
+        session=None,
+        service_type='allocations',
+        page_prefetch=0,
+        page_size=None,
+        cache_ttl=None,
+        cache_size=128,
+        conditional_get=False,
+        json_decoder=None,
+        retry_policy=None,
+        collectors=None,
+        disk_cache=None,
+        strict_lazy_load=False,
+        **kwargs,
+    ):
         """Initialize a new client for the Nectar Allocations v1 API."""
         if session is None:
             raise exceptions.ClientException(
@@ -44,21 +93,40 @@ class Client:
         self.http_client = client.SessionClient(
             session, service_type=service_type, **kwargs
         )
-        self.allocations = allocations.AllocationManager(self.http_client)
-        self.approvers = approvers.ApproverManager(self.http_client)
-        self.ardc_projects = ardc_projects.ARDCProjectManager(self.http_client)
-        self.bundles = bundles.BundleManager(self.http_client)
-        self.chiefinvestigators = chiefinvestigators.ChiefInvestigatorManager(
-            self.http_client
-        )
-        self.facilities = facilities.FacilityManager(self.http_client)
-        self.grants = grants.GrantManager(self.http_client)
-        self.organisations = organisations.OrganisationManager(
-            self.http_client
-        )
-        self.publications = publications.PublicationManager(self.http_client)
-        self.quotas = quotas.QuotaManager(self.http_client)
-        self.resources = resources.ResourceManager(self.http_client)
-        self.service_types = service_types.ServiceTypeManager(self.http_client)
-        self.sites = sites.SiteManager(self.http_client)
-        self.zones = zones.ZoneManager(self.http_client)
+        self.http_client.page_prefetch = page_prefetch
+        self.http_client.page_size = page_size
+        self.http_client.retry_policy = retry_policy
+        self.http_client.disk_cache = disk_cache
+        self.http_client.strict_lazy_load = strict_lazy_load
+        if collectors:
+            self.http_client.collectors = list(collectors)
+        if json_decoder is not None:
+            if not callable(json_decoder):
+                json_decoder = jsonutils.get_decoder(json_decoder)
+            self.http_client.json_decoder = json_decoder
+        if conditional_get:
+            self.http_client.response_store = cache.TTLCache(
+                maxsize=cache_size
+            )
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
+
+    def __getattr__(self, name):
+        try:
+            module, class_name = MANAGERS[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        module = importlib.import_module(f'nectarallocationclient.v1.{module}')
+        manager = getattr(module, class_name)(self.http_client)
+        cache_ttl = self.__dict__.get('_cache_ttl')
+        if cache_ttl is not None and getattr(manager, 'cacheable', False):
+            manager.cache = cache.TTLCache(
+                maxsize=self._cache_size, ttl=cache_ttl
+            )
+        setattr(self, name, manager)
+        return manager
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(MANAGERS))
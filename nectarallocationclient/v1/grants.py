@@ -21,6 +21,7 @@ class Grant(base.Resource):
 class GrantManager(base.BasicManager):
     base_url = 'grants'
     resource_class = Grant
+    filter_fields = ('allocation',)
 
     def delete(self, resource_id):
         self._delete(f'/{self.base_url}/{resource_id}/')
@@ -21,6 +21,11 @@ class Organisation(base.Resource):
 class OrganisationManager(base.BasicManager):
     base_url = 'organisations'
     resource_class = Organisation
+    filter_fields = (
+        'ror_id__iexact',
+        'full_name__iexact',
+        'short_name__iexact',
+    )
 
     def create(
         self,
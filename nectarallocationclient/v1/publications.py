@@ -21,6 +21,7 @@ class Publication(base.Resource):
 class PublicationManager(base.BasicManager):
     base_url = 'publications'
     resource_class = Publication
+    filter_fields = ('allocation',)
 
     def delete(self, resource_id):
         self._delete(f'/{self.base_url}/{resource_id}/')
@@ -12,9 +12,14 @@
 #
 
 from nectarallocationclient import base
+from nectarallocationclient.v1 import resources
 from nectarallocationclient.v1 import zones
 
 
+# Positional order of the fields of a quota given to bulk_create()
+QUOTA_FIELDS = ('allocation', 'resource', 'zone', 'quota', 'requested_quota')
+
+
 class Quota(base.Resource):
     pass
 
@@ -23,7 +28,10 @@ class QuotaManager(base.Manager):
     base_url = 'quotas'
     resource_class = Quota
 
-    def list(self, **kwargs):
+    # Maximum number of allocation IDs to filter on in a single request
+    history_chunk_size = 50
+
+    def _filter_params(self, kwargs):
         allocation = kwargs.pop('allocation', None)
         if allocation:
             kwargs['group__allocation'] = base.getid(allocation)
@@ -33,8 +41,79 @@ class QuotaManager(base.Manager):
         service_type = kwargs.pop('service_type', None)
         if service_type:
             kwargs['group__service_type'] = service_type
+        return kwargs
+
+    def _load_filters(self, resources):
+        # Quotas are found through their allocations, which quotas nested
+        # in an allocation only know as allocation_id
+        allocations = set()
+        for resource in resources:
+            allocation = resource._info.get('allocation')
+            if allocation is None:
+                allocation = resource.__dict__.get('allocation_id')
+            if allocation is None:
+                return [{}]
+            allocations.add(str(base.getid(allocation)))
+        ids = sorted(allocations)
+        return [
+            {
+                'group__allocation__in': ','.join(
+                    ids[i : i + self.history_chunk_size]
+                )
+            }
+            for i in range(0, len(ids), self.history_chunk_size)
+        ]
+
+    def list(self, limit=None, page_size=None, compact=False, **kwargs):
+        return self._list(
+            f'/{self.base_url}/',
+            params=self._filter_params(kwargs),
+            limit=limit,
+            page_size=page_size,
+            compact=compact,
+        )
+
+    def iter_list(self, limit=None, page_size=None, compact=False, **kwargs):
+        return self._iter(
+            f'/{self.base_url}/',
+            params=self._filter_params(kwargs),
+            limit=limit,
+            page_size=page_size,
+            compact=compact,
+        )
+
+    def history(self, allocation, resource):
+        """Return the quota for a resource across an allocation's history.
+
+        The quotas of the allocation and all of its previous requests are
+        fetched with ``group__allocation__in`` queries rather than one
+        request per allocation. One quota is returned per allocation that
+        has one, oldest first, annotated with the ``allocation_id`` and
+        ``modified_time`` of its allocation.
+
+        :param allocation: the current Allocation
+        :param resource: Resource or resource ID
+        """
+        allocations = {allocation.id: allocation}
+        for child in allocation.manager.list(parent_request=allocation.id):
+            allocations.setdefault(child.id, child)
 
-        return self._list(f'/{self.base_url}/', params=kwargs)
+        ids = list(allocations)
+        history = {}
+        for i in range(0, len(ids), self.history_chunk_size):
+            chunk = ids[i : i + self.history_chunk_size]
+            quotas = self.list(
+                group__allocation__in=','.join(str(x) for x in chunk),
+                resource=base.getid(resource),
+            )
+            for quota in quotas:
+                parent = allocations.get(quota.allocation)
+                if parent is None or parent.id in history:
+                    continue
+                quota.allocation_id = parent.id
+                quota.modified_time = parent.modified_time
+                history[parent.id] = quota
+        return sorted(history.values(), key=lambda q: q.modified_time)
 
     def get(self, quota_id):
         return self._get(f'/{self.base_url}/{quota_id}/')
@@ -55,3 +134,58 @@ class QuotaManager(base.Manager):
             ),
         }
         return self._create(f'/{self.base_url}/', data=data)
+
+    def bulk_create(self, quotas, concurrency=1, progress=None):
+        """Create many quotas, ``concurrency`` requests at a time.
+
+        Each quota is a dict, or a sequence in :py:data:`QUOTA_FIELDS`
+        order, of the arguments to :py:meth:`create`. A manifest dict of
+        the form ``{"allocation": 1, "quotas": [...]}`` supplies the
+        allocation of quotas that do not give one.
+
+        Resources may be given by ID or as ``<service_type>.<quota_name>``
+        and zones by name. Both are looked up once for all of the quotas,
+        so unknown ones fail without a request being sent.
+
+        :param progress: callable taking each BulkResult, the number of
+                         quotas done and the total
+        :returns: list of :py:class:`nectarallocationclient.base.BulkResult`
+        """
+        if isinstance(quotas, dict):
+            allocation = quotas.get('allocation')
+            quotas = [
+                dict({'allocation': allocation}, **q)
+                for q in quotas.get('quotas', [])
+            ]
+        quotas = [
+            dict(q) if isinstance(q, dict) else dict(zip(QUOTA_FIELDS, q))
+            for q in quotas
+        ]
+
+        def is_name(resource):
+            return isinstance(resource, str) and not resource.isdigit()
+
+        resource_ids = {}
+        if any(is_name(q.get('resource')) for q in quotas):
+            resource_ids = {
+                f'{r.service_type}.{r.quota_name}': r.id
+                for r in resources.ResourceManager(self.api).list()
+            }
+        zone_names = {z.name for z in zones.ZoneManager(self.api).list()}
+
+        def create(kwargs):
+            kwargs = dict(kwargs)
+            resource = kwargs.get('resource')
+            if is_name(resource):
+                try:
+                    kwargs['resource'] = resource_ids[resource]
+                except KeyError:
+                    raise ValueError(f"Unknown resource {resource}")
+            zone = kwargs.get('zone')
+            if isinstance(zone, zones.Zone):
+                zone = zone.name
+            if zone not in zone_names:
+                raise ValueError(f"Unknown zone {zone}")
+            return self.create(**kwargs)
+
+        return self._bulk(create, quotas, concurrency, progress)
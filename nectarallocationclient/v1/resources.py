@@ -21,6 +21,11 @@ class Resource(base.Resource):
 class ResourceManager(base.BasicManager):
     base_url = 'resources'
     resource_class = Resource
+    cacheable = True
+
+    def index(self, **kwargs):
+        """Return a dict of resources keyed by ID from a single listing."""
+        return {r.id: r for r in self.list(**kwargs)}
 
     def create(
         self,
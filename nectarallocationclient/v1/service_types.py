@@ -19,8 +19,11 @@ class ServiceType(base.Resource):
     def __init__(self, manager, info, loaded=False, resp=None):
         super().__init__(manager, info, loaded, resp)
         self.resources = []
+        resource_manager = getattr(manager, 'resource_manager', manager)
         for resource in self.resource_set:
-            self.resources.append(resources.Resource(manager, resource))
+            self.resources.append(
+                resources.Resource(resource_manager, resource)
+            )
         del self.resource_set
 
     def __repr__(self):
@@ -30,6 +33,11 @@ class ServiceType(base.Resource):
 class ServiceTypeManager(base.BasicManager):
     base_url = 'service-types'
     resource_class = ServiceType
+    cacheable = True
+
+    def __init__(self, api):
+        super().__init__(api)
+        self.resource_manager = resources.ResourceManager(api)
 
     def create(
         self,
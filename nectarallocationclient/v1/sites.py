@@ -21,6 +21,7 @@ class Site(base.Resource):
 class SiteManager(base.BasicManager):
     base_url = 'sites'
     resource_class = Site
+    cacheable = True
 
     def create(self, name, display_name, enabled=True):
         data = {
@@ -21,6 +21,7 @@ class Zone(base.Resource):
 class ZoneManager(base.BasicManager):
     base_url = 'zones'
     resource_class = Zone
+    cacheable = True
 
     def compute_homes(self):
         return self._get(f'/{self.base_url}/compute_homes/', return_raw=True)